@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for Focus Tool
+ - Drives the headless FocusCore: add/complete/delete/save/load ops per second
+ - Optionally measures Tk render cost (needs a display, e.g. run under xvfb-run)
+ - Can compare against a saved baseline and fail on regressions (for CI)
+
+Examples:
+    python benchmark_focus_tool.py --sizes 1000 100000
+    xvfb-run -a python benchmark_focus_tool.py --render --json bench.json
+    python benchmark_focus_tool.py --baseline bench.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import focus_tool
+
+
+def make_store(kind):
+    if kind == 'journal':
+        return focus_tool.JournalTaskStore()
+    return focus_tool.SQLiteTaskStore()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def rate(count, seconds):
+    return count / seconds if seconds > 0 else float('inf')
+
+
+def bench_core(size, store_kind, sample):
+    """ops/sec for each core operation with `size` tasks in play"""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        previous_dir = os.getcwd()
+        os.chdir(workdir)
+        try:
+            core = focus_tool.FocusCore(store=make_store(store_kind), config={})
+
+            def add_all():
+                for i in range(size):
+                    core.add_task(f"Benchmark task {i}")
+            results['add'] = rate(size, timed(add_all))
+            results['save'] = rate(size, timed(lambda: core.persistence.flush(wait=True)))
+
+            # Leave at least half the tasks behind so load is measured too
+            picks = random.Random(size).sample(range(size), min(sample, max(1, size // 2)))
+
+            def complete_some():
+                for index in picks:
+                    core.toggle_completed(core.tasks[index].id, hint=index)
+            results['complete'] = rate(len(picks), timed(complete_some))
+
+            def delete_some():
+                for index in sorted(picks, reverse=True):
+                    core.delete_task(core.tasks[index].id, hint=index)
+            results['delete'] = rate(len(picks), timed(delete_some))
+            core.close()
+
+            loader = focus_tool.FocusCore(store=make_store(store_kind), config={})
+            load_seconds = timed(loader.load_tasks)
+            results['load'] = rate(len(loader.tasks), load_seconds)
+            loader.close()
+        finally:
+            os.chdir(previous_dir)
+    return results
+
+
+def bench_render(size, sample):
+    """Milliseconds per UI operation with `size` tasks, measured through Tk"""
+    import tkinter as tk
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        previous_dir = os.getcwd()
+        os.chdir(workdir)
+        root = None
+        try:
+            root = tk.Tk()
+            app = focus_tool.FocusTool(root, lazy_ui=False)
+            root.update()
+            core = app.core
+            core.tasks.extend(focus_tool.Task(f"Render task {i}", id=core.store.allocate_id())
+                              for i in range(size))
+
+            def settle(fn):
+                def run():
+                    fn()
+                    app.frames.flush()
+                    root.update_idletasks()
+                return run
+
+            results['reset_ms'] = timed(settle(lambda: core.emit('tasks_reset', tasks=core.tasks))) * 1000
+            results['add_ms'] = timed(settle(lambda: [core.add_task(f"New {i}") for i in range(sample)])) * 1000 / sample
+            picks = random.Random(size).sample(range(len(core.tasks)), min(sample, len(core.tasks)))
+            results['complete_ms'] = timed(settle(lambda: [core.toggle_completed(core.tasks[i].id, hint=i)
+                                                           for i in picks])) * 1000 / len(picks)
+            results['scroll_ms'] = timed(settle(lambda: [app.task_view.scroll(1) for _ in range(sample)])) * 1000 / sample
+            results['delete_ms'] = timed(settle(lambda: [core.delete_task(core.tasks[i].id, hint=i)
+                                                         for i in sorted(picks, reverse=True)])) * 1000 / len(picks)
+
+            def resize_cycle():
+                for width, height in ((800, 1000), (1600, 1200), (450, 700)):
+                    app.background.resize(width, height)
+            results['background_resize_ms'] = timed(settle(resize_cycle)) * 1000 / 3
+            core.persistence.flush(wait=True)
+        finally:
+            if root is not None:
+                root.destroy()
+            os.chdir(previous_dir)
+    return results
+
+
+def print_table(title, results, unit):
+    print(f"\n{title}")
+    for size, metrics in results.items():
+        row = "  ".join(f"{name}={value:,.1f}" for name, value in metrics.items())
+        print(f"  {size:>9,} tasks  {row}  ({unit})")
+
+
+def find_regressions(results, baseline, tolerance):
+    """Compare against a baseline: ops/sec must not drop, ms must not grow"""
+    failures = []
+    for section, higher_is_better in (('core', True), ('render', False)):
+        for size, metrics in results.get(section, {}).items():
+            base_metrics = baseline.get(section, {}).get(str(size), {})
+            for name, value in metrics.items():
+                base = base_metrics.get(name)
+                if base is None:
+                    continue
+                if higher_is_better and value < base * (1 - tolerance):
+                    failures.append(f"{section} {name} @ {size}: {value:,.1f} < baseline {base:,.1f}")
+                if not higher_is_better and value > base * (1 + tolerance):
+                    failures.append(f"{section} {name} @ {size}: {value:,.2f} > baseline {base:,.2f}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Focus Tool throughput benchmarks")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--store', choices=['sqlite', 'journal'], default='sqlite')
+    parser.add_argument('--sample', type=int, default=1000,
+                        help='operations timed for complete/delete and render diffs')
+    parser.add_argument('--render', action='store_true',
+                        help='also measure Tk render cost (requires a display or xvfb-run)')
+    parser.add_argument('--json', metavar='PATH', help='write results as JSON')
+    parser.add_argument('--baseline', metavar='PATH', help='fail if slower than this JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    # Per-operation INFO logging would dominate the numbers
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = {'core': {}, 'render': {}}
+    for size in args.sizes:
+        results['core'][size] = bench_core(size, args.store, args.sample)
+    print_table(f"FocusCore ({args.store} store)", results['core'], "ops/sec")
+
+    if args.render:
+        if os.name != 'nt' and not os.environ.get('DISPLAY'):
+            print("\nSkipping render benchmark: no DISPLAY (run under xvfb-run)")
+        else:
+            for size in args.sizes:
+                results['render'][size] = bench_render(size, min(args.sample, 200))
+            print_table("Render cost", results['render'], "ms/op")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        failures = find_regressions(results, baseline, args.tolerance)
+        if failures:
+            print("\nPerformance regressions:")
+            for failure in failures:
+                print(f"  {failure}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Cold import-time budget for Focus Tool
+ - Imports each module in a fresh interpreter under `python -X importtime`
+ - Fails (exit 1) if a cumulative import time exceeds its budget
+ - Also fails if a headless import drags in tkinter
+
+Examples:
+    python check_import_time.py
+    python check_import_time.py --budget lxfocus.core=80 --repeat 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Milliseconds; generous enough for a slow CI runner, tight enough to catch
+# an eager tkinter/sqlite import sneaking back into the package root
+DEFAULT_BUDGETS = {
+    'lxfocus': 25.0,
+    'focus_tool': 30.0,
+    'lxfocus.core': 150.0,
+    'lxfocus.cli': 100.0,
+    'lxfocus.app': 400.0,
+}
+
+HEADLESS = ('lxfocus', 'focus_tool', 'lxfocus.core', 'lxfocus.cli')
+
+
+def measure(module):
+    """Cumulative import time in ms and the set of modules it pulled in"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+    cumulative = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = line.split('|')
+        name = parts[2].strip()
+        if not parts[1].strip().isdigit():
+            continue
+        loaded.add(name)
+        if name == module:
+            cumulative = int(parts[1]) / 1000
+    if cumulative is None:
+        raise RuntimeError(f"no importtime entry for {module}")
+    return cumulative, loaded
+
+
+def parse_budget(text):
+    module, _, ms = text.partition('=')
+    if not ms:
+        raise argparse.ArgumentTypeError("expected MODULE=MS")
+    return module, float(ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Focus Tool import-time budget")
+    parser.add_argument('--budget', type=parse_budget, action='append', default=[],
+                        metavar='MODULE=MS', help='override or add a budget')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='fresh interpreters per module; the best run is kept')
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    budgets.update(args.budget)
+
+    failures = []
+    for module, budget in budgets.items():
+        runs = [measure(module) for _ in range(max(1, args.repeat))]
+        best = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        status = 'ok' if best <= budget else 'OVER'
+        print(f"  {module:<16} {best:8.1f} ms  (budget {budget:.0f} ms)  {status}")
+        if best > budget:
+            failures.append(f"{module}: {best:.1f} ms > {budget:.0f} ms")
+        if module in HEADLESS and 'tkinter' in loaded:
+            failures.append(f"{module}: imports tkinter")
+
+    if failures:
+        print("\nImport-time regressions:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nImport times within budget")
+
+
+if __name__ == "__main__":
+    main()
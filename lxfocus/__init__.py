@@ -0,0 +1,54 @@
+"""LOGiiKx's Nifty Focus Tool.
+
+Importing the package is cheap: it records the startup reference time and
+nothing else. Public names resolve lazily from their submodules on first
+access, so headless users of FocusCore never load Tk, and the app never loads
+sqlite3 or the sound code before it needs them.
+"""
+
+import time
+
+_STARTUP_T0 = time.perf_counter()  # Reference point for --profile-startup
+
+_EXPORTS = {
+    'app': ('FocusTool', 'run'),
+    'appindex': ('ExecutableIndex', 'IndexSnapshot'),
+    'archive': ('TaskArchive',),
+    'cli': ('parse_args', 'main'),
+    'config': ('AppConfig', 'load_app_config', 'reload_app_config', 'ConfigWatcher'),
+    'control': ('ControlServer', 'discovery_path'),
+    'core': ('FocusCore',),
+    'instance': ('parse_command', 'InstanceAddress', 'InstanceServer', 'forward_commands',
+                 'claim_instance'),
+    'launcher': ('Launcher',),
+    'logs': ('debug_enabled', 'configure_logging'),
+    'notify': ('SoundCache', 'default_sound_player', 'NotificationCenter'),
+    'profiling': ('LatencyHistogram', 'PerformanceMonitor', 'StartupProfiler'),
+    'search': ('TaskSearchIndex',),
+    'storage': ('write_json_atomic', 'PersistenceScheduler', 'TaskStore', 'JournalTaskStore',
+                'SQLiteTaskStore', 'migrate_json_to_sqlite', 'create_task_store'),
+    'tasks': ('Task', 'load_task_columns', 'dump_task_columns', 'make_task', 'parse_bool',
+              'parse_markdown_tasks', 'parse_csv_tasks', 'parse_ndjson_tasks', 'TASK_FORMATS',
+              'TASK_PARSERS', 'task_format_for', 'iter_task_file', 'chunked', 'export_tasks'),
+    'timers': ('Countdown', 'TimerEngine', 'HeadlessScheduler'),
+    'widgets': ('HexagonBackgroundEngine', 'StaticHexagonBackground', 'FeatureBox',
+                'VirtualTaskList', 'ScrollLayoutTracker', 'FrameScheduler', 'PerformanceHUD'),
+}
+
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value  # Cache so the next lookup is a plain attribute
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
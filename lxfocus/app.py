@@ -0,0 +1,1238 @@
+"""The Focus Tool window"""
+
+import json
+import logging
+import os
+import tkinter as tk
+
+from .config import ConfigWatcher, load_app_config
+from .core import FocusCore
+from .logs import debug_enabled
+from .notify import NotificationCenter
+from .profiling import PerformanceMonitor, StartupProfiler
+from .widgets import (FeatureBox, FrameScheduler, HexagonBackgroundEngine, PerformanceHUD,
+                      ScrollLayoutTracker, VirtualTaskList)
+
+logger = logging.getLogger(__name__)
+
+class FocusTool:
+    ARCHIVE_INTERVAL_MS = 60 * 60 * 1000
+    INSTANCE_POLL_MS = 150
+    APP_SUGGESTIONS = 6
+
+    def __init__(self, root, profiler=None, lazy_ui=True):
+        self.root = root
+        self.profiler = profiler or StartupProfiler()
+        self.lazy_ui = lazy_ui
+        self.config = load_app_config()
+        self.root.title("Focus Tool")
+        
+        # Load saved window size or use default
+        self.load_window_config()
+        self.profiler.mark('window_config')
+        
+        self.root.resizable(True, True)
+        window_size = self.config['window_size']
+        self.root.minsize(window_size['min_width'], window_size['min_height'])
+        
+        logger.info("Initializing FocusTool")
+        
+        # Set window properties for modern look while maintaining taskbar presence
+        self.root.attributes('-alpha', self.config['transparency'])
+        self.root.configure(bg=self.color('background'))
+        
+        # Keep Windows native title bar for proper taskbar presence
+        self.root.title("Focus Tool")
+        
+        # Ensure the window appears in the taskbar and Alt+Tab switcher
+        self.ensure_taskbar_presence()
+        
+        # Center the window on screen (only if no saved position)
+        if not hasattr(self, 'saved_x') or not hasattr(self, 'saved_y'):
+            self.center_window()
+        else:
+            # Use saved position
+            self.root.geometry(f'{self.saved_width}x{self.saved_height}+{self.saved_x}+{self.saved_y}')
+        
+        # All task/timer/persistence state lives in the headless core
+        self.core = FocusCore(scheduler=self.root, config=self.config)
+        
+        # Loop lag heartbeat and handler timings; FOCUS_DEBUG adds the HUD and
+        # a metrics file (FOCUS_METRICS_FILE picks another path or enables it alone)
+        self.debug = debug_enabled()
+        metrics_path = os.getenv('FOCUS_METRICS_FILE') or ('focus_metrics.ndjson' if self.debug else None)
+        self.monitor = PerformanceMonitor(self.root, metrics_path=metrics_path,
+                                          executor=self.core.persistence.executor)
+        self.monitor.instrument(self, ['add_task', 'complete_task', 'edit_task', 'delete_task',
+                                       'clear_tasks', 'import_tasks', 'export_tasks',
+                                       'apply_search', 'refresh_task_list', 'save_tasks',
+                                       'save_window_config', 'draw_canvas_background',
+                                       'update_timer_display', 'launch_app'])
+        self.monitor.start()
+        self.hud = None
+        
+        # Redraws are coalesced into paced frames via dirty flags
+        self.frames = FrameScheduler(self.root)
+        self.monitor.instrument(self.frames, ['run_frame'], prefix='frame.')
+        self.frames.register('timer', self.update_timer_display)
+        self.frames.register('list', self.apply_search)
+        self.frames.register('background', self.draw_canvas_background)
+        self.frames.register('window', self.save_window_config)
+        self.core.subscribe('timer_tick', lambda remaining: self.frames.mark('timer'))
+        self.core.subscribe('timer_started', lambda remaining: self.update_timer_buttons(True))
+        self.core.subscribe('timer_stopped', lambda remaining: self.update_timer_buttons(False))
+        # Completion notices are queued toasts with cached sound cues, never modal
+        self.notifications = NotificationCenter(
+            self.root, sound_enabled=self.core.config.get('sound_notifications', True))
+        self.core.subscribe('timer_complete', self.timer_complete)
+        self.core.subscribe('break_complete', lambda cycle: self.notifications.notify(
+            "Break Over", "Time to focus again.", sound='break_complete'))
+        self.core.subscribe('timer_done', lambda name: self.notifications.notify(
+            "Timer Done", f"'{name}' finished.", sound='timer_done'))
+        self.core.subscribe('phase_changed', lambda phase, remaining: self.update_timer_phase(phase))
+        
+        self.background = None
+        
+        self.task_box = None
+        self.app_box = None
+        self.app_index = None
+        self.first_paint_seen = False
+        
+        self.setup_ui()
+        if self.debug:
+            self.hud = PerformanceHUD(self.main_canvas, self.monitor, self.frames)
+        self.update_timer_display()
+        self.profiler.mark('timer_display')
+        
+        # Old completed tasks are archived at load and then hourly
+        self.root.after(self.ARCHIVE_INTERVAL_MS, self.archive_completed)
+        
+        # config.json edits are picked up without a restart
+        self.config_watcher = ConfigWatcher(self.root, self.apply_config)
+        self.config_watcher.start()
+        
+        # No need for delayed Windows setup since we're keeping native title bar
+        
+        logger.info("FocusTool initialization complete")
+    
+    def load_window_config(self):
+        """Load saved window configuration"""
+        default_width = self.config['window_size']['width']
+        default_height = self.config['window_size']['height']
+        try:
+            if os.path.exists('window_config.json'):
+                with open('window_config.json', 'r') as f:
+                    config = json.load(f)
+                    self.saved_width = config.get('width', default_width)
+                    self.saved_height = config.get('height', default_height)
+                    self.saved_x = config.get('x', None)
+                    self.saved_y = config.get('y', None)
+                    logger.info("Loaded window config: %sx%s", self.saved_width, self.saved_height)
+                # Set initial geometry
+                self.root.geometry(f"{self.saved_width}x{self.saved_height}")
+            else:
+                # Default size
+                self.saved_width = default_width
+                self.saved_height = default_height
+                self.root.geometry(f"{default_width}x{default_height}")
+                logger.info("No saved config, using default size")
+        except Exception as e:
+            logger.error("Error loading window config: %s", e)
+            # Fallback to default
+            self.saved_width = default_width
+            self.saved_height = default_height
+            self.root.geometry(f"{default_width}x{default_height}")
+    
+    def save_window_config(self):
+        """Queue current window configuration for the next background write"""
+        try:
+            # Get current window state
+            geometry = self.root.geometry()
+            
+            # Parse geometry string (e.g., "450x700+100+200" or "450x700")
+            if 'x' in geometry:
+                parts = geometry.split('+')
+                size_part = parts[0]
+                
+                if 'x' in size_part:
+                    width, height = map(int, size_part.split('x'))
+                    
+                    # Check if we have position information
+                    if len(parts) >= 3:
+                        x, y = map(int, parts[1:3])
+                    else:
+                        # No position info, use current position
+                        x = self.root.winfo_x()
+                        y = self.root.winfo_y()
+                    
+                    config = {
+                        'width': width,
+                        'height': height,
+                        'x': x,
+                        'y': y
+                    }
+                    
+                    # Written atomically by the persistence scheduler's next flush
+                    self.core.persistence.mark_window_dirty(config)
+                    logger.debug("Window config marked dirty: %sx%s at (%s, %s)", width, height, x, y)
+                else:
+                    # Reduced logging for better performance
+                    pass
+            else:
+                # Reduced logging for better performance
+                pass
+                
+        except Exception as e:
+            logger.error("Error saving window config: %s", e)
+    
+    def color(self, name):
+        return self.config.color(name)
+    
+    def font(self, role):
+        return self.config.font(role)
+    
+    COLOR_OPTIONS = ('bg', 'fg', 'activebackground', 'activeforeground', 'highlightbackground',
+                     'highlightcolor', 'insertbackground', 'selectbackground',
+                     'selectforeground', 'selectcolor', 'disabledforeground')
+    
+    def apply_config(self, config, changed):
+        """Push only the changed settings to the live UI and core"""
+        old, self.config = self.config, config
+        old_minutes = self.core.default_minutes
+        self.core.apply_config(config)
+        colors = {old.color(key.split('.', 1)[1]): config.color(key.split('.', 1)[1])
+                  for key in changed if key.startswith('colors.')}
+        fonts = {old.font(key.split('.', 1)[1]): config.font(key.split('.', 1)[1])
+                 for key in changed if key.startswith('fonts.')}
+        if colors or fonts:
+            self.restyle(self.root, colors, fonts)
+            if self.task_box is not None:
+                self.task_view.completed_color = config.color('success')
+                self.task_view.render()
+        if 'transparency' in changed:
+            self.root.attributes('-alpha', config['transparency'])
+        if changed & {'window_size.min_width', 'window_size.min_height'}:
+            window_size = config['window_size']
+            self.root.minsize(window_size['min_width'], window_size['min_height'])
+        if 'sound_notifications' in changed:
+            self.notifications.sound_enabled = config['sound_notifications']
+        if 'app_folders' in changed and self.app_index is not None:
+            self.app_index.set_app_folders(config['app_folders'])
+            self.app_index.refresh()
+        if 'default_app' in changed and self.app_box is not None:
+            if self.app_entry.get() == old['default_app']:
+                self.app_entry.delete(0, tk.END)
+                self.app_entry.insert(0, config['default_app'])
+        # An idle clock still showing the old default follows the new one
+        timer = self.core.timer
+        if ('timer_duration' in changed and not timer.running and self.core.phase == 'focus'
+                and self.core.timer_minutes == old_minutes and timer.remaining == timer.duration):
+            self.core.set_timer(self.core.default_minutes)
+    
+    def restyle(self, widget, colors, fonts):
+        """Swap old colors/font families for new ones, touching only widgets that use them"""
+        updates = {}
+        for option in self.COLOR_OPTIONS:
+            try:
+                value = str(widget.cget(option)).lower()
+            except tk.TclError:
+                continue
+            if value in colors:
+                updates[option] = colors[value]
+        if fonts:
+            try:
+                font = self.root.tk.splitlist(widget.cget('font'))
+            except tk.TclError:
+                font = ()
+            if font and font[0] in fonts:
+                updates['font'] = (fonts[font[0]],) + tuple(font[1:])
+        if updates:
+            widget.configure(**updates)
+        for child in widget.winfo_children():
+            self.restyle(child, colors, fonts)
+    
+    def center_window(self):
+        self.root.update_idletasks()
+        width = self.root.winfo_width()
+        height = self.root.winfo_height()
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f'{width}x{height}+{x}+{y}')
+        logger.info("Window centered at (%s, %s) with size %sx%s", x, y, width, height)
+    
+    def setup_ui(self):
+        logger.info("Setting up UI")
+        
+        # Custom color scheme for glass effect
+        bg_color = self.color('background')
+        frame_bg = self.color('frame_background')
+        accent_color = self.color('accent')
+        text_color = self.color('text')
+        secondary_text = self.color('secondary_text')
+        
+        # No custom title bar - using Windows native one
+        logger.info("Using Windows native title bar")
+        
+        # Create scrollable main container with clean implementation
+        # Canvas for scrolling
+        self.main_canvas = tk.Canvas(self.root, bg=bg_color, highlightthickness=0)
+        self.main_canvas.pack(side='left', fill='both', expand=True)
+        
+        # Scrollbar that appears when needed
+        self.main_scrollbar = tk.Scrollbar(self.root, orient='vertical', command=self.main_canvas.yview)
+        self.main_canvas.configure(yscrollcommand=self.main_scrollbar.set)
+        
+        # Main container with transparent background to show hexagons
+        main_frame = tk.Frame(self.main_canvas, bg=bg_color, padx=20, pady=20)
+        self.canvas_window = self.main_canvas.create_window((0, 0), window=main_frame, anchor='nw')
+        
+        # Scroll region and scrollbar follow the frame's own extents
+        self.layout = ScrollLayoutTracker(self.main_canvas, self.canvas_window,
+                                          main_frame, self.main_scrollbar, self.frames)
+        
+        logger.info("Scrollable main frame created and packed")
+        
+        # Configure grid weights for responsive layout
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        
+        # Timer Feature Box
+        self.timer_box = FeatureBox(main_frame, "Timer")
+        self.timer_box.pack(fill='x', pady=(0, 20))
+        self.setup_timer_section()
+        logger.info("Timer box created and packed")
+        self.profiler.mark('timer_box')
+        
+        # Status bar
+        self.main_frame = main_frame
+        self.status_frame = tk.Frame(main_frame, bg=bg_color)
+        self.status_frame.pack(fill='x', pady=(20, 0))
+        
+        status_label = tk.Label(self.status_frame, text="Ready to focus!", 
+                               font=(self.font('body'), 9),
+                               bg=bg_color, fg=secondary_text,
+                               anchor='center')
+        status_label.pack(fill='x')
+        
+        # Add hexagon background after all content is created
+        self.setup_background()
+        self.profiler.mark('background')
+        
+        # Resizes only mark frame work. The geometry binding uses a tag that only
+        # the toplevel carries, so child widgets' Configure events skip it
+        self.main_canvas.bind('<Configure>', lambda e: self.frames.mark('background'), add='+')
+        self.root.bindtags(self.root.bindtags() + ('FocusToolWindow',))
+        self.root.bind_class('FocusToolWindow', '<Configure>', lambda e: self.frames.mark('window'))
+        
+        # Bind mouse wheel scrolling
+        self.main_canvas.bind('<MouseWheel>', self.on_main_scroll)
+        self.main_canvas.bind('<Button-4>', self.on_main_scroll)
+        self.main_canvas.bind('<Button-5>', self.on_main_scroll)
+        self.main_canvas.bind('<Expose>', self.on_first_paint, add='+')
+        
+        if self.lazy_ui:
+            # Task and Quick Launch boxes are built once the timer is on screen;
+            # the timeout covers windows that start minimized and never expose
+            self.root.after(500, self.build_deferred_sections)
+        else:
+            self.build_task_box()
+            self.build_app_box()
+        
+        # No custom resize handles needed with native title bar
+        
+        logger.info("UI setup complete")
+    
+    def on_first_paint(self, event=None):
+        """Record first paint and kick off deferred UI construction"""
+        if self.first_paint_seen:
+            return
+        self.first_paint_seen = True
+        self.profiler.mark('first_paint')
+        if self.lazy_ui:
+            self.root.after_idle(self.build_deferred_sections)
+        else:
+            self.profiler.report()
+    
+    def build_deferred_sections(self):
+        """Build the lazy boxes in separate idle callbacks so input stays live"""
+        if self.task_box is None:
+            self.build_task_box()
+            self.root.after_idle(self.build_deferred_sections)
+        elif self.app_box is None:
+            self.build_app_box()
+            self.profiler.report()
+    
+    def build_task_box(self):
+        # Task Management Feature Box - allow it to expand
+        self.task_box = FeatureBox(self.main_frame, "Task Management")
+        self.task_box.pack(fill='both', expand=True, pady=(0, 20), before=self.status_frame)
+        self.setup_task_section()
+        # Loading emits tasks_reset, which renders the list
+        self.core.load_tasks()
+        self.profiler.mark('load_tasks')
+        logger.info("Task box created and packed")
+        self.profiler.mark('task_box')
+    
+    def build_app_box(self):
+        # Quick Launch Feature Box
+        self.app_box = FeatureBox(self.main_frame, "Quick Launch")
+        self.app_box.pack(fill='x', pady=(0, 20), before=self.status_frame)
+        self.setup_app_section()
+        logger.info("App box created and packed")
+        self.profiler.mark('app_box')
+    
+    def setup_background(self):
+        """Setup hexagon background that doesn't interfere with content"""
+        try:
+            # Create background directly on the canvas as a background layer
+            if hasattr(self, 'main_canvas'):
+                # Draw hexagons directly on the canvas instead of using a widget
+                self.draw_canvas_background()
+            else:
+                logger.warning("No main canvas available for background")
+                
+            logger.info("Hexagon background setup complete")
+        except Exception as e:
+            logger.error("Error setting up background: %s", e)
+    
+    def draw_canvas_background(self):
+        """Extend the shared hexagon background to the current canvas size"""
+        try:
+            canvas_width = self.main_canvas.winfo_width()
+            canvas_height = self.main_canvas.winfo_height()
+            if canvas_width <= 1 or canvas_height <= 1:
+                # Not mapped yet; the first resize redraws at the real size
+                canvas_width, canvas_height = 450, 700
+            if self.background is None:
+                self.background = HexagonBackgroundEngine(self.main_canvas)
+            self.background.resize(canvas_width, canvas_height)
+            logger.debug("Canvas background updated")
+        except Exception as e:
+            logger.error("Error drawing canvas background: %s", e)
+    
+    def setup_timer_section(self):
+        logger.info("Setting up timer section")
+        content = self.timer_box.content_frame
+        
+        # Timer display with glass styling
+        self.timer_label = tk.Label(content, text="50:00", 
+                                   font=(self.font('title'), 42, "bold"), 
+                                   bg=self.color('frame_background'), fg=self.color('accent'),
+                                   pady=25)
+        self.timer_label.pack(pady=(25, 25))
+        
+        # Timer selection buttons
+        time_select_frame = tk.Frame(content, bg=self.color('frame_background'))
+        time_select_frame.pack(pady=(0, 20))
+        
+        # Preset time buttons
+        preset_frame = tk.Frame(time_select_frame, bg=self.color('frame_background'))
+        preset_frame.pack()
+        
+        time_20_btn = tk.Button(preset_frame, text="20m", 
+                                font=(self.font('body'), 9, "bold"),
+                                bg=self.color('info'), fg=self.color('text'),
+                                relief='flat', borderwidth=0,
+                                padx=15, pady=8,
+                                command=lambda: self.set_timer(20),
+                                activebackground='#138496',
+                                activeforeground=self.color('text'))
+        time_20_btn.pack(side='left', padx=(0, 10))
+        
+        time_50_btn = tk.Button(preset_frame, text="50m", 
+                                font=(self.font('body'), 9, "bold"),
+                                bg=self.color('success'), fg=self.color('text'),
+                                relief='flat', borderwidth=0,
+                                padx=15, pady=8,
+                                command=lambda: self.set_timer(50),
+                                activebackground='#218838',
+                                activeforeground=self.color('text'))
+        time_50_btn.pack(side='left', padx=(0, 10))
+        
+        time_120_btn = tk.Button(preset_frame, text="120m", 
+                                 font=(self.font('body'), 9, "bold"),
+                                 bg='#fd7e14', fg=self.color('text'),
+                                 relief='flat', borderwidth=0,
+                                 padx=15, pady=8,
+                                 command=lambda: self.set_timer(120),
+                                 activebackground='#e8690b',
+                                 activeforeground=self.color('text'))
+        time_120_btn.pack(side='left', padx=(0, 10))
+        
+        custom_btn = tk.Button(preset_frame, text="Custom", 
+                               font=(self.font('body'), 9, "bold"),
+                               bg='#6f42c1', fg=self.color('text'),
+                               relief='flat', borderwidth=0,
+                               padx=15, pady=8,
+                               command=self.set_custom_timer,
+                               activebackground='#5a32a3',
+                               activeforeground=self.color('text'))
+        custom_btn.pack(side='left', padx=(0, 10))
+        
+        # Timer control buttons with proper layout
+        button_frame = tk.Frame(content, bg=self.color('frame_background'))
+        button_frame.pack(pady=(0, 25))
+        
+        # Top row buttons
+        top_button_frame = tk.Frame(button_frame, bg=self.color('frame_background'))
+        top_button_frame.pack()
+        
+        self.start_button = tk.Button(top_button_frame, text="Start", 
+                                     font=(self.font('body'), 10, "bold"),
+                                     bg=self.color('accent'), fg=self.color('text'),
+                                     relief='flat', borderwidth=0,
+                                     padx=25, pady=10,
+                                     command=self.start_timer,
+                                     activebackground='#3a8eef',
+                                     activeforeground=self.color('text'))
+        self.start_button.pack(side='left', padx=(0, 15))
+        
+        self.stop_button = tk.Button(top_button_frame, text="Stop", 
+                                    font=(self.font('body'), 10, "bold"),
+                                    bg='#666666', fg=self.color('text'),
+                                    relief='flat', borderwidth=0,
+                                    padx=25, pady=10,
+                                    state="disabled",
+                                    command=self.stop_timer,
+                                    activebackground='#555555',
+                                    activeforeground=self.color('text'))
+        self.stop_button.pack(side='left', padx=(15, 0))
+        
+        # Reset button on separate row
+        self.reset_button = tk.Button(button_frame, text="Reset", 
+                                     font=(self.font('body'), 10, "bold"),
+                                     bg='#555555', fg=self.color('text'),
+                                     relief='flat', borderwidth=0,
+                                     padx=25, pady=10,
+                                     command=self.reset_timer,
+                                     activebackground='#444444',
+                                     activeforeground=self.color('text'))
+        self.reset_button.pack(pady=(20, 0))
+        
+        logger.info("Timer section setup complete")
+    
+    def setup_task_section(self):
+        logger.info("Setting up task section")
+        content = self.task_box.content_frame
+        
+        # Task input with glass styling
+        input_frame = tk.Frame(content, bg=self.color('frame_background'))
+        input_frame.pack(fill='x', padx=20, pady=(20, 15))
+        
+        self.task_entry = tk.Entry(input_frame, 
+                                  font=(self.font('body'), 10),
+                                  bg=self.color('background'), fg=self.color('text'),
+                                  insertbackground=self.color('text'),
+                                  relief='flat', borderwidth=1,
+                                  highlightthickness=1,
+                                  highlightbackground=self.color('accent'),
+                                  highlightcolor=self.color('accent'))
+        self.task_entry.pack(side='left', fill='x', expand=True, padx=(0, 15))
+        self.task_entry.bind('<Return>', lambda e: self.add_task())
+        
+        add_button = tk.Button(input_frame, text="Add Task", 
+                              font=(self.font('body'), 10, "bold"),
+                              bg=self.color('accent'), fg=self.color('text'),
+                              relief='flat', borderwidth=0,
+                              padx=20, pady=8,
+                              command=self.add_task,
+                              activebackground='#3a8eef',
+                              activeforeground=self.color('text'))
+        add_button.pack(side='right')
+        
+        # Search box and open/completed filter
+        search_frame = tk.Frame(content, bg=self.color('frame_background'))
+        search_frame.pack(fill='x', padx=20, pady=(0, 10))
+        
+        self.search_entry = tk.Entry(search_frame, 
+                                    font=(self.font('body'), 9),
+                                    bg=self.color('background'), fg=self.color('secondary_text'),
+                                    insertbackground=self.color('text'),
+                                    relief='flat', borderwidth=1,
+                                    highlightthickness=1,
+                                    highlightbackground='#666666',
+                                    highlightcolor=self.color('accent'))
+        self.search_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
+        self.search_entry.bind('<KeyRelease>', lambda e: self.schedule_search())
+        self.search_entry.bind('<Escape>', lambda e: self.clear_search())
+        
+        self.search_filter = tk.StringVar(value='all')
+        for value, label in (('all', "All"), ('open', "Open"), ('completed', "Done")):
+            tk.Radiobutton(search_frame, text=label, value=value,
+                           variable=self.search_filter,
+                           command=self.apply_search,
+                           font=(self.font('body'), 8),
+                           bg=self.color('frame_background'), fg=self.color('secondary_text'),
+                           selectcolor=self.color('background'),
+                           activebackground=self.color('frame_background'),
+                           activeforeground=self.color('text'),
+                           indicatoron=False, relief='flat',
+                           borderwidth=0, padx=8, pady=3).pack(side='left')
+        self.search_active = False
+        self.search_job = None
+        self.search_limit = None
+        
+        # Task list with glass styling and proper expansion
+        list_frame = tk.Frame(content, bg=self.color('frame_background'))
+        list_frame.pack(fill='both', expand=True, padx=20, pady=(0, 15))
+        
+        # Task listbox without fixed height to allow proper stretching
+        self.task_listbox = tk.Listbox(list_frame, 
+                                       font=(self.font('body'), 9),
+                                       bg=self.color('background'), fg=self.color('text'),
+                                       selectbackground=self.color('accent'),
+                                       selectforeground=self.color('text'),
+                                       relief='flat', borderwidth=1,
+                                       highlightthickness=1,
+                                       highlightbackground=self.color('accent'),
+                                       highlightcolor=self.color('accent'))
+        self.task_listbox.pack(fill='both', expand=True)
+        self.task_view = VirtualTaskList(self.task_listbox, self.core.tasks,
+                                         completed_color=self.color('success'))
+        self.task_view.on_end = self.load_more_results
+        self.subscribe_task_view()
+        self.task_listbox.bind('<Double-Button-1>', lambda e: self.edit_task())
+        
+        # Bind mouse wheel scrolling
+        self.task_listbox.bind('<MouseWheel>', self.on_task_scroll)
+        self.task_listbox.bind('<Button-4>', self.on_task_scroll)
+        self.task_listbox.bind('<Button-5>', self.on_task_scroll)
+        
+        # Task action buttons with proper layout
+        button_frame = tk.Frame(content, bg=self.color('frame_background'))
+        button_frame.pack(pady=(0, 20))
+        
+        # Top row buttons
+        top_button_frame = tk.Frame(button_frame, bg=self.color('frame_background'))
+        top_button_frame.pack()
+        
+        complete_button = tk.Button(top_button_frame, text="Complete", 
+                                   font=(self.font('body'), 9, "bold"),
+                                   bg=self.color('success'), fg=self.color('text'),
+                                   relief='flat', borderwidth=0,
+                                   padx=18, pady=8,
+                                   command=self.complete_task,
+                                   activebackground='#218838',
+                                   activeforeground=self.color('text'))
+        complete_button.pack(side='left', padx=(0, 15))
+        
+        delete_button = tk.Button(top_button_frame, text="Delete", 
+                                 font=(self.font('body'), 9, "bold"),
+                                 bg=self.color('danger'), fg=self.color('text'),
+                                 relief='flat', borderwidth=0,
+                                 padx=18, pady=8,
+                                 command=self.delete_task,
+                                 activebackground='#c82333',
+                                 activeforeground=self.color('text'))
+        delete_button.pack(side='left', padx=(15, 0))
+        
+        # Clear button on separate row
+        clear_button = tk.Button(button_frame, text="Clear All", 
+                                font=(self.font('body'), 9, "bold"),
+                                bg='#6c757d', fg=self.color('text'),
+                                relief='flat', borderwidth=0,
+                                padx=18, pady=8,
+                                command=self.clear_tasks,
+                                activebackground='#5a6268',
+                                activeforeground=self.color('text'))
+        clear_button.pack(pady=(15, 0))
+        
+        # Bulk import/export row
+        io_button_frame = tk.Frame(button_frame, bg=self.color('frame_background'))
+        io_button_frame.pack(pady=(15, 0))
+        
+        import_button = tk.Button(io_button_frame, text="Import", 
+                                 font=(self.font('body'), 9, "bold"),
+                                 bg=self.color('info'), fg=self.color('text'),
+                                 relief='flat', borderwidth=0,
+                                 padx=18, pady=8,
+                                 command=self.import_tasks,
+                                 activebackground='#138496',
+                                 activeforeground=self.color('text'))
+        import_button.pack(side='left', padx=(0, 15))
+        
+        export_button = tk.Button(io_button_frame, text="Export", 
+                                 font=(self.font('body'), 9, "bold"),
+                                 bg='#6f42c1', fg=self.color('text'),
+                                 relief='flat', borderwidth=0,
+                                 padx=18, pady=8,
+                                 command=self.export_tasks,
+                                 activebackground='#5a32a3',
+                                 activeforeground=self.color('text'))
+        export_button.pack(side='left', padx=(15, 0))
+        
+        logger.info("Task section setup complete")
+    
+    def setup_app_section(self):
+        logger.info("Setting up app section")
+        content = self.app_box.content_frame
+        
+        # App input with glass styling
+        input_frame = tk.Frame(content, bg=self.color('frame_background'))
+        input_frame.pack(fill='x', padx=20, pady=(20, 15))
+        
+        self.app_entry = tk.Entry(input_frame, 
+                                 font=(self.font('body'), 10),
+                                 bg=self.color('background'), fg=self.color('text'),
+                                 insertbackground=self.color('text'),
+                                 relief='flat', borderwidth=1,
+                                 highlightthickness=1,
+                                 highlightbackground=self.color('accent'),
+                                 highlightcolor=self.color('accent'))
+        self.app_entry.pack(side='left', fill='x', expand=True, padx=(0, 15))
+        self.app_entry.insert(0, self.config['default_app'])
+        
+        # Launch history and the program index are loaded with the box, not at startup
+        from .appindex import ExecutableIndex
+        from .launcher import Launcher
+        self.launcher = Launcher(submit=self.core.persistence.submit)
+        self.app_index = ExecutableIndex(app_folders=self.config['app_folders'])
+        self.app_index.refresh()
+        self.app_suggestions = []
+        self.app_suggestion_index = -1
+        self.app_entry.bind('<KeyRelease>', self.on_app_entry_key)
+        self.app_entry.bind('<Down>', lambda e: self.cycle_app_suggestion(1))
+        self.app_entry.bind('<Up>', lambda e: self.cycle_app_suggestion(-1))
+        self.app_entry.bind('<Return>', lambda e: self.launch_app())
+        self.app_entry.bind('<Escape>', lambda e: self.show_app_suggestions([]))
+        # Cheap when nothing changed: the rescan only stats directories
+        self.app_entry.bind('<FocusIn>', lambda e: self.app_index.refresh())
+        
+        launch_button = tk.Button(input_frame, text="Launch App", 
+                                 font=(self.font('body'), 10, "bold"),
+                                 bg=self.color('accent'), fg=self.color('text'),
+                                 relief='flat', borderwidth=0,
+                                 padx=20, pady=8,
+                                 command=self.launch_app,
+                                 activebackground='#3a8eef',
+                                 activeforeground=self.color('text'))
+        launch_button.pack(side='right')
+        
+        # Ranked history and fuzzy program matches; only packed while there are any
+        self.app_input_frame = input_frame
+        self.app_suggestion_list = tk.Listbox(content, height=self.APP_SUGGESTIONS,
+                                              font=(self.font('body'), 10),
+                                              bg=self.color('background'), fg=self.color('text'),
+                                              selectbackground=self.color('accent'),
+                                              selectforeground=self.color('text'),
+                                              relief='flat', borderwidth=0, highlightthickness=0,
+                                              activestyle='none')
+        self.app_suggestion_list.bind('<ButtonRelease-1>', self.on_app_suggestion_click)
+        self.app_suggestion_list.bind('<Double-Button-1>', lambda e: self.launch_app())
+        
+        # Browse button with glass styling
+        browse_button = tk.Button(content, text="Browse Files", 
+                                 font=(self.font('body'), 10, "bold"),
+                                 bg=self.color('info'), fg=self.color('text'),
+                                 relief='flat', borderwidth=0,
+                                 padx=25, pady=10,
+                                 command=self.browse_app,
+                                 activebackground='#138496',
+                                 activeforeground=self.color('text'))
+        browse_button.pack(pady=(0, 20))
+        
+        logger.info("App section setup complete")
+    
+    def on_main_scroll(self, event):
+        """Handle mouse wheel scrolling for main window"""
+        try:
+            # Only scroll if scrollbar is visible (content overflows)
+            if self.layout.scrollbar_shown:
+                if event.num == 4 or event.delta > 0:  # Scroll up
+                    self.main_canvas.yview_scroll(-1, "units")
+                elif event.num == 5 or event.delta < 0:  # Scroll down
+                    self.main_canvas.yview_scroll(1, "units")
+        except Exception as e:
+            logger.debug("Main scroll error: %s", e)
+
+    def on_task_scroll(self, event):
+        """Handle mouse wheel scrolling for task list"""
+        try:
+            if event.num == 4 or event.delta > 0:  # Scroll up
+                self.task_view.scroll(-1)
+            elif event.num == 5 or event.delta < 0:  # Scroll down
+                self.task_view.scroll(1)
+            # Prevent event from propagating to parent widgets
+            return "break"
+        except Exception as e:
+            logger.debug("Task scroll error: %s", e)
+            return "break"
+    
+    def ensure_taskbar_presence(self):
+        # Initial setup for Windows taskbar presence
+        if os.name == 'nt':
+            try:
+                import ctypes
+                hwnd = self.root.winfo_id()
+                GWL_EXSTYLE = -20
+                WS_EX_APPWINDOW = 0x00040000
+                WS_EX_TOOLWINDOW = 0x00000080
+                SetWindowLong = ctypes.windll.user32.SetWindowLongW
+                GetWindowLong = ctypes.windll.user32.GetWindowLongW
+                SetWindowPos = ctypes.windll.user32.SetWindowPos
+                
+                # Get current extended style
+                exStyle = GetWindowLong(hwnd, GWL_EXSTYLE)
+                # Ensure it's not a tool window and has proper window styles
+                exStyle = (exStyle | WS_EX_APPWINDOW) & (~WS_EX_TOOLWINDOW)
+                SetWindowLong(hwnd, GWL_EXSTYLE, exStyle)
+                
+                # Force a style refresh
+                SWP_FRAMECHANGED = 0x0020
+                SetWindowPos(hwnd, None, 0, 0, 0, 0, SWP_FRAMECHANGED)
+                
+                logger.debug("Taskbar presence ensured")
+            except Exception as e:
+                logger.debug("ensure_taskbar_presence failed: %s", e)
+
+
+    
+    def watch_instance(self, server):
+        """Apply commands that later launches forward to this window"""
+        self.instance_server = server
+        self.poll_instance()
+    
+    def poll_instance(self):
+        commands = self.instance_server.poll()
+        if commands:
+            self.run_commands(commands)
+        self.root.after(self.INSTANCE_POLL_MS, self.poll_instance)
+    
+    def run_commands(self, commands):
+        """Run parsed command-line commands (see lxfocus.instance.parse_command)"""
+        if not self.core.loaded:
+            # The lazy task box has not loaded the tasks yet; they would replace ours
+            self.core.when_loaded(lambda: self.run_commands(commands))
+            return
+        for command in commands:
+            action = command['action']
+            logger.info("Command from launch: %s", command)
+            try:
+                if action == 'add':
+                    self.core.add_task(command['text'])
+                elif action == 'start':
+                    if command.get('minutes'):
+                        self.core.set_timer(command['minutes'])
+                    self.core.start_timer()
+                elif action == 'stop':
+                    self.core.stop_timer()
+                elif action == 'reset':
+                    self.core.reset_timer()
+            except Exception as e:
+                logger.error("Error running command %s: %s", command, e)
+        self.show_window()
+    
+    def show_window(self):
+        """Bring the window to the front, restoring it if minimized"""
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+    
+    def start_timer(self):
+        self.core.start_timer()
+    
+    def stop_timer(self):
+        self.core.stop_timer()
+    
+    def update_timer_buttons(self, running):
+        if running:
+            self.start_button.config(state="disabled", bg='#666666')
+            self.stop_button.config(state="normal", bg=self.color('danger'))
+        else:
+            self.start_button.config(state="normal", bg=self.color('accent'))
+            self.stop_button.config(state="disabled", bg='#666666')
+    
+    def set_timer(self, minutes):
+        """Set timer to specified number of minutes"""
+        self.core.set_timer(minutes)
+    
+    def set_custom_timer(self):
+        """Open dialog for custom timer input"""
+        logger.info("Opening custom timer dialog")
+        
+        # Create custom timer dialog
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Custom Timer")
+        dialog.geometry("300x150")
+        dialog.configure(bg=self.color('frame_background'))
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        # Center dialog on parent window
+        dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 75, self.root.winfo_rooty() + 275))
+        
+        # Input frame
+        input_frame = tk.Frame(dialog, bg=self.color('frame_background'))
+        input_frame.pack(pady=20)
+        
+        tk.Label(input_frame, text="Enter minutes:", 
+                font=(self.font('body'), 10), bg=self.color('frame_background'), fg=self.color('text')).pack()
+        
+        time_entry = tk.Entry(input_frame, font=(self.font('body'), 12), width=10)
+        time_entry.pack(pady=10)
+        time_entry.focus()
+        time_entry.bind('<Return>', lambda e: self.apply_custom_timer(dialog, time_entry))
+        
+        # Button frame
+        button_frame = tk.Frame(dialog, bg=self.color('frame_background'))
+        button_frame.pack(pady=10)
+        
+        tk.Button(button_frame, text="Set", 
+                 font=(self.font('body'), 9, "bold"),
+                 bg=self.color('accent'), fg=self.color('text'),
+                 relief='flat', borderwidth=0,
+                 padx=20, pady=5,
+                 command=lambda: self.apply_custom_timer(dialog, time_entry),
+                 activebackground='#3a8eef',
+                 activeforeground=self.color('text')).pack(side='left', padx=(0, 10))
+        
+        tk.Button(button_frame, text="Cancel", 
+                 font=(self.font('body'), 9, "bold"),
+                 bg='#666666', fg=self.color('text'),
+                 relief='flat', borderwidth=0,
+                 padx=20, pady=5,
+                 command=dialog.destroy,
+                 activebackground='#555555',
+                 activeforeground=self.color('text')).pack(side='left')
+    
+    def apply_custom_timer(self, dialog, time_entry):
+        """Apply custom timer value from dialog"""
+        from tkinter import messagebox
+        try:
+            minutes = int(time_entry.get().strip())
+            if minutes > 0 and minutes <= 1440:  # Max 24 hours
+                logger.info("Setting custom timer to %s minutes", minutes)
+                self.core.set_timer(minutes)
+                dialog.destroy()
+            else:
+                messagebox.showerror("Invalid Time", "Please enter a time between 1 and 1440 minutes (24 hours)")
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a valid number of minutes")
+    
+    def reset_timer(self):
+        self.core.reset_timer()
+    
+    def update_timer_display(self):
+        minutes, seconds = divmod(self.core.timer.display_seconds(), 60)
+        self.timer_label.config(text=f"{minutes:02d}:{seconds:02d}")
+    
+    def update_timer_phase(self, phase):
+        # Breaks show in green, focus sessions in the accent blue
+        self.timer_label.config(fg=self.color('success') if phase == 'break' else self.color('accent'))
+    
+    def timer_complete(self, minutes):
+        # Use stored original time for completion message
+        self.notifications.notify("Timer Complete", f"{minutes}-minute focus session completed!",
+                                  sound='focus_complete')
+    
+    def add_task(self):
+        if self.core.add_task(self.task_entry.get()) is not None:
+            self.task_entry.delete(0, tk.END)
+    
+    def selected_task(self):
+        """(core index hint, task) for the listbox selection, or (None, None)"""
+        index = self.task_view.selected_index()
+        if index is None or index >= len(self.task_view.rows):
+            return None, None
+        task = self.task_view.rows[index]
+        # Positions only line up with core.tasks when no search is active
+        return (None if self.search_active else index), task
+    
+    def complete_task(self):
+        index, task = self.selected_task()
+        if task is not None:
+            self.core.toggle_completed(task.id, hint=index)
+        else:
+            logger.warning("No task selected for completion")
+    
+    def edit_task(self):
+        from tkinter import simpledialog
+        index, task = self.selected_task()
+        if task is None:
+            return
+        text = simpledialog.askstring("Edit Task", "Task:", initialvalue=task.text,
+                                      parent=self.root)
+        if text:
+            self.core.edit_task(task.id, text, hint=index)
+    
+    def delete_task(self):
+        index, task = self.selected_task()
+        if task is not None:
+            self.core.delete_task(task.id, hint=index)
+        else:
+            logger.warning("No task selected for deletion")
+    
+    def clear_tasks(self):
+        from tkinter import messagebox
+        if messagebox.askyesno("Clear Tasks", "Are you sure you want to clear all tasks?"):
+            self.core.clear_tasks()
+            logger.info("All tasks cleared")
+        else:
+            logger.info("Task clear cancelled by user")
+    
+    def import_tasks(self, path=None):
+        """Bulk-import a Markdown checklist, CSV or NDJSON file"""
+        from tkinter import filedialog, messagebox
+        if path is None:
+            path = filedialog.askopenfilename(
+                title="Import Tasks",
+                filetypes=[("Task files", "*.md *.markdown *.txt *.csv *.ndjson *.jsonl"),
+                           ("All files", "*.*")]
+            )
+        if not path:
+            logger.info("Task import cancelled")
+            return 0
+        try:
+            return self.core.import_tasks(path)
+        except Exception as e:
+            logger.error("Error importing tasks from %s: %s", path, e)
+            messagebox.showerror("Import Failed", f"Could not import {path}: {e}")
+            return 0
+    
+    def export_tasks(self, path=None):
+        """Export all tasks as Markdown, CSV or NDJSON (chosen by extension)"""
+        from tkinter import filedialog, messagebox
+        if path is None:
+            path = filedialog.asksaveasfilename(
+                title="Export Tasks",
+                defaultextension=".md",
+                filetypes=[("Markdown checklist", "*.md"), ("CSV", "*.csv"),
+                           ("Newline-delimited JSON", "*.ndjson")]
+            )
+        if not path:
+            logger.info("Task export cancelled")
+            return 0
+        try:
+            return self.core.export_tasks(path)
+        except Exception as e:
+            logger.error("Error exporting tasks to %s: %s", path, e)
+            messagebox.showerror("Export Failed", f"Could not export to {path}: {e}")
+            return 0
+    
+    def subscribe_task_view(self):
+        """The view follows core events as single-row diffs"""
+        self.core.subscribe('task_added', lambda index, task: self.on_task_list_changed(
+            self.task_view.inserted, index))
+        self.core.subscribe('task_updated', lambda index, task: self.on_task_list_changed(
+            self.task_view.updated, index))
+        self.core.subscribe('task_removed', lambda index, task: self.on_task_list_changed(
+            self.task_view.removed, index))
+        self.core.subscribe('tasks_reset', lambda tasks: self.refresh_task_list())
+
+    def on_task_list_changed(self, apply_diff, index):
+        if self.search_active:
+            # Core positions don't map onto the filtered rows; re-query once per frame
+            self.frames.mark('list')
+        else:
+            apply_diff(index)
+    
+    def schedule_search(self):
+        # One query per burst of key events
+        if self.search_job is None:
+            self.search_job = self.root.after_idle(self.apply_search)
+    
+    def apply_search(self):
+        """Show only the index matches for the search box and filter.
+
+        Matches are fetched up to one window past the visible rows; scrolling
+        further fetches more (load_more_results).
+        """
+        self.search_job = None
+        query = self.search_entry.get().strip()
+        status = self.search_filter.get()
+        self.search_active = bool(query) or status != 'all'
+        if self.search_active:
+            view = self.task_view
+            self.search_limit = view.first + 2 * view.capacity
+            view.set_rows(self.core.search_tasks(query, status, self.search_limit))
+        else:
+            self.task_view.set_rows(self.core.tasks)
+    
+    def load_more_results(self):
+        """The view scrolled past the fetched matches; double the page"""
+        view = self.task_view
+        if not self.search_active or len(view.rows) < self.search_limit:
+            return  # Everything that matches is already shown
+        self.search_limit *= 2
+        view.extend_rows(self.core.search_tasks(self.search_entry.get().strip(),
+                                                self.search_filter.get(), self.search_limit))
+    
+    def clear_search(self):
+        self.search_entry.delete(0, tk.END)
+        self.search_filter.set('all')
+        self.apply_search()
+    
+    def refresh_task_list(self):
+        logger.debug("Refreshing task list with %s tasks", len(self.core.tasks))
+        # Full resets (load, clear, import, archive) only; single-task changes go
+        # through the view's diffs. The view is re-pointed right away because
+        # core.tasks is a new list and the next diff must index that one.
+        self.apply_search()
+    
+    def launch_app(self):
+        from tkinter import messagebox
+        app_name = self.app_entry.get().strip()
+        if app_name:
+            logger.info("Launching application: %s", app_name)
+            try:
+                self.launcher.launch(app_name)
+                logger.info("Successfully launched %s", app_name)
+                self.show_app_suggestions([])
+            except Exception as e:
+                logger.error("Failed to launch %s: %s", app_name, e)
+                messagebox.showerror("Error", f"Could not launch {app_name}: {str(e)}")
+        else:
+            logger.warning("No application name provided")
+    
+    def quick_launch_suggestions(self, typed):
+        """History matches first, then fuzzy matches from the program index"""
+        suggestions = self.launcher.suggest(typed, self.APP_SUGGESTIONS)
+        if typed.strip():
+            for target in self.app_index.search(typed, self.APP_SUGGESTIONS):
+                if target not in suggestions:
+                    suggestions.append(target)
+        return suggestions[:self.APP_SUGGESTIONS]
+    
+    def show_app_suggestions(self, suggestions):
+        self.app_suggestions = suggestions
+        self.app_suggestion_index = -1
+        self.app_suggestion_list.delete(0, tk.END)
+        if suggestions:
+            self.app_suggestion_list.insert(tk.END, *suggestions)
+            self.app_suggestion_list.config(height=len(suggestions))
+            if not self.app_suggestion_list.winfo_ismapped():
+                self.app_suggestion_list.pack(fill='x', padx=20, pady=(0, 15),
+                                              after=self.app_input_frame)
+        else:
+            self.app_suggestion_list.pack_forget()
+    
+    def on_app_entry_key(self, event):
+        """Refresh the suggestions and complete the typed command inline"""
+        typed = self.app_entry.get()
+        if event.keysym in ('BackSpace', 'Delete'):
+            self.show_app_suggestions(self.quick_launch_suggestions(typed) if typed.strip() else [])
+            return
+        if len(event.char) != 1 or not event.char.isprintable():
+            return
+        if self.app_entry.index('insert') != len(typed):
+            return  # Editing in the middle; don't rewrite the tail
+        suggestions = self.quick_launch_suggestions(typed)
+        self.show_app_suggestions(suggestions)
+        best = next((s for s in suggestions if s.lower().startswith(typed.lower())), None)
+        if best is not None and len(best) > len(typed):
+            self.app_entry.delete(0, tk.END)
+            self.app_entry.insert(0, typed + best[len(typed):])
+            self.app_entry.select_range(len(typed), tk.END)
+            self.app_entry.icursor(tk.END)
+    
+    def cycle_app_suggestion(self, step):
+        """Up/Down walk through the ranked suggestions for what was typed"""
+        if not self.app_suggestions:
+            self.show_app_suggestions(self.launcher.suggest('', self.APP_SUGGESTIONS))
+        if not self.app_suggestions:
+            return "break"
+        self.app_suggestion_index = (self.app_suggestion_index + step) % len(self.app_suggestions)
+        self.select_app_suggestion(self.app_suggestion_index)
+        return "break"
+    
+    def select_app_suggestion(self, index):
+        self.app_suggestion_list.selection_clear(0, tk.END)
+        self.app_suggestion_list.selection_set(index)
+        self.app_suggestion_list.see(index)
+        self.app_entry.delete(0, tk.END)
+        self.app_entry.insert(0, self.app_suggestions[index])
+        self.app_entry.select_range(0, tk.END)
+    
+    def on_app_suggestion_click(self, event):
+        selection = self.app_suggestion_list.curselection()
+        if selection:
+            self.app_suggestion_index = selection[0]
+            self.select_app_suggestion(selection[0])
+            self.app_entry.focus_set()
+    
+    def browse_app(self):
+        from tkinter import filedialog
+        logger.info("Opening file browser")
+        filename = filedialog.askopenfilename(
+            title="Select Application",
+            filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
+        )
+        if filename:
+            logger.info("Selected file: %s", filename)
+            self.app_entry.delete(0, tk.END)
+            self.app_entry.insert(0, filename)
+        else:
+            logger.info("File selection cancelled")
+    
+    def archive_completed(self):
+        self.core.archive_completed()
+        self.root.after(self.ARCHIVE_INTERVAL_MS, self.archive_completed)
+    
+    def save_tasks(self):
+        """Flush pending writes and close the task store (used on shutdown)"""
+        try:
+            self.core.close()
+        except Exception as e:
+            logger.error("Error saving tasks: %s", e)
+    
+def run(args, server=None, commands=()):
+    """Build the window and run the Tk main loop until it is closed.
+
+    `server` is the bound InstanceServer, if any; commands forwarded to it by
+    later launches are applied here. `commands` come from this launch's argv.
+    """
+    profiler = StartupProfiler(enabled=args.profile_startup, budget_ms=args.startup_budget)
+    profiler.mark('imports')
+    root = tk.Tk()
+    profiler.mark('tk_root')
+    app = FocusTool(root, profiler=profiler, lazy_ui=not args.eager_ui)
+    control = None
+
+    def start_control():
+        nonlocal control
+        from .control import ControlServer  # asyncio costs ~40 ms to import
+        control = ControlServer(app.core, root, server.address)
+        try:
+            control.start()
+            app.monitor.instrument(control, ['pump'], prefix='control.')
+        except OSError as e:
+            logger.error("Control API unavailable: %s", e)
+            control = None
+
+    if server is not None:
+        app.watch_instance(server)
+        if app.config.get('control_api', True):
+            # API clients only get in once the task list is loaded
+            app.core.when_loaded(start_control)
+    if commands:
+        root.after_idle(app.run_commands, list(commands))
+    
+    def on_closing():
+        logger.info("Application closing")
+        try:
+            if control is not None:
+                control.close()
+            if server is not None:
+                server.close()
+            app.frames.flush()
+            logger.info("Frame stats: %s", app.frames.stats())
+            app.monitor.stop()
+            app.config_watcher.stop()
+            logger.info("Latency: %s", app.monitor.summary())
+            if app.monitor.metrics_path:
+                app.monitor.export()
+            app.save_window_config() # Save window config on closing
+            app.save_tasks()
+            app.notifications.close()
+            if app.app_index is not None:
+                app.app_index.close()
+        except Exception as e:
+            logger.error("Error during cleanup: %s", e)
+        finally:
+            root.destroy()
+    
+    root.protocol("WM_DELETE_WINDOW", on_closing)
+    logger.info("Entering main loop")
+    root.mainloop()
+    logger.info("Application closed")
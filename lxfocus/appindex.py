@@ -0,0 +1,269 @@
+"""Background index of launchable programs for fuzzy Quick Launch search.
+
+The index scans the PATH directories (one level) and the folders listed in
+config `app_folders` (a few levels deep). It runs on a thread pool and is
+persisted in app_index.json. Each directory is stored with its mtime, so a
+refresh only lists the directories whose mtime changed. Searches run on the
+Tk thread against an immutable snapshot that a refresh swaps in when it is
+done.
+"""
+
+import bisect
+import itertools
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from .storage import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class IndexSnapshot:
+    """Immutable search structure over lowercased program names.
+
+    Names are kept shortest-first and also joined into one newline-separated
+    string, so a search is a few C-level scans (str.find and re.finditer)
+    instead of a Python loop over every name.
+    """
+    __slots__ = ('keys', 'targets', 'haystack', 'starts')
+
+    def __init__(self, items=()):
+        # Shortest names first, so equal scores prefer 'code' over 'codium-insiders'
+        items = sorted(((key.replace('\n', ' '), target) for key, target in items),
+                       key=lambda item: (len(item[0]), item[0]))
+        self.keys = [key for key, _ in items]
+        self.targets = [target for _, target in items]
+        # Leading newline so every name, the first included, follows one
+        self.haystack = '\n' + ''.join(key + '\n' for key in self.keys)
+        self.starts = list(itertools.accumulate((len(key) + 1 for key in self.keys), initial=1))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def line_of(self, offset):
+        return bisect.bisect_right(self.starts, offset) - 1
+
+
+class ExecutableIndex:
+    """Incrementally refreshed, persisted index of executables.
+
+    refresh() returns immediately. The first refresh also loads the saved
+    index, so nothing here touches the disk on the Tk thread. Directory
+    listings run on a pool of `max_workers` threads. search() only reads the
+    current snapshot, so it is safe to call while a refresh runs.
+    """
+
+    VERSION = 1
+    APP_FOLDER_DEPTH = 3
+    CANDIDATES_PER_RESULT = 8
+    WINDOWS_APP_EXTENSIONS = ('.lnk',)
+
+    def __init__(self, path='app_index.json', app_folders=(), max_workers=4):
+        self.path = path
+        self.set_app_folders(app_folders)
+        # One coordinator thread keeps refreshes in order; listings fan out to the pool
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='app-index')
+        self.scan_pool = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='app-index-scan')
+        self.dirs = {}  # directory -> {'mtime', 'files', 'dirs'}
+        self.snapshot = IndexSnapshot()
+        self.loaded = False
+        self.refreshing = None
+        self.scanned = 0  # Directories listed by the last refresh (0 = all cached)
+
+    def set_app_folders(self, app_folders):
+        self.app_folders = tuple(os.path.abspath(os.path.expanduser(folder))
+                                 for folder in app_folders)
+
+    # Persistence
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.error("Error loading app index: %s", e)
+            return
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            logger.warning("Ignoring app index with unknown format")
+            return
+        self.dirs = {directory: record for directory, record in data.get('dirs', {}).items()
+                     if isinstance(record, dict) and isinstance(record.get('files'), list)
+                     and isinstance(record.get('dirs'), list)}
+        self.snapshot = self.build_snapshot(self.dirs)
+        logger.info("Loaded app index with %s programs", len(self.snapshot))
+
+    def save(self, dirs):
+        try:
+            write_json_atomic(self.path, {'version': self.VERSION, 'dirs': dirs},
+                              separators=(',', ':'))
+        except Exception as e:
+            logger.error("Error saving app index: %s", e)
+
+    # Scanning
+
+    @staticmethod
+    def path_directories():
+        seen = []
+        for directory in os.environ.get('PATH', '').split(os.pathsep):
+            directory = os.path.abspath(os.path.expanduser(directory)) if directory else ''
+            if directory and directory not in seen:
+                seen.append(directory)
+        return seen
+
+    @staticmethod
+    def executable_extensions():
+        if os.name != 'nt':
+            return None
+        return tuple(ext.lower() for ext in
+                     os.environ.get('PATHEXT', '.COM;.EXE;.BAT;.CMD').split(';') if ext)
+
+    def is_launchable(self, entry, extensions, app_folder):
+        if extensions is not None:
+            name = entry.name.lower()
+            return name.endswith(extensions) or (app_folder and name.endswith(self.WINDOWS_APP_EXTENSIONS))
+        try:
+            return entry.is_file() and entry.stat().st_mode & 0o111 != 0
+        except OSError:
+            return False
+
+    def scan_directory(self, directory, depth, previous, scanned, extensions, app_folder):
+        """Records for directory and `depth` levels below it, reusing unchanged ones"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return {}
+        record = previous.get(directory)
+        if record is None or record.get('mtime') != mtime:
+            files, subdirs = [], []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if depth > 0 and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif self.is_launchable(entry, extensions, app_folder):
+                            files.append(entry.name)
+            except OSError as e:
+                logger.debug("Cannot list %s: %s", directory, e)
+                return {}
+            record = {'mtime': mtime, 'files': sorted(files), 'dirs': sorted(subdirs)}
+            scanned.append(directory)
+        records = {directory: record}
+        if depth > 0:
+            for name in record['dirs']:
+                records.update(self.scan_directory(os.path.join(directory, name), depth - 1,
+                                                   previous, scanned, extensions, app_folder))
+        return records
+
+    def refresh(self):
+        """Start a background rescan unless one is pending; returns its future"""
+        if self.refreshing is None or self.refreshing.done():
+            self.refreshing = self.executor.submit(self.run_refresh)
+        return self.refreshing
+
+    def run_refresh(self):
+        if not self.loaded:
+            self.load()
+            self.loaded = True
+        previous = dict(self.dirs)
+        extensions = self.executable_extensions()
+        roots = [(directory, 0, False) for directory in self.path_directories()]
+        roots += [(folder, self.APP_FOLDER_DEPTH, True) for folder in self.app_folders]
+        scanned = []
+        scans = [self.scan_pool.submit(self.scan_directory, directory, depth, previous,
+                                       scanned, extensions, app_folder)
+                 for directory, depth, app_folder in roots]
+        return self.finish_refresh(scans, previous, scanned)
+
+    def finish_refresh(self, scans, previous, scanned):
+        dirs = {}
+        for future in scans:
+            dirs.update(future.result())
+        self.scanned = len(scanned)
+        self.dirs = dirs
+        if scanned or dirs.keys() != previous.keys():
+            self.snapshot = self.build_snapshot(dirs)
+            self.save(dirs)
+        logger.info("App index: %s programs, %s of %s directories rescanned",
+                    len(self.snapshot), len(scanned), len(dirs))
+        return len(self.snapshot)
+
+    def build_snapshot(self, dirs):
+        items = []
+        seen = set()
+        path_dirs = self.path_directories()
+        strip_ext = os.name == 'nt'
+        # PATH order decides which copy of a name wins, as in shutil.which
+        for directory in path_dirs:
+            for name in dirs.get(directory, {}).get('files', ()):
+                key = (os.path.splitext(name)[0] if strip_ext else name).lower()
+                if key not in seen:
+                    seen.add(key)
+                    items.append((key, name))
+        path_dirs = set(path_dirs)
+        # App folder entries launch by full path
+        for directory, record in dirs.items():
+            if directory not in path_dirs:
+                items.extend((os.path.splitext(name)[0].lower(), os.path.join(directory, name))
+                             for name in record.get('files', ()))
+        return IndexSnapshot(items)
+
+    # Searching
+
+    def search(self, query, limit=8):
+        """Fuzzy matches for query, best first.
+
+        Prefix matches rank first, then matches at a word start ('-code'),
+        then other substrings, then subsequences ('vsc' in 'visual-studio-code').
+        Subsequences are ranked by how tightly they match. Ties go to the
+        shorter name. Each tier stops after a bounded number of candidates, so
+        a one-letter query costs the same as a long one.
+        """
+        query = query.strip().lower().replace('\n', ' ')
+        snapshot = self.snapshot
+        if not query or not len(snapshot):
+            return []
+        haystack, keys = snapshot.haystack, snapshot.keys
+        cap = limit * self.CANDIDATES_PER_RESULT
+        ranked = {}
+        needle = '\n' + query
+        position = haystack.find(needle)
+        while position != -1:
+            index = snapshot.line_of(position + 1)
+            ranked[index] = (0, index)
+            if len(ranked) >= limit:
+                return [snapshot.targets[i] for _, i in sorted(ranked.values())]
+            position = haystack.find(needle, position + 1)
+        found = 0
+        position = haystack.find(query)
+        while position != -1 and found < cap:
+            index = snapshot.line_of(position)
+            if index not in ranked:
+                ranked[index] = (1 if not haystack[position - 1].isalnum() else 2, index)
+                found += 1
+            position = haystack.find(query, position + 1)
+        if len(ranked) < limit and len(query) > 1:
+            found = 0
+            # 'a[^b\n]*b[^c\n]*c': each gap stops at the next wanted letter, so
+            # the regex never backtracks through a line
+            pattern = re.compile(re.escape(query[0]) + ''.join(
+                f'[^{re.escape(ch)}\n]*{re.escape(ch)}' for ch in query[1:]))
+            for match in pattern.finditer(haystack):
+                index = snapshot.line_of(match.start())
+                if index in ranked:
+                    continue
+                spread = (match.end() - match.start() - len(query)) / len(keys[index])
+                ranked[index] = (3 + spread, index)
+                found += 1
+                if found >= cap:
+                    break
+        return [snapshot.targets[i] for _, i in sorted(ranked.values())[:limit]]
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.scan_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,118 @@
+"""Cold storage for old completed tasks"""
+
+import gzip
+import itertools
+import json
+import logging
+import os
+import threading
+
+from .storage import write_json_atomic
+from .tasks import Task
+
+logger = logging.getLogger(__name__)
+
+class TaskArchive:
+    """Cold storage for old completed tasks: gzip'd NDJSON segments plus an index.
+
+    Each archive() call appends one gzip member to the current segment, so
+    segments are append-only and a crash can at worst lose the batch being
+    written. index.json records, per segment, the created-time range and
+    count, and for every member its byte offset. Queries skip segments and
+    members outside the requested range and decompress only the rest.
+    """
+
+    def __init__(self, directory='archive', segment_max_tasks=10000):
+        self.directory = directory
+        self.index_path = os.path.join(directory, 'index.json')
+        self.segment_max_tasks = segment_max_tasks
+        self.lock = threading.Lock()
+        self.segments = self.read_index()
+
+    def read_index(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f).get('segments', [])
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.error("Error reading archive index: %s", e)
+            return []
+
+    def count(self):
+        return sum(segment['count'] for segment in self.segments)
+
+    def archive(self, tasks):
+        """Append tasks (Task objects) to the current segment; returns the count"""
+        tasks = sorted(tasks, key=lambda task: task.created)
+        if not tasks:
+            return 0
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            start = 0
+            while start < len(tasks):
+                segment = self.segments[-1] if self.segments else None
+                if segment is None or segment['count'] >= self.segment_max_tasks:
+                    segment = {'file': f"segment-{len(self.segments) + 1:05d}.ndjson.gz",
+                               'count': 0, 'first_created': None, 'last_created': None,
+                               'members': []}
+                    self.segments.append(segment)
+                room = self.segment_max_tasks - segment['count']
+                self.append_member(segment, tasks[start:start + room])
+                start += room
+            write_json_atomic(self.index_path, {'segments': self.segments}, separators=(',', ':'))
+        logger.info("Archived %s tasks; %s segments", len(tasks), len(self.segments))
+        return len(tasks)
+
+    def append_member(self, segment, tasks):
+        """Append tasks as one gzip member and record its offset and range"""
+        path = os.path.join(self.directory, segment['file'])
+        payload = ''.join(json.dumps(task.to_dict(), ensure_ascii=False,
+                                     separators=(',', ':')) + '\n' for task in tasks)
+        with open(path, 'ab') as f:
+            offset = f.tell()
+            f.write(gzip.compress(payload.encode('utf-8')))
+            f.flush()
+            os.fsync(f.fileno())
+        first, last = tasks[0].created, tasks[-1].created
+        segment['members'].append({'offset': offset, 'count': len(tasks),
+                                   'first_created': first, 'last_created': last})
+        segment['count'] += len(tasks)
+        if segment['first_created'] is None or first < segment['first_created']:
+            segment['first_created'] = first
+        if segment['last_created'] is None or last > segment['last_created']:
+            segment['last_created'] = last
+
+    @staticmethod
+    def overlaps(entry, created_after, created_before):
+        if created_after is not None and entry['last_created'] < created_after:
+            return False
+        if created_before is not None and entry['first_created'] >= created_before:
+            return False
+        return True
+
+    def query(self, created_after=None, created_before=None):
+        """Stream archived tasks in the [created_after, created_before) range"""
+        if created_after is not None:
+            created_after = Task.to_epoch(created_after)
+        if created_before is not None:
+            created_before = Task.to_epoch(created_before)
+        with self.lock:
+            segments = [dict(segment, members=list(segment['members'])) for segment in self.segments]
+        for segment in segments:
+            if not segment['count'] or not self.overlaps(segment, created_after, created_before):
+                continue
+            with open(os.path.join(self.directory, segment['file']), 'rb') as f:
+                for member in segment['members']:
+                    if not self.overlaps(member, created_after, created_before):
+                        continue
+                    f.seek(member['offset'])
+                    # GzipFile would run on into the following members; stop after this one's lines
+                    lines = gzip.GzipFile(fileobj=f, mode='rb')
+                    for line in itertools.islice(lines, member['count']):
+                        task = Task.from_dict(json.loads(line))
+                        if created_after is not None and task.created < created_after:
+                            continue
+                        if created_before is not None and task.created >= created_before:
+                            continue
+                        yield task
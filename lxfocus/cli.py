@@ -0,0 +1,73 @@
+"""Command line entry point.
+
+Checks for a running instance before anything heavy is imported, so a second
+launch that only forwards its command exits in milliseconds.
+"""
+
+import argparse
+import logging
+import sys
+
+from .instance import claim_instance, parse_command
+from .logs import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="LOGiiKx's Nifty Focus Tool",
+        epilog="commands: add task TEXT | start [MINUTES] | stop | reset | show. "
+               "If Focus Tool is already running in this folder, the command is "
+               "sent to that window instead of opening a new one.")
+    parser.add_argument('command', nargs='*', help='optional command, e.g. "add task Write report"')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='print a per-phase timing breakdown up to first paint')
+    parser.add_argument('--startup-budget', type=float, default=None, metavar='MS',
+                        help='flag the startup profile if first paint exceeds MS milliseconds')
+    parser.add_argument('--eager-ui', action='store_true',
+                        help='build every feature box before the first paint')
+    parser.add_argument('--new-instance', action='store_true',
+                        help='always open a new window, even if one is already running')
+    args = parser.parse_args(argv)
+    try:
+        args.commands = parse_command(args.command)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = None
+    if not args.new_instance:
+        try:
+            server, reply = claim_instance(args.commands)
+        except OSError as e:
+            # A broken runtime dir should never stop the app from starting
+            reply = None
+            print(f"Single-instance mode unavailable: {e}", file=sys.stderr)
+        if reply is not None:
+            if not reply.get('ok'):
+                print(f"Focus Tool is running but refused the command: {reply.get('error')}",
+                      file=sys.stderr)
+                return 1
+            return 0
+    try:
+        # Logging (and focus_tool.log) only starts when the app actually runs
+        configure_logging()
+        logger.info("Starting Focus Tool application")
+        from .app import run
+        commands = [c for c in args.commands if c['action'] != 'show']
+        run(args, server=server, commands=commands)
+    except Exception as e:
+        logger.error("Critical error in main: %s", e)
+        import traceback
+        traceback.print_exc()
+        print(f"\nCritical error: {e}")
+        print("Press Enter to exit...")
+        input()
+        sys.exit(1)
+    finally:
+        if server is not None:
+            server.close()
+    return 0
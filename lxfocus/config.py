@@ -0,0 +1,229 @@
+"""config.json: validated, cached, and hot-reloadable"""
+
+import json
+import logging
+import os
+import re
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+class AppConfig:
+    """Validated, read-only view of config.json.
+
+    Every known key is checked against DEFAULTS: a missing or mistyped value
+    falls back to the default (with a warning), and values outside RANGES are
+    clamped. Nested sections become read-only mappings, so one instance can
+    be shared and cached safely. diff() lists the dotted keys that differ
+    between two configs, which is what hot reload applies.
+    """
+
+    DEFAULTS = {
+        'timer_duration': 50 * 60,
+        'break_duration': 5 * 60,
+        'auto_cycle': True,
+        'pomodoro_cycles': 4,
+        'default_app': 'notepad.exe',
+        'theme': 'clam',
+        'window_size': {'width': 450, 'height': 700, 'min_width': 400, 'min_height': 600},
+        'colors': {
+            'background': '#1e1e1e',
+            'frame_background': '#2d2d2d',
+            'accent': '#4a9eff',
+            'text': '#ffffff',
+            'secondary_text': '#b0b0b0',
+            'success': '#28a745',
+            'danger': '#dc3545',
+            'warning': '#ffc107',
+            'info': '#17a2b8',
+        },
+        'fonts': {'title': 'Segoe UI', 'body': 'Segoe UI', 'monospace': 'Consolas'},
+        'auto_save_interval': 30,
+        'sound_notifications': True,
+        'archive_after_days': 30,
+        'control_api': True,
+        'app_folders': [],
+        'transparency': 0.95,
+        'glass_effect': True,
+    }
+
+    RANGES = {
+        'timer_duration': (60, 24 * 60 * 60),
+        'break_duration': (0, 24 * 60 * 60),
+        'pomodoro_cycles': (1, 100),
+        'auto_save_interval': (1, 3600),
+        'archive_after_days': (0, 36500),
+        'transparency': (0.2, 1.0),
+        'window_size.width': (200, 10000),
+        'window_size.height': (200, 10000),
+        'window_size.min_width': (200, 10000),
+        'window_size.min_height': (200, 10000),
+    }
+
+    COLOR = re.compile(r'^#[0-9a-fA-F]{6}$')
+
+    __slots__ = ('values', 'path', 'mtime')
+
+    def __init__(self, data=None, path=None, mtime=None):
+        values = self.validate(data or {}, self.DEFAULTS)
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, 'path', path)
+        object.__setattr__(self, 'mtime', mtime)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AppConfig is immutable")
+
+    @classmethod
+    def validate(cls, data, defaults, prefix=''):
+        values = {}
+        for key, default in defaults.items():
+            name = prefix + key
+            value = data.get(key, default)
+            if isinstance(default, dict):
+                value = cls.validate(value if isinstance(value, dict) else {}, default, name + '.')
+            elif isinstance(default, bool):
+                if not isinstance(value, bool):
+                    logger.warning("Config %s should be true/false; using %s", name, default)
+                    value = default
+            elif isinstance(default, (int, float)):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    logger.warning("Config %s should be a number; using %s", name, default)
+                    value = default
+                low, high = cls.RANGES.get(name, (None, None))
+                if low is not None and not low <= value <= high:
+                    logger.warning("Config %s=%s out of range [%s, %s]", name, value, low, high)
+                    value = min(max(value, low), high)
+            elif isinstance(default, (list, tuple)):
+                if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) for v in value):
+                    logger.warning("Config %s should be a list of text; using %s", name, list(default))
+                    value = default
+                value = tuple(value)
+            elif prefix == 'colors.':
+                if not isinstance(value, str) or not cls.COLOR.match(value):
+                    logger.warning("Config %s should be a #rrggbb color; using %s", name, default)
+                    value = default
+                value = value.lower()
+            elif not isinstance(value, str) or not value.strip():
+                logger.warning("Config %s should be text; using %s", name, default)
+                value = default
+            values[key] = value
+        # Unknown keys are kept (read-only) so newer settings survive older code
+        for key, value in data.items():
+            if key not in defaults:
+                values[key] = value
+        return MappingProxyType(values)
+
+    @classmethod
+    def parse(cls, path='config.json'):
+        """Parse and validate path; raises if the file is not a JSON object"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return cls({}, path, None)
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("top level must be an object")
+        return cls(data, path, mtime)
+
+    @classmethod
+    def load(cls, path='config.json'):
+        """Like parse(), but an unreadable file gives the defaults"""
+        try:
+            return cls.parse(path)
+        except Exception as e:
+            logger.error("Error reading %s: %s", path, e)
+            return cls({}, path, None)
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def color(self, name):
+        return self.values['colors'][name]
+
+    def font(self, role):
+        return self.values['fonts'][role]
+
+    def flatten(self, values=None, prefix=''):
+        flat = {}
+        for key, value in (self.values if values is None else values).items():
+            if isinstance(value, MappingProxyType):
+                flat.update(self.flatten(value, prefix + key + '.'))
+            else:
+                flat[prefix + key] = value
+        return flat
+
+    def diff(self, other):
+        """Dotted keys whose values differ from other"""
+        mine, theirs = self.flatten(), other.flatten()
+        return {key for key in mine.keys() | theirs.keys() if mine.get(key) != theirs.get(key)}
+
+_app_config = None
+
+def load_app_config(path='config.json'):
+    """Validated config, parsed once per process and cached"""
+    global _app_config
+    if _app_config is None or _app_config.path != path:
+        _app_config = AppConfig.load(path)
+    return _app_config
+
+_rejected_config_mtime = None
+
+def reload_app_config(path='config.json'):
+    """Re-read the file if its mtime changed; returns (config, changed keys).
+
+    A half-written or broken file keeps the current config until it is
+    saved again.
+    """
+    global _app_config, _rejected_config_mtime
+    current = load_app_config(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime == current.mtime or mtime == _rejected_config_mtime:
+        return current, set()
+    try:
+        fresh = AppConfig.parse(path)
+    except Exception as e:
+        logger.error("Ignoring invalid %s, keeping current settings: %s", path, e)
+        _rejected_config_mtime = mtime
+        return current, set()
+    changed = fresh.diff(current)
+    _app_config = fresh
+    if changed:
+        logger.info("Reloaded %s; changed: %s", path, ", ".join(sorted(changed)))
+    return fresh, changed
+
+class ConfigWatcher:
+    """Polls config.json's mtime from the Tk loop and reports changed settings"""
+
+    def __init__(self, root, on_change, path='config.json', interval_ms=2000):
+        self.root = root
+        self.on_change = on_change
+        self.path = path
+        self.interval_ms = interval_ms
+        self.after_id = None
+
+    def start(self):
+        self.after_id = self.root.after(self.interval_ms, self.check)
+
+    def check(self):
+        try:
+            config, changed = reload_app_config(self.path)
+            if changed:
+                self.on_change(config, changed)
+        except Exception as e:
+            logger.error("Error applying config change: %s", e)
+        self.start()
+
+    def stop(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
@@ -0,0 +1,384 @@
+"""Local JSON-RPC control API for scripts and editor plugins.
+
+The server is an asyncio event loop that never runs on its own: the Tk loop
+pumps it one selector pass at a time from after() callbacks, so requests are
+handled on the Tk thread and can call FocusCore directly. Pumping backs off
+while idle. On POSIX, Tk also watches the sockets with createfilehandler, so
+an idle app wakes on the first byte instead of polling.
+
+Transport is newline-delimited JSON-RPC 2.0 over a Unix-domain socket next to
+the single-instance socket. On Windows it is 127.0.0.1 on a random port, and
+clients must send `auth` with the token from the discovery file first.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import secrets
+
+from .instance import InstanceAddress, write_private
+
+logger = logging.getLogger(__name__)
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+UNAUTHORIZED = -32001
+
+EVENTS = ('tasks_reset', 'task_added', 'task_updated', 'task_removed', 'timer_tick',
+          'timer_started', 'timer_stopped', 'timer_complete', 'phase_changed',
+          'break_complete', 'timer_done')
+
+
+class RPCError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def discovery_path(address=None):
+    """JSON file telling clients where the control API of this folder listens"""
+    return (address or InstanceAddress()).prefix + '.control.json'
+
+
+class ControlConnection(asyncio.Protocol):
+    """One client: splits lines, answers requests, forwards subscribed events"""
+
+    MAX_LINE = 1 << 20
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.sock = None
+        self.buffer = b''
+        self.authorized = server.token is None
+        self.subscriptions = {}
+        self.dropped = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.sock = transport.get_extra_info('socket')
+        self.server.connections.add(self)
+        self.server.watch(self.sock)
+
+    def connection_lost(self, exc):
+        self.server.connections.discard(self)
+        # asyncio closes the socket after this returns, so the fd is still ours
+        self.server.unwatch(self.sock)
+        for event, callback in self.subscriptions.items():
+            self.server.core.unsubscribe(event, callback)
+        self.subscriptions.clear()
+
+    def data_received(self, data):
+        self.server.busy = True
+        self.buffer += data
+        *lines, self.buffer = self.buffer.split(b'\n')
+        if len(self.buffer) > self.MAX_LINE:
+            self.send({'jsonrpc': '2.0', 'id': None,
+                       'error': {'code': INVALID_REQUEST, 'message': 'request too large'}})
+            self.transport.close()
+            return
+        replies = [reply for reply in map(self.handle_line, lines) if reply is not None]
+        if replies:
+            self.transport.write(b''.join(json.dumps(reply).encode('utf-8') + b'\n'
+                                          for reply in replies))
+
+    def handle_line(self, line):
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return error_reply(None, PARSE_ERROR, 'parse error')
+        if isinstance(message, list):
+            # Batch: one reply list, notifications excluded
+            replies = [reply for reply in map(self.handle_request, message) if reply is not None]
+            return replies or None
+        return self.handle_request(message)
+
+    def handle_request(self, request):
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' \
+                or not isinstance(request.get('method'), str):
+            return error_reply(None, INVALID_REQUEST, 'invalid request')
+        request_id = request.get('id')
+        params = request.get('params', {})
+        try:
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, 'params must be an object')
+            result = self.server.call(self, request['method'], params)
+        except RPCError as e:
+            return error_reply(request_id, e.code, str(e))
+        except Exception as e:
+            logger.exception("Control API %s failed", request['method'])
+            return error_reply(request_id, INTERNAL_ERROR, f'internal error: {e}')
+        if 'id' not in request:
+            return None
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    def send(self, message):
+        if self.transport is None or self.transport.is_closing():
+            return
+        self.transport.write(json.dumps(message).encode('utf-8') + b'\n')
+
+    def notify(self, event, payload):
+        # A client that stops reading loses events rather than growing memory
+        if self.transport.get_write_buffer_size() > self.server.MAX_BUFFER:
+            if not self.dropped:
+                logger.warning("Control client is not reading; dropping events")
+            self.dropped += 1
+            return
+        self.dropped = 0
+        self.send({'jsonrpc': '2.0', 'method': 'event',
+                   'params': dict(event_params(payload), event=event)})
+
+
+def error_reply(request_id, code, message):
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+def event_params(payload):
+    params = {}
+    for key, value in payload.items():
+        if key == 'task':
+            params[key] = value.to_dict()
+        elif key == 'tasks':
+            params['count'] = len(value)
+        else:
+            params[key] = value
+    return params
+
+
+class ControlServer:
+    """JSON-RPC over a local socket, served from the Tk (or headless) loop.
+
+    `scheduler` needs Tk-style after/after_cancel; if it also has a `tk`
+    attribute with createfilehandler (a Tk root on POSIX), sockets wake the
+    pump directly and the idle backoff can be long.
+    """
+
+    MIN_PUMP_MS = 1
+    MAX_PUMP_MS = 50
+    MAX_IDLE_PUMP_MS = 500  # With file handlers, only a safety net
+    MAX_BUFFER = 1 << 20
+
+    def __init__(self, core, scheduler, address=None):
+        self.core = core
+        self.scheduler = scheduler
+        self.address = address or InstanceAddress()
+        self.loop = None
+        self.server = None
+        self.connections = set()
+        self.token = None
+        self.endpoint = None
+        self.busy = False
+        self.delay = self.MIN_PUMP_MS
+        self.pump_id = None
+        tk = getattr(scheduler, 'tk', None)
+        self.filehandlers = tk if os.name != 'nt' and hasattr(tk, 'createfilehandler') else None
+        self.signatures = {}  # method -> inspect.Signature, filled on first call
+        self.methods = {
+            'auth': self.rpc_auth,
+            'tasks.list': self.rpc_tasks_list,
+            'tasks.get': self.rpc_tasks_get,
+            'tasks.add': self.rpc_tasks_add,
+            'tasks.update': self.rpc_tasks_update,
+            'tasks.delete': self.rpc_tasks_delete,
+            'timer.status': self.rpc_timer_status,
+            'timer.start': self.rpc_timer_start,
+            'timer.stop': self.rpc_timer_stop,
+            'timer.reset': self.rpc_timer_reset,
+            'events.subscribe': self.rpc_subscribe,
+            'events.unsubscribe': self.rpc_unsubscribe,
+        }
+
+    def start(self):
+        """Bind the socket, publish the discovery file and start pumping"""
+        self.loop = asyncio.new_event_loop()
+        if os.name == 'nt':
+            self.token = secrets.token_hex(16)
+            self.server = self.loop.run_until_complete(self.loop.create_server(
+                lambda: ControlConnection(self), '127.0.0.1', 0))
+            port = self.server.sockets[0].getsockname()[1]
+            self.endpoint = {'host': '127.0.0.1', 'port': port, 'token': self.token}
+        else:
+            path = self.address.prefix + '.control.sock'
+            if os.path.exists(path):
+                os.unlink(path)  # We hold the single-instance socket, so it is stale
+            self.server = self.loop.run_until_complete(self.loop.create_unix_server(
+                lambda: ControlConnection(self), path))
+            self.endpoint = {'path': path}
+        write_private(discovery_path(self.address),
+                      json.dumps(dict(self.endpoint, pid=os.getpid())).encode('utf-8'))
+        for sock in self.server.sockets:
+            self.watch(sock)
+        logger.info("Control API listening on %s", self.endpoint.get('path') or self.endpoint['port'])
+        self.schedule(self.MIN_PUMP_MS)
+        return self.endpoint
+
+    def watch(self, sock):
+        if self.filehandlers is not None and sock is not None:
+            import tkinter
+            self.filehandlers.createfilehandler(sock.fileno(), tkinter.READABLE, self.on_readable)
+
+    def unwatch(self, sock):
+        if self.filehandlers is not None and sock is not None and sock.fileno() >= 0:
+            self.filehandlers.deletefilehandler(sock.fileno())
+
+    def on_readable(self, fd, mask):
+        self.busy = True
+        self.pump()
+
+    def schedule(self, delay):
+        if self.pump_id is not None:
+            self.scheduler.after_cancel(self.pump_id)
+        self.pump_id = self.scheduler.after(delay, self.pump)
+
+    def pump(self):
+        """Run one selector pass of the asyncio loop, then back off if idle"""
+        self.pump_id = None
+        if self.loop is None or self.loop.is_running():
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        pending_writes = any(c.transport.get_write_buffer_size() for c in self.connections)
+        if self.busy or pending_writes:
+            self.delay = self.MIN_PUMP_MS
+        else:
+            ceiling = self.MAX_IDLE_PUMP_MS if self.filehandlers is not None else self.MAX_PUMP_MS
+            self.delay = min(self.delay * 2, ceiling)
+        self.busy = False
+        self.schedule(self.delay)
+
+    def close(self):
+        if self.loop is None:
+            return
+        if self.pump_id is not None:
+            self.scheduler.after_cancel(self.pump_id)
+            self.pump_id = None
+        for sock in self.server.sockets:
+            self.unwatch(sock)
+        for connection in list(self.connections):
+            connection.transport.close()
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        self.loop.close()
+        self.loop = None
+        for path in (discovery_path(self.address), self.endpoint.get('path')):
+            if path:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    # Dispatch
+
+    def call(self, connection, method, params):
+        handler = self.methods.get(method)
+        if handler is None:
+            raise RPCError(METHOD_NOT_FOUND, f'unknown method {method}')
+        if not connection.authorized and method != 'auth':
+            raise RPCError(UNAUTHORIZED, 'call auth with the token first')
+        signature = self.signatures.get(method)
+        if signature is None:
+            signature = self.signatures[method] = inspect.signature(handler)
+        try:
+            # Only a mismatch with the signature is the caller's fault; a
+            # TypeError from inside the handler is a bug and reported as one
+            signature.bind(connection, **params)
+        except TypeError as e:
+            raise RPCError(INVALID_PARAMS, str(e)) from None
+        return handler(connection, **params)
+
+    def task_or_error(self, task_id):
+        if not isinstance(task_id, int):
+            raise RPCError(INVALID_PARAMS, 'id must be an integer')
+        task = self.core.search_index.tasks.get(task_id)
+        if task is None:
+            raise RPCError(INVALID_PARAMS, f'no task with id {task_id}')
+        return task
+
+    def rpc_auth(self, connection, token):
+        if self.token is not None and not secrets.compare_digest(str(token), self.token):
+            raise RPCError(UNAUTHORIZED, 'bad token')
+        connection.authorized = True
+        return True
+
+    def rpc_tasks_list(self, connection, status='all', query='', limit=None):
+        if status not in ('all', 'open', 'done'):
+            raise RPCError(INVALID_PARAMS, "status must be 'all', 'open' or 'done'")
+        if query:
+            # The search index calls finished tasks 'completed'
+            tasks = self.core.search_tasks(query, 'completed' if status == 'done' else status, limit)
+        else:
+            tasks = [task for task in self.core.tasks
+                     if status == 'all' or task.completed == (status == 'done')]
+            tasks = tasks[:limit] if limit is not None else tasks
+        return [task.to_dict() for task in tasks]
+
+    def rpc_tasks_get(self, connection, id):
+        return self.task_or_error(id).to_dict()
+
+    def rpc_tasks_add(self, connection, text):
+        task = self.core.add_task(str(text))
+        if task is None:
+            raise RPCError(INVALID_PARAMS, 'text must not be empty')
+        return task.to_dict()
+
+    def rpc_tasks_update(self, connection, id, text=None, completed=None):
+        task = self.task_or_error(id)
+        if completed is not None and not isinstance(completed, bool):
+            # No coercion: bool('false') would complete the task
+            raise RPCError(INVALID_PARAMS, 'completed must be true or false')
+        if text is not None and self.core.edit_task(id, str(text)) is None:
+            raise RPCError(INVALID_PARAMS, 'text must not be empty')
+        if completed is not None and completed != task.completed:
+            self.core.set_completed(id, completed)
+        return task.to_dict()
+
+    def rpc_tasks_delete(self, connection, id):
+        self.task_or_error(id)
+        return self.core.delete_task(id).to_dict()
+
+    def rpc_timer_status(self, connection):
+        core = self.core
+        return {'running': core.timer.running, 'remaining': core.timer.display_seconds(),
+                'phase': core.phase, 'minutes': core.timer_minutes,
+                'completed_cycles': core.completed_cycles, 'cycles': core.cycles}
+
+    def rpc_timer_start(self, connection, minutes=None):
+        if minutes is not None:
+            if not isinstance(minutes, int) or not 1 <= minutes <= 24 * 60:
+                raise RPCError(INVALID_PARAMS, 'minutes must be an integer from 1 to 1440')
+            self.core.set_timer(minutes)
+        self.core.start_timer()
+        return self.rpc_timer_status(connection)
+
+    def rpc_timer_stop(self, connection):
+        self.core.stop_timer()
+        return self.rpc_timer_status(connection)
+
+    def rpc_timer_reset(self, connection):
+        self.core.reset_timer()
+        return self.rpc_timer_status(connection)
+
+    def rpc_subscribe(self, connection, events=('timer_tick',)):
+        unknown = [event for event in events if event not in EVENTS]
+        if unknown:
+            raise RPCError(INVALID_PARAMS, f"unknown events {unknown}; expected some of {list(EVENTS)}")
+        for event in events:
+            if event not in connection.subscriptions:
+                callback = lambda _event=event, **payload: connection.notify(_event, payload)
+                connection.subscriptions[event] = self.core.subscribe(event, callback)
+        return sorted(connection.subscriptions)
+
+    def rpc_unsubscribe(self, connection, events=None):
+        for event in list(connection.subscriptions if events is None else events):
+            callback = connection.subscriptions.pop(event, None)
+            if callback is not None:
+                self.core.unsubscribe(event, callback)
+        return sorted(connection.subscriptions)
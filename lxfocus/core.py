@@ -0,0 +1,362 @@
+"""Headless task/timer engine shared by the UI, the benchmark and any other front-end"""
+
+import logging
+import time
+
+from .archive import TaskArchive
+from .config import load_app_config
+from .search import TaskSearchIndex
+from .storage import PersistenceScheduler, create_task_store
+from .tasks import chunked, export_tasks, iter_task_file, make_task
+from .timers import HeadlessScheduler, TimerEngine
+
+logger = logging.getLogger(__name__)
+
+class FocusCore:
+    """UI-independent task, timer and persistence engine.
+
+    All state changes go through methods here and are announced to observers
+    registered with subscribe(). Events and their keyword payloads:
+
+        tasks_reset      tasks
+        task_added       index, task
+        task_updated     index, task
+        task_removed     index, task
+        timer_tick       remaining
+        timer_started    remaining
+        timer_stopped    remaining
+        timer_complete   minutes
+        phase_changed    phase, remaining
+        break_complete   cycle
+        timer_done       name
+
+    `scheduler` is anything with Tk-style after/after_cancel (a Tk root or a
+    HeadlessScheduler); tasks are addressed by id, with an optional list
+    index hint to avoid a search.
+    """
+
+    DEFAULT_MINUTES = 50
+    DEFAULT_BREAK_SECONDS = 5 * 60
+    DEFAULT_CYCLES = 4
+
+    def __init__(self, scheduler=None, store=None, config=None):
+        self.scheduler = scheduler or HeadlessScheduler()
+        self.config = load_app_config() if config is None else config
+        self.store = store or create_task_store()
+        self.persistence = PersistenceScheduler(self.scheduler, self.store,
+                                                interval=self.config.get('auto_save_interval', 30))
+        self.tasks = []
+        self.loaded = False
+        self.load_callbacks = []
+        self.search_index = TaskSearchIndex()
+        self.archive = TaskArchive()
+        self.observers = {}
+        # Every countdown (focus/break clock plus any named timers) shares one heap
+        self.timers = TimerEngine(self.scheduler)
+        self.apply_config(self.config)
+        self.phase = 'focus'
+        self.completed_cycles = 0
+        self.timer_minutes = self.default_minutes  # Focus length, for the completion message
+        self.timer = self.timers.create('focus', self.timer_minutes * 60,
+                                        on_tick=self.on_timer_tick,
+                                        on_complete=self.on_timer_complete)
+
+    def apply_config(self, config):
+        """Take timer, archive and save settings from config (also on hot reload).
+
+        A running session keeps its length; a new default applies from the
+        next reset.
+        """
+        self.config = config
+        self.persistence.interval = max(1.0, float(config.get('auto_save_interval', 30)))
+        # Completed tasks older than this many days leave the hot list (0 keeps them)
+        self.archive_after_days = config.get('archive_after_days', 30)
+        self.default_minutes = max(1, int(config.get('timer_duration', self.DEFAULT_MINUTES * 60)) // 60)
+        self.break_seconds = config.get('break_duration', self.DEFAULT_BREAK_SECONDS)
+        self.auto_cycle = config.get('auto_cycle', True)
+        self.cycles = config.get('pomodoro_cycles', self.DEFAULT_CYCLES)
+
+    # Observers
+
+    def subscribe(self, event, callback):
+        self.observers.setdefault(event, []).append(callback)
+        return callback
+
+    def unsubscribe(self, event, callback):
+        callbacks = self.observers.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def emit(self, event, **payload):
+        for callback in list(self.observers.get(event, ())):
+            try:
+                callback(**payload)
+            except Exception as e:
+                logger.error("Error in %s observer: %s", event, e)
+
+    # Tasks
+
+    def load_tasks(self):
+        # Tasks added before the first load may not be in the store yet
+        pending = [] if self.loaded else self.tasks
+        try:
+            self.tasks = self.store.load()
+            logger.info("Loaded %s tasks from store", len(self.tasks))
+        except Exception as e:
+            logger.error("Error loading tasks: %s", e)
+            self.tasks = []
+        if pending:
+            stored = {task.id for task in self.tasks}
+            self.tasks.extend(task for task in pending if task.id not in stored)
+        self.archive_completed(reset=False)
+        self.search_index.clear()
+        self.search_index.add_many(self.tasks)
+        self.emit('tasks_reset', tasks=self.tasks)
+        if not self.loaded:
+            self.loaded = True
+            callbacks, self.load_callbacks = self.load_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error("Error in load callback: %s", e)
+        return self.tasks
+
+    def when_loaded(self, callback):
+        """Run callback once the tasks have been loaded (now, if they are)"""
+        if self.loaded:
+            callback()
+        else:
+            self.load_callbacks.append(callback)
+
+    def archive_completed(self, reset=True):
+        """Move tasks completed more than archive_after_days ago into the cold archive"""
+        if not self.archive_after_days:
+            return 0
+        cutoff = time.time() - self.archive_after_days * 86400
+        # Legacy tasks have no completion time; their creation time stands in
+        old = [task for task in self.tasks
+               if task.completed and (task.completed_at or task.created) < cutoff]
+        if not old:
+            return 0
+        old_ids = {task.id for task in old}
+        self.tasks = [task for task in self.tasks if task.id not in old_ids]
+        for task_id in old_ids:
+            self.search_index.remove(task_id)
+        self.persistence.submit(self.move_to_archive, old)
+        logger.info("Archiving %s completed tasks older than %s days", len(old), self.archive_after_days)
+        if reset:
+            self.emit('tasks_reset', tasks=self.tasks)
+        return len(old)
+
+    def move_to_archive(self, tasks):
+        """Writer thread: append to the archive, then drop the tasks from the store.
+
+        If the archive write fails the tasks stay in the store and simply
+        come back on the next load, so nothing is lost.
+        """
+        try:
+            self.archive.archive(tasks)
+            self.store.apply_batch([{'op': 'del', 'id': task.id} for task in tasks])
+        except Exception as e:
+            logger.error("Error archiving tasks: %s", e)
+
+    def query_history(self, completed=None, created_after=None, created_before=None):
+        """Hot tasks from the store followed by archived ones, filtered by date"""
+        yield from self.store.query(completed, created_after, created_before)
+        if completed is not False:
+            yield from self.archive.query(created_after, created_before)
+
+    def index_of(self, task_id, hint=None):
+        """List position of a task id, trying the caller's hint first"""
+        if hint is not None and 0 <= hint < len(self.tasks) and self.tasks[hint].id == task_id:
+            return hint
+        for index, task in enumerate(self.tasks):
+            if task.id == task_id:
+                return index
+        return None
+
+    def add_task(self, text):
+        text = text.strip()
+        if not text:
+            logger.warning("Attempted to add empty task")
+            return None
+        logger.info("Adding task: %s", text)
+        task = make_task(text)
+        task.id = self.store.allocate_id()
+        self.tasks.append(task)
+        self.search_index.add(task)
+        self.persistence.record({'op': 'add', 'task': task.to_dict()})
+        self.emit('task_added', index=len(self.tasks) - 1, task=task)
+        return task
+
+    def set_completed(self, task_id, completed, hint=None):
+        index = self.index_of(task_id, hint)
+        if index is None:
+            logger.error("Task %s not found", task_id)
+            return None
+        task = self.tasks[index]
+        task.completed = bool(completed)
+        task.completed_at = time.time() if task.completed else None
+        logger.info("Task '%s' %s", task.text, "completed" if task.completed else "uncompleted")
+        self.search_index.set_completed(task)
+        self.persistence.record({'op': 'set', 'id': task_id, 'fields': {
+            'completed': task.completed, 'completed_at': task.completed_at}})
+        self.emit('task_updated', index=index, task=task)
+        return task
+
+    def edit_task(self, task_id, text, hint=None):
+        text = text.strip()
+        index = self.index_of(task_id, hint)
+        if index is None or not text:
+            return None
+        task = self.tasks[index]
+        logger.info("Editing task: %s -> %s", task.text, text)
+        task.text = text
+        self.search_index.update(task)
+        self.persistence.record({'op': 'set', 'id': task_id, 'fields': {'text': text}})
+        self.emit('task_updated', index=index, task=task)
+        return task
+
+    def toggle_completed(self, task_id, hint=None):
+        index = self.index_of(task_id, hint)
+        if index is None:
+            logger.error("Task %s not found", task_id)
+            return None
+        return self.set_completed(task_id, not self.tasks[index].completed, index)
+
+    def delete_task(self, task_id, hint=None):
+        index = self.index_of(task_id, hint)
+        if index is None:
+            logger.error("Task %s not found", task_id)
+            return None
+        task = self.tasks.pop(index)
+        self.search_index.remove(task_id)
+        logger.info("Deleting task: %s", task.text)
+        self.persistence.record({'op': 'del', 'id': task_id})
+        self.emit('task_removed', index=index, task=task)
+        return task
+
+    def clear_tasks(self):
+        logger.info("Clearing all tasks")
+        self.tasks = []
+        self.search_index.clear()
+        self.persistence.record({'op': 'clear'})
+        self.emit('tasks_reset', tasks=self.tasks)
+
+    def import_tasks(self, path):
+        """Stream tasks from a file in chunks; observers see a single reset"""
+        imported = 0
+        try:
+            # Parsed, id-stamped and appended chunk by chunk; the view and the
+            # store are each updated once at the end
+            for chunk in chunked(iter_task_file(path), 1000):
+                for task in chunk:
+                    task.id = self.store.allocate_id()
+                self.tasks.extend(chunk)
+                self.search_index.add_many(chunk)
+                self.persistence.record_many([{'op': 'add', 'task': task.to_dict()} for task in chunk])
+                imported += len(chunk)
+        finally:
+            if imported:
+                self.emit('tasks_reset', tasks=self.tasks)
+                self.persistence.flush()
+            logger.info("Imported %s tasks from %s", imported, path)
+        return imported
+
+    def search_tasks(self, query, status='all', limit=None):
+        """Tasks matching query (prefix terms, AND) and status, oldest first"""
+        by_id = self.search_index.tasks
+        return [by_id[task_id] for task_id in self.search_index.search(query, status, limit)]
+
+    def export_tasks(self, path):
+        count = export_tasks(path, self.tasks)
+        logger.info("Exported %s tasks to %s", count, path)
+        return count
+
+    # Timer
+
+    def on_timer_tick(self):
+        self.emit('timer_tick', remaining=self.timer.display_seconds())
+
+    def on_timer_complete(self):
+        self.emit('timer_tick', remaining=0)
+        self.emit('timer_stopped', remaining=0)
+        if self.phase == 'focus':
+            logger.info("Focus session completed")
+            self.completed_cycles += 1
+            self.emit('timer_complete', minutes=self.timer_minutes)
+            if self.auto_cycle and self.break_seconds > 0:
+                self.begin_phase('break', self.break_seconds, start=True)
+                return
+        else:
+            logger.info("Break completed")
+            self.emit('break_complete', cycle=self.completed_cycles)
+            if self.auto_cycle and self.completed_cycles < self.cycles:
+                self.begin_phase('focus', self.timer_minutes * 60, start=True)
+                return
+            self.completed_cycles = 0
+        self.begin_phase('focus', self.timer_minutes * 60)
+
+    def begin_phase(self, phase, seconds, start=False):
+        """Switch the clock between focus and break, optionally starting it"""
+        self.phase = phase
+        self.timer.set_duration(seconds)
+        self.emit('phase_changed', phase=phase, remaining=self.timer.display_seconds())
+        self.emit('timer_tick', remaining=self.timer.display_seconds())
+        if start:
+            self.start_timer()
+
+    # Named timers share the heap with the focus clock
+
+    def add_timer(self, name, seconds, on_complete=None, start=True):
+        """Run an extra countdown, e.g. a reminder; emits timer_done when it ends"""
+        def complete():
+            self.timers.remove(name)
+            self.emit('timer_done', name=name)
+            if on_complete is not None:
+                on_complete()
+        countdown = self.timers.create(name, seconds, on_complete=complete)
+        if start:
+            countdown.start()
+        return countdown
+
+    def cancel_timer(self, name):
+        return self.timers.remove(name) is not None
+
+    def start_timer(self):
+        if self.timer.running:
+            logger.warning("Timer already running")
+            return False
+        logger.info("Starting timer")
+        started = self.timer.start()
+        if started:
+            self.emit('timer_started', remaining=self.timer.display_seconds())
+        return started
+
+    def stop_timer(self):
+        logger.info("Stopping timer")
+        self.timer.pause()
+        self.emit('timer_stopped', remaining=self.timer.display_seconds())
+
+    def set_timer(self, minutes):
+        """Set timer to specified number of minutes"""
+        logger.info("Setting timer to %s minutes", minutes)
+        self.stop_timer()
+        self.timer_minutes = minutes
+        self.completed_cycles = 0
+        self.begin_phase('focus', minutes * 60)
+
+    def reset_timer(self):
+        logger.info("Resetting timer")
+        self.set_timer(self.default_minutes)
+
+    # Lifecycle
+
+    def close(self):
+        """Flush pending writes and close the task store"""
+        for name in list(self.timers.timers):
+            self.timers.remove(name)
+        self.persistence.close()
+        self.store.close()
+        logger.debug("Saved %s tasks to file", len(self.tasks))
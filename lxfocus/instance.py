@@ -0,0 +1,268 @@
+"""Single-instance guard: later launches hand their commands to the running app.
+
+The first instance listens on a Unix-domain socket (a named pipe on Windows)
+keyed by the working directory, since that is where tasks.db and
+window_config.json live. A second launch connects, sends its parsed command
+line and exits without importing Tk. Connections are authenticated with a
+per-user key file so other local users cannot drive the window.
+"""
+
+import contextlib
+import errno
+import hashlib
+import logging
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+
+logger = logging.getLogger(__name__)
+
+COMMANDS = ('add', 'start', 'stop', 'reset', 'show')
+
+
+def parse_command(words):
+    """Turn argv words like `add task Buy milk` or `start 25` into commands.
+
+    Returns a list of dicts with an 'action' key; no words means 'show'.
+    Raises ValueError for anything it does not understand.
+    """
+    text = ' '.join(words).strip()
+    if not text:
+        return [{'action': 'show'}]
+    verb, _, rest = text.partition(' ')
+    verb, rest = verb.lower(), rest.strip()
+    if verb not in COMMANDS:
+        raise ValueError(f"unknown command {verb!r} (expected one of: {', '.join(COMMANDS)})")
+    if verb == 'add':
+        if rest.lower().startswith('task '):
+            rest = rest[5:].strip()
+        if not rest or rest.lower() == 'task':
+            raise ValueError("add needs the task text, e.g. `add task Write report`")
+        return [{'action': 'add', 'text': rest}]
+    if verb == 'start':
+        if not rest:
+            return [{'action': 'start'}]
+        try:
+            minutes = int(rest)
+        except ValueError:
+            raise ValueError(f"start takes whole minutes, got {rest!r}") from None
+        if not 1 <= minutes <= 999:
+            raise ValueError("start minutes must be between 1 and 999")
+        return [{'action': 'start', 'minutes': minutes}]
+    if rest:
+        raise ValueError(f"{verb} takes no arguments")
+    return [{'action': verb}]
+
+
+def _runtime_dir():
+    """Private per-user directory for the socket and key file"""
+    if os.name == 'nt':
+        base = os.getenv('LOCALAPPDATA') or tempfile.gettempdir()
+        path = os.path.join(base, 'lxfocus')
+        os.makedirs(path, exist_ok=True)
+        return path
+    base = os.getenv('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    path = os.path.join(base, f'lxfocus-{os.getuid()}')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{path} is not private to this user")
+    return path
+
+
+class InstanceAddress:
+    """Where the running instance for a working directory listens"""
+    __slots__ = ('address', 'family', 'key_path', 'prefix')
+
+    def __init__(self, workdir=None):
+        workdir = os.path.abspath(workdir or os.getcwd())
+        digest = hashlib.sha1(os.path.normcase(workdir).encode('utf-8')).hexdigest()[:16]
+        runtime = _runtime_dir()
+        if os.name == 'nt':
+            user = os.getenv('USERNAME', 'user')
+            self.address = rf'\\.\pipe\lxfocus-{user}-{digest}'
+            self.family = 'AF_PIPE'
+        else:
+            self.address = os.path.join(runtime, f'{digest}.sock')
+            self.family = 'AF_UNIX'
+        self.prefix = os.path.join(runtime, digest)
+        self.key_path = self.prefix + '.key'
+
+    def read_key(self):
+        try:
+            with open(self.key_path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def write_key(self, key):
+        write_private(self.key_path, key)
+
+    @contextlib.contextmanager
+    def bind_lock(self):
+        """Serialize launches that try to claim this address at the same time"""
+        if os.name == 'nt':
+            yield  # Named pipes leave no stale file to clean up
+            return
+        import fcntl
+        fd = os.open(self.prefix + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def is_stale(self):
+        """True if a socket file is left over with nobody listening on it"""
+        if self.family != 'AF_UNIX' or not os.path.exists(self.address):
+            return False
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.address)
+        except ConnectionRefusedError:
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+        return False
+
+
+def write_private(path, data):
+    """Write bytes to a file only the current user can read"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+
+
+def forward_commands(commands, address=None, timeout=3.0):
+    """Send commands to a running instance.
+
+    Returns its reply dict, or None when no instance could be reached (the
+    caller then tries to bind the address itself).
+    """
+    address = address or InstanceAddress()
+    key = address.read_key()
+    if key is None:
+        return None
+    try:
+        conn = Client(address.address, family=address.family, authkey=key)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    except (AuthenticationError, OSError) as e:
+        logger.warning("Could not reach the running instance: %s", e)
+        return None
+    try:
+        conn.send(commands)
+        if not conn.poll(timeout):
+            return {'ok': False, 'error': 'the running instance did not answer'}
+        return conn.recv()
+    except (EOFError, OSError) as e:
+        return {'ok': False, 'error': str(e)}
+    finally:
+        conn.close()
+
+
+class InstanceServer:
+    """Accepts commands from later launches on a background thread.
+
+    Commands are only queued there; the Tk side drains them with poll() on
+    its own thread, since Tk must not be touched from elsewhere.
+    """
+
+    def __init__(self, address=None):
+        self.address = address or InstanceAddress()
+        self.commands = queue.SimpleQueue()
+        self.listener = None
+        self.thread = None
+
+    def bind(self):
+        """Claim the address; returns False if another instance got there first"""
+        with self.address.bind_lock():
+            if self.address.is_stale():
+                # Refused, not just unreadable: a leftover from a crash
+                try:
+                    os.unlink(self.address.address)
+                except OSError:
+                    pass
+            key = os.urandom(32)
+            try:
+                self.listener = Listener(self.address.address, family=self.address.family,
+                                         authkey=key)
+            except OSError as e:
+                if e.errno in (errno.EADDRINUSE, errno.EACCES):
+                    return False
+                raise
+            # Only publish the key once the address is ours, or a racing launch
+            # would lock clients out of the instance that won
+            self.address.write_key(key)
+        self.thread = threading.Thread(target=self._serve, name='instance-server', daemon=True)
+        self.thread.start()
+        logger.info("Listening for other launches on %s", self.address.address)
+        return True
+
+    def _serve(self):
+        while self.listener is not None:
+            try:
+                conn = self.listener.accept()
+            except AuthenticationError as e:
+                logger.warning("Rejected instance connection: %s", e)
+                continue
+            except OSError:
+                break  # Listener closed
+            try:
+                commands = conn.recv()
+                if isinstance(commands, list) and all(
+                        isinstance(c, dict) and c.get('action') in COMMANDS for c in commands):
+                    self.commands.put(commands)
+                    conn.send({'ok': True})
+                else:
+                    conn.send({'ok': False, 'error': 'malformed commands'})
+            except (EOFError, OSError) as e:
+                logger.debug("Instance connection dropped: %s", e)
+            finally:
+                conn.close()
+
+    def poll(self):
+        """Commands received since the last call, oldest first"""
+        received = []
+        while True:
+            try:
+                received.extend(self.commands.get_nowait())
+            except queue.Empty:
+                return received
+
+    def close(self):
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.close()
+        try:
+            os.unlink(self.address.key_path)
+        except OSError:
+            pass
+
+
+def claim_instance(commands, timeout=3.0):
+    """Forward to a running instance, or become the instance.
+
+    Returns (server, reply): a bound InstanceServer and None when this
+    process should start the app, or None and the other instance's reply.
+    """
+    address = InstanceAddress()
+    for attempt in range(3):
+        if attempt:
+            time.sleep(0.1)  # The winner may not have written its key yet
+        reply = forward_commands(commands, address, timeout)
+        if reply is not None:
+            return None, reply
+        server = InstanceServer(address)
+        if server.bind():
+            return server, None
+    # Another instance holds the address but cannot be reached; run without
+    # the guard rather than not at all
+    logger.warning("Could not claim %s; starting without single-instance mode", address.address)
+    return None, None
@@ -0,0 +1,236 @@
+"""Quick Launch engine: command resolution cache, MRU/frequency index, argv launch.
+
+Commands are split into argv and started directly, never through a shell.
+The program is resolved with shutil.which once and cached. A cached hit is
+revalidated with a single stat of the resolved file. A cached miss is
+revalidated against the mtimes of the PATH directories. The cache and the
+launch history are persisted together in launch_history.json, and the
+history feeds ranked autocomplete.
+"""
+
+import json
+import logging
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+
+from .storage import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class Launcher:
+    """Resolve, remember and start Quick Launch commands.
+
+    `submit` runs a function off the Tk thread (PersistenceScheduler.submit);
+    without it the history is written inline.
+    """
+
+    VERSION = 1
+    MAX_ENTRIES = 200
+    HALF_LIFE_DAYS = 14.0
+
+    def __init__(self, path='launch_history.json', submit=None, clock=time.time,
+                 which=shutil.which, popen=subprocess.Popen):
+        self.path = path
+        self.submit = submit
+        self.clock = clock
+        self.which = which
+        self.popen = popen
+        self.entries = {}   # command text -> {'count', 'last'}
+        self.resolved = {}  # program name -> (path or None, stamp)
+        self.program_names = {}  # command text -> lowercased program file name
+        self.search_path = self.current_search_path()
+        self.load()
+
+    @staticmethod
+    def current_search_path():
+        return os.environ.get('PATH', '') + os.pathsep + os.environ.get('PATHEXT', '')
+
+    # Persistence
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.error("Error loading launch history: %s", e)
+            return
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            logger.warning("Ignoring launch history with unknown format")
+            return
+        for text, entry in data.get('entries', {}).items():
+            if isinstance(entry, dict):
+                self.entries[text] = {'count': int(entry.get('count', 1)),
+                                      'last': float(entry.get('last', 0))}
+        # Resolutions only carry over while PATH is the same
+        if data.get('search_path') == self.search_path:
+            for name, value in data.get('resolved', {}).items():
+                if isinstance(value, list) and len(value) == 2:
+                    path, stamp = value
+                    self.resolved[name] = (path, tuple(stamp) if isinstance(stamp, list) else stamp)
+        logger.info("Loaded %s launch history entries", len(self.entries))
+
+    def snapshot(self):
+        return {'version': self.VERSION, 'search_path': self.search_path,
+                'entries': {text: dict(entry) for text, entry in self.entries.items()},
+                'resolved': {name: list(value) for name, value in self.resolved.items()}}
+
+    def save(self):
+        data = self.snapshot()
+        if self.submit is not None:
+            self.submit(self.write, data)
+        else:
+            self.write(data)
+
+    def write(self, data):
+        try:
+            write_json_atomic(self.path, data)
+        except Exception as e:
+            logger.error("Error saving launch history: %s", e)
+
+    # Resolution
+
+    @staticmethod
+    def file_stamp(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def path_stamp(self):
+        """mtimes of the PATH directories; a new install changes one of them"""
+        return tuple(self.file_stamp(directory) for directory in
+                     os.environ.get('PATH', '').split(os.pathsep) if directory)
+
+    def resolve(self, name):
+        """Absolute path of an executable, or None; cached across calls and runs"""
+        search_path = self.current_search_path()
+        if search_path != self.search_path:
+            self.search_path = search_path
+            self.resolved.clear()
+        cached = self.resolved.get(name)
+        if cached is not None:
+            path, stamp = cached
+            if path is None and stamp == self.path_stamp():
+                return None
+            if path is not None and stamp is not None and self.file_stamp(path) == stamp:
+                return path
+        path = self.which(name)
+        if path is not None:
+            path = os.path.abspath(path)
+        self.resolved[name] = (path, self.file_stamp(path) if path else self.path_stamp())
+        return path
+
+    @staticmethod
+    def split(text):
+        """argv for a Quick Launch entry; a path to an existing file is taken whole.
+
+        There is no shell, so '~' and environment variables are expanded here.
+        """
+        text = text.strip()
+        if os.path.exists(text):
+            return [text]  # e.g. "C:\Program Files\App\app.exe" from Browse
+        if os.name == 'nt':
+            argv = [part[1:-1] if len(part) > 1 and part[0] == part[-1] == '"' else part
+                    for part in shlex.split(text, posix=False)]
+        else:
+            argv = shlex.split(text)
+        return [os.path.expanduser(os.path.expandvars(part)) for part in argv]
+
+    @classmethod
+    def program_name(cls, text):
+        """File name of the program a command runs, e.g. 'code' for '/usr/bin/code .'"""
+        try:
+            argv = cls.split(text)
+        except ValueError:
+            argv = [text]
+        return re.split(r'[\\/]', argv[0])[-1] if argv else ''
+
+    # Launching
+
+    def launch(self, text):
+        """Start the command without a shell and record it; returns the Popen.
+
+        Raises ValueError for unbalanced quotes and FileNotFoundError when
+        nothing by that name can be found.
+        """
+        text = text.strip()
+        argv = self.split(text)
+        if not argv:
+            raise ValueError("nothing to launch")
+        program = self.resolve(argv[0])
+        if program is not None:
+            process = self.start([program] + argv[1:])
+        elif len(argv) == 1 and os.path.exists(argv[0]):
+            process = self.open_document(argv[0])
+        else:
+            raise FileNotFoundError(f"'{argv[0]}' was not found on PATH")
+        logger.info("Launched %s", argv if program is None else [program] + argv[1:])
+        self.record(text)
+        return process
+
+    def start(self, argv):
+        if os.name == 'nt':
+            return self.popen(argv, close_fds=True,
+                              creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+        # Own session and no inherited stdio, so the app outlives Focus Tool quietly
+        return self.popen(argv, close_fds=True, start_new_session=True,
+                          stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.DEVNULL)
+
+    def open_document(self, path):
+        """Open a non-executable file or folder with its default application"""
+        if os.name == 'nt':
+            os.startfile(path)
+            return None
+        opener = self.resolve('open' if sys.platform == 'darwin' else 'xdg-open')
+        if opener is None:
+            raise FileNotFoundError(f"no application found to open '{path}'")
+        return self.start([opener, path])
+
+    # History and autocomplete
+
+    def record(self, text):
+        entry = self.entries.setdefault(text, {'count': 0, 'last': 0.0})
+        entry['count'] += 1
+        entry['last'] = self.clock()
+        if len(self.entries) > self.MAX_ENTRIES:
+            now = self.clock()
+            for stale in sorted(self.entries, key=lambda t: self.score(self.entries[t], now))[
+                    :len(self.entries) - self.MAX_ENTRIES]:
+                del self.entries[stale]
+                self.program_names.pop(stale, None)
+        self.save()
+
+    def score(self, entry, now):
+        """Frecency: launch count decayed by time since the last launch"""
+        age_days = max(0.0, now - entry['last']) / 86400
+        return entry['count'] * 0.5 ** (age_days / self.HALF_LIFE_DAYS)
+
+    def suggest(self, prefix, limit=8):
+        """History entries for a typed prefix, best first.
+
+        Entries that start with the prefix rank ahead of those whose program
+        name (the file name without directories) starts with it.
+        """
+        prefix = prefix.strip().lower()
+        now = self.clock()
+        ranked = []
+        for text, entry in self.entries.items():
+            lowered = text.lower()
+            if lowered.startswith(prefix):
+                tier = 0
+            elif self.program_names.setdefault(text, self.program_name(lowered)).startswith(prefix):
+                tier = 1
+            else:
+                continue
+            ranked.append((tier, -self.score(entry, now), text))
+        ranked.sort()
+        return [text for _, _, text in ranked[:limit]]
@@ -0,0 +1,52 @@
+"""Logging setup; nothing is configured until configure_logging() is called"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+def debug_enabled():
+    return os.getenv('FOCUS_DEBUG', '').strip().lower() in ('1', 'true', 'yes')
+
+def configure_logging(log_path='focus_tool.log'):
+    """Route all logging through a queue so the Tk thread never touches disk.
+
+    The root logger only enqueues records; a QueueListener thread formats them
+    and writes to stdout and a rotating focus_tool.log. Rotation is size-based
+    by default (FOCUS_LOG_MAX_BYTES, FOCUS_LOG_BACKUPS) or daily with
+    FOCUS_LOG_ROTATE=daily. Returns the started listener.
+    """
+    # Default INFO; enable DEBUG with env FOCUS_DEBUG=1 or FOCUS_LOG_LEVEL=DEBUG
+    env_level = os.getenv('FOCUS_LOG_LEVEL')
+    if debug_enabled() and not env_level:
+        env_level = 'DEBUG'
+    level = getattr(logging, (env_level or 'INFO').upper(), logging.INFO)
+    
+    backups = int(os.getenv('FOCUS_LOG_BACKUPS', '3'))
+    # delay=True opens the file lazily, i.e. on the listener thread
+    if os.getenv('FOCUS_LOG_ROTATE', '').strip().lower() == 'daily':
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            log_path, when='midnight', backupCount=backups, delay=True)
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=int(os.getenv('FOCUS_LOG_MAX_BYTES', str(1024 * 1024))),
+            backupCount=backups, delay=True)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    # Drain whatever is still queued before the interpreter exits
+    atexit.register(listener.stop)
+    return listener
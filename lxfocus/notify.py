@@ -0,0 +1,217 @@
+"""Toast notifications and pre-decoded sound cues"""
+
+import io
+import logging
+import math
+import os
+import shutil
+import subprocess
+import threading
+import tkinter as tk
+import wave
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import load_app_config
+
+logger = logging.getLogger(__name__)
+
+class SoundCache:
+    """Audio cues decoded once and kept in memory as ready-to-play WAV bytes.
+
+    A cue comes from sounds/<name>.wav if present, otherwise from a short
+    synthesized tone. Each file is read through `wave` once; later plays
+    reuse the cached bytes and never touch the disk.
+    """
+
+    SAMPLE_RATE = 22050
+    TONES = {
+        'focus_complete': ((660, 0.15), (880, 0.15), (1320, 0.3)),
+        'break_complete': ((880, 0.15), (660, 0.3)),
+        'timer_done': ((990, 0.2),),
+    }
+
+    def __init__(self, sound_dir='sounds'):
+        self.sound_dir = sound_dir
+        self.cues = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def synthesize(cls, notes, volume=0.4):
+        """16-bit mono WAV of (frequency, seconds) notes with short fades"""
+        samples = array('h')
+        for frequency, seconds in notes:
+            count = int(cls.SAMPLE_RATE * seconds)
+            fade = max(1, count // 10)
+            step = 2 * math.pi * frequency / cls.SAMPLE_RATE
+            for i in range(count):
+                envelope = min(1.0, i / fade, (count - i) / fade)
+                samples.append(int(32767 * volume * envelope * math.sin(step * i)))
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(cls.SAMPLE_RATE)
+            wav.writeframes(samples.tobytes())
+        return buffer.getvalue()
+
+    @staticmethod
+    def decode(path):
+        """Validate a WAV file and return it re-encoded in memory"""
+        with wave.open(path, 'rb') as source:
+            params = source.getparams()
+            frames = source.readframes(params.nframes)
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav:
+            wav.setparams(params)
+            wav.writeframes(frames)
+        return buffer.getvalue()
+
+    def load(self, name):
+        path = os.path.join(self.sound_dir, name + '.wav')
+        if os.path.exists(path):
+            try:
+                return self.decode(path)
+            except (wave.Error, EOFError, OSError) as e:
+                logger.warning("Could not decode %s, using built-in tone: %s", path, e)
+        return self.synthesize(self.TONES.get(name, self.TONES['timer_done']))
+
+    def preload(self):
+        for name in self.TONES:
+            self.get(name)
+
+    def get(self, name):
+        with self.lock:
+            data = self.cues.get(name)
+            if data is None:
+                data = self.cues[name] = self.load(name)
+        return data
+
+def default_sound_player():
+    """Best available player for in-memory WAV bytes, or None"""
+    if os.name == 'nt':
+        try:
+            import winsound
+            # SND_MEMORY cannot be combined with SND_ASYNC; callers run it off the Tk thread
+            return lambda data: winsound.PlaySound(data, winsound.SND_MEMORY)
+        except ImportError:
+            return None
+    for command in (['paplay'], ['aplay', '-q'], ['pw-play', '-']):
+        if shutil.which(command[0]):
+            return lambda data, command=command: subprocess.run(
+                command, input=data, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=10)
+    return None
+
+class NotificationCenter:
+    """Non-modal toast notifications with optional sound cues.
+
+    notify() only queues; notifications arriving within `coalesce_ms` of each
+    other are shown as one toast with one sound. Sounds play on a worker
+    thread from the pre-decoded SoundCache, so nothing here blocks Tk.
+    """
+
+    def __init__(self, root, sound_enabled=True, sounds=None, player=None,
+                 coalesce_ms=250, display_ms=6000):
+        self.root = root
+        self.sound_enabled = sound_enabled
+        self.sounds = sounds or SoundCache()
+        self.player = player if player is not None else default_sound_player()
+        self.coalesce_ms = coalesce_ms
+        self.display_ms = display_ms
+        self.pending = []
+        self.flush_job = None
+        self.toast = None
+        self.hide_job = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='focus-sound')
+        if self.sound_enabled:
+            self.executor.submit(self.sounds.preload)
+
+    def notify(self, title, message, sound=None):
+        logger.info("Notification: %s - %s", title, message)
+        self.pending.append((title, message, sound))
+        if self.flush_job is None:
+            self.flush_job = self.root.after(self.coalesce_ms, self.flush)
+
+    def flush(self):
+        self.flush_job = None
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        if len(pending) == 1:
+            title, message = pending[0][0], pending[0][1]
+        else:
+            title = f"{len(pending)} notifications"
+            message = "\n".join(f"{t}: {m}" for t, m, _ in pending)
+        self.show_toast(title, message)
+        sound = next((s for _, _, s in pending if s), None)
+        if sound:
+            self.play(sound)
+
+    def play(self, name):
+        if not self.sound_enabled:
+            return
+        if self.player is None:
+            self.root.bell()
+            return
+        self.executor.submit(self.play_now, name)
+
+    def play_now(self, name):
+        try:
+            self.player(self.sounds.get(name))
+        except Exception as e:
+            logger.debug("Sound playback failed: %s", e)
+
+    def show_toast(self, title, message):
+        try:
+            if self.toast is None or not self.toast.winfo_exists():
+                self.build_toast()
+            self.toast_title.config(text=title)
+            self.toast_message.config(text=message)
+            self.place_toast()
+            self.toast.deiconify()
+            self.toast.lift()
+            if self.hide_job is not None:
+                self.root.after_cancel(self.hide_job)
+            self.hide_job = self.root.after(self.display_ms, self.hide_toast)
+        except tk.TclError as e:
+            logger.error("Could not show notification: %s", e)
+
+    def build_toast(self):
+        config = load_app_config()
+        self.toast = tk.Toplevel(self.root)
+        self.toast.withdraw()
+        self.toast.overrideredirect(True)
+        self.toast.attributes('-topmost', True)
+        frame = tk.Frame(self.toast, bg=config.color('frame_background'), padx=16, pady=12,
+                         highlightthickness=1, highlightbackground=config.color('accent'))
+        frame.pack(fill='both', expand=True)
+        self.toast_title = tk.Label(frame, font=(config.font('body'), 10, "bold"),
+                                    bg=config.color('frame_background'), fg=config.color('text'), anchor='w', justify='left')
+        self.toast_title.pack(fill='x')
+        self.toast_message = tk.Label(frame, font=(config.font('body'), 9),
+                                      bg=config.color('frame_background'), fg=config.color('secondary_text'), anchor='w',
+                                      justify='left', wraplength=280)
+        self.toast_message.pack(fill='x', pady=(4, 0))
+        for widget in (self.toast, frame, self.toast_title, self.toast_message):
+            widget.bind('<Button-1>', lambda e: self.hide_toast())
+
+    def place_toast(self):
+        # Bottom-right corner of the app window
+        self.toast.update_idletasks()
+        width = max(self.toast.winfo_reqwidth(), 240)
+        height = self.toast.winfo_reqheight()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - width - 16
+        y = self.root.winfo_rooty() + self.root.winfo_height() - height - 16
+        self.toast.geometry(f"{width}x{height}+{max(0, x)}+{max(0, y)}")
+
+    def hide_toast(self):
+        self.hide_job = None
+        if self.toast is not None:
+            try:
+                self.toast.withdraw()
+            except tk.TclError:
+                pass
+
+    def close(self):
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,173 @@
+"""Startup phase timing, latency histograms and the event-loop monitor"""
+
+import bisect
+import json
+import logging
+import time
+
+from . import _STARTUP_T0
+
+logger = logging.getLogger(__name__)
+
+class LatencyHistogram:
+    """Quarter-octave buckets of millisecond samples; constant memory, ~19% resolution"""
+
+    BOUNDS = tuple(0.1 * 2 ** (i / 4) for i in range(68))  # 0.1 ms .. ~10 s
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, ms):
+        self.buckets[bisect.bisect_left(self.BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile sample"""
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for bound, hits in zip(self.BOUNDS, self.buckets):
+            seen += hits
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {'count': self.count,
+                'mean_ms': round(self.total / self.count, 3) if self.count else 0.0,
+                'p50_ms': round(self.percentile(50), 3), 'p95_ms': round(self.percentile(95), 3),
+                'p99_ms': round(self.percentile(99), 3), 'max_ms': round(self.max, 3)}
+
+class PerformanceMonitor:
+    """Event-loop lag heartbeat plus timing hooks around UI handlers.
+
+    The heartbeat asks Tk for a callback every `interval_ms`; how late it
+    actually runs is the time the loop was busy elsewhere. Wrapped handlers
+    record their own durations. Everything lands in LatencyHistograms, and a
+    snapshot can be appended to an NDJSON metrics file every `export_interval`
+    seconds on the given executor.
+    """
+
+    def __init__(self, root, interval_ms=100, metrics_path=None, export_interval=60,
+                 executor=None, clock=time.perf_counter):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.metrics_path = metrics_path
+        self.export_interval = export_interval
+        self.executor = executor
+        self.clock = clock
+        self.histograms = {}
+        self.expected = None
+        self.beat_job = None
+        self.last_export = None
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        return histogram
+
+    def start(self):
+        self.last_export = self.clock()
+        self.schedule_beat()
+
+    def schedule_beat(self):
+        self.expected = self.clock() + self.interval_ms / 1000.0
+        self.beat_job = self.root.after(self.interval_ms, self.beat)
+
+    def beat(self):
+        now = self.clock()
+        self.histogram('loop_lag').record(max(0.0, (now - self.expected) * 1000))
+        if self.metrics_path and now - self.last_export >= self.export_interval:
+            self.last_export = now
+            self.export()
+        self.schedule_beat()
+
+    def stop(self):
+        if self.beat_job is not None:
+            self.root.after_cancel(self.beat_job)
+            self.beat_job = None
+
+    def wrap(self, name, handler):
+        """Return handler wrapped so each call is timed under name"""
+        histogram = self.histogram(name)
+        clock = self.clock
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                histogram.record((clock() - start) * 1000)
+        timed.__name__ = getattr(handler, '__name__', name)
+        return timed
+
+    def instrument(self, obj, names, prefix=''):
+        """Replace obj's bound methods by timed wrappers (before they get bound to widgets)"""
+        for name in names:
+            setattr(obj, name, self.wrap(prefix + name, getattr(obj, name)))
+
+    def snapshot(self):
+        return {name: histogram.snapshot() for name, histogram in sorted(self.histograms.items())
+                if histogram.count}
+
+    def export(self):
+        record = {'time': time.time(), 'metrics': self.snapshot()}
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        if self.executor is not None:
+            self.executor.submit(self.write_line, line)
+        else:
+            self.write_line(line)
+
+    def write_line(self, line):
+        try:
+            with open(self.metrics_path, 'a') as f:
+                f.write(line)
+        except Exception as e:
+            logger.error("Error writing metrics file: %s", e)
+
+    def summary(self, names=None):
+        """One-line p95/max summary for the log and the HUD"""
+        parts = []
+        for name, stats in self.snapshot().items():
+            if names is None or name in names:
+                parts.append(f"{name} p95 {stats['p95_ms']:.1f} max {stats['max_ms']:.1f}")
+        return "; ".join(parts)
+
+class StartupProfiler:
+    """Records named startup phases from process start to first paint"""
+
+    def __init__(self, enabled=False, budget_ms=None, start=_STARTUP_T0):
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.start = start
+        self.phases = []
+        self.reported = False
+
+    def mark(self, phase):
+        if self.enabled:
+            self.phases.append((phase, time.perf_counter()))
+
+    def report(self):
+        """Print a per-phase breakdown (once)"""
+        if not self.enabled or self.reported or not self.phases:
+            return
+        self.reported = True
+        lines = ["Startup profile (ms):", f"  {'phase':<24}{'delta':>10}{'total':>10}"]
+        previous = self.start
+        for phase, stamp in self.phases:
+            lines.append(f"  {phase:<24}{(stamp - previous) * 1000:>10.1f}{(stamp - self.start) * 1000:>10.1f}")
+            previous = stamp
+        first_paint = dict(self.phases).get('first_paint')
+        if first_paint is not None and self.budget_ms is not None:
+            elapsed = (first_paint - self.start) * 1000
+            verdict = "OK" if elapsed <= self.budget_ms else "OVER BUDGET"
+            lines.append(f"  first paint {elapsed:.1f} ms / budget {self.budget_ms:.0f} ms: {verdict}")
+        print("\n".join(lines), flush=True)
@@ -0,0 +1,211 @@
+"""In-memory inverted index over task text"""
+
+import bisect
+import re
+from collections import OrderedDict
+
+
+class TaskSearchIndex:
+    """Incremental inverted index (token -> task ids) with prefix matching.
+
+    Tokens are kept in a sorted vocabulary so a prefix maps to a contiguous
+    bisect range. Open/completed ids are tracked as sets, so filtered views
+    are set intersections rather than scans over the task list. The id sets
+    of recently used wide prefixes are cached and kept up to date on add and
+    remove, so a short prefix unions its postings once, not per keystroke.
+    All ids are also kept in one sorted list: a limited search for a broad
+    query walks it oldest first and stops at `limit` matches.
+    """
+
+    TOKEN = re.compile(r'\w+')
+    # A scanned id costs about this many posting entries (set union/intersection)
+    SCAN_COST = 4
+    SCAN_CHUNK = 256
+    WIDE_PREFIX = 64  # Prefixes spanning more tokens than this are cached
+    PREFIX_CACHE_SIZE = 32
+
+    def __init__(self):
+        self.postings = {}
+        self.vocabulary = []
+        self.tokens_by_id = {}
+        self.tasks = {}
+        self.ids = []
+        self.prefix_cache = OrderedDict()  # wide prefix -> ids with a token starting with it
+        self.token_text = {}  # id -> ' tok1 tok2' (built by scan), so a prefix is a substring test
+        self.open_ids = set()
+        self.completed_ids = set()
+
+    @classmethod
+    def tokenize(cls, text):
+        return cls.TOKEN.findall(text.lower())
+
+    def add(self, task):
+        task_id = task.id
+        if task_id in self.tasks:
+            self.remove(task_id)
+        tokens = frozenset(self.tokenize(task.text))
+        self.tasks[task_id] = task
+        ids = self.ids
+        if not ids or task_id > ids[-1]:
+            ids.append(task_id)  # New tasks get the highest id
+        else:
+            bisect.insort(ids, task_id)
+        self.tokens_by_id[task_id] = tokens
+        postings = self.postings
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = {task_id}
+                bisect.insort(self.vocabulary, token)
+            else:
+                ids.add(task_id)
+        if self.prefix_cache:
+            for prefix, ids in self.prefix_cache.items():
+                if any(token.startswith(prefix) for token in tokens):
+                    ids.add(task_id)
+        self.set_completed(task)
+
+    def add_many(self, tasks):
+        for task in tasks:
+            self.add(task)
+
+    def remove(self, task_id):
+        if self.tasks.pop(task_id, None) is not None:
+            del self.ids[bisect.bisect_left(self.ids, task_id)]
+            self.token_text.pop(task_id, None)
+        self.open_ids.discard(task_id)
+        self.completed_ids.discard(task_id)
+        for ids in self.prefix_cache.values():
+            ids.discard(task_id)
+        for token in self.tokens_by_id.pop(task_id, ()):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(task_id)
+            if not ids:
+                del self.postings[token]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+
+    def update(self, task):
+        """Re-index after an edit; a status-only change skips the tokens"""
+        if self.tasks.get(task.id) is task and \
+                self.tokens_by_id.get(task.id) == frozenset(self.tokenize(task.text)):
+            self.set_completed(task)
+        else:
+            self.add(task)
+
+    def set_completed(self, task):
+        if task.completed:
+            self.open_ids.discard(task.id)
+            self.completed_ids.add(task.id)
+        else:
+            self.completed_ids.discard(task.id)
+            self.open_ids.add(task.id)
+
+    def clear(self):
+        self.__init__()
+
+    def prefix_range(self, prefix):
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + '\U0010ffff', start)
+        return start, end
+
+    def estimate(self, term):
+        """Rough posting count for a prefix, used to order the query terms"""
+        cached = self.prefix_cache.get(term)
+        if cached is not None:
+            return len(cached)
+        start, end = self.prefix_range(term)
+        if end - start > 1024:
+            # Every token has at least one id, so the width is a lower bound
+            return end - start
+        return sum(len(self.postings[self.vocabulary[i]]) for i in range(start, end))
+
+    def matches(self, term, candidates=None):
+        """Ids whose tokens start with term, narrowed to candidates if given.
+
+        The result may be the index's own set; callers must not modify it.
+        """
+        cached = self.prefix_cache.get(term)
+        if cached is not None:
+            self.prefix_cache.move_to_end(term)
+            return cached if candidates is None else cached & candidates
+        start, end = self.prefix_range(term)
+        if end - start > self.WIDE_PREFIX and (candidates is None or len(candidates) >= end - start):
+            result = set()
+            for i in range(start, end):
+                result |= self.postings[self.vocabulary[i]]
+            self.prefix_cache[term] = result
+            if len(self.prefix_cache) > self.PREFIX_CACHE_SIZE:
+                self.prefix_cache.popitem(last=False)
+            return result if candidates is None else result & candidates
+        if candidates is not None and len(candidates) < end - start:
+            # Cheaper to check the few remaining candidates than to walk
+            # the postings of a short, very common prefix
+            return {task_id for task_id in candidates
+                    if any(token.startswith(term) for token in self.tokens_by_id[task_id])}
+        result = set()
+        for i in range(start, end):
+            ids = self.postings[self.vocabulary[i]]
+            result |= ids if candidates is None else ids & candidates
+        return result
+
+    def scan(self, terms, allowed, limit, budget):
+        """First `limit` matches walking ids oldest first, or None past `budget` ids"""
+        found = []
+        text = self.token_text
+        needles = [' ' + term for term in terms]
+        ids = self.ids
+        for start in range(0, len(ids), self.SCAN_CHUNK):
+            if start >= budget:
+                return None
+            chunk = ids[start:start + self.SCAN_CHUNK]
+            if allowed is not None:
+                chunk = [task_id for task_id in chunk if task_id in allowed]
+            for task_id in chunk:
+                if task_id not in text:
+                    text[task_id] = ' ' + ' '.join(self.tokens_by_id[task_id])
+            for needle in needles:
+                chunk = [task_id for task_id in chunk if needle in text[task_id]]
+            found.extend(chunk)
+            if len(found) >= limit:
+                return found[:limit]
+        return found
+
+    def search(self, query, status='all', limit=None):
+        """Ids matching every query term (as a prefix) and status, oldest first.
+
+        With a limit, dense queries (broad prefixes, a bare status filter)
+        are answered by scan(), which touches about limit / density ids.
+        Selective ones, or a scan that runs over its budget, go through the
+        postings, and only the final candidates are sorted.
+        """
+        allowed = {'open': self.open_ids, 'completed': self.completed_ids}.get(status)
+        total = len(self.ids)
+        estimates = sorted((self.estimate(term), term) for term in set(self.tokenize(query)))
+        if estimates and not estimates[0][0]:
+            return []
+        terms = [term for _, term in estimates]
+        cost = estimates[0][0] if estimates else total
+        if limit is not None and total:
+            # Expected matches, taking the terms and the status as independent
+            expected = float(len(allowed) if allowed is not None else total)
+            for count, _ in estimates:
+                expected *= min(count, total) / total
+            budget = 2 * cost // self.SCAN_COST
+            if expected and limit * total / expected < budget:
+                found = self.scan(terms, allowed, limit, budget)
+                if found is not None:
+                    return found
+        candidates = None
+        # Most selective terms first so later ones only filter a few ids
+        for term in terms:
+            candidates = self.matches(term, candidates)
+            if not candidates:
+                return []
+        if candidates is None:
+            candidates = allowed if allowed is not None else self.ids
+        elif allowed is not None:
+            candidates = candidates & allowed
+        ids = sorted(candidates)
+        return ids[:limit] if limit is not None else ids
@@ -0,0 +1,614 @@
+"""Task stores (SQLite, JSON journal) and the background persistence writer"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .tasks import Task, dump_task_columns, load_task_columns
+
+logger = logging.getLogger(__name__)
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """Write JSON to a temp file and os.replace it over path"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, **dump_kwargs)
+    os.replace(temp_path, path)
+
+class PersistenceScheduler:
+    """Batches dirty task and window state into coalesced background writes.
+
+    Task mutations are recorded as store records and window geometry as a
+    dirty snapshot. A burst of edits is written once, either after the burst
+    goes quiet for `idle_delay` seconds or at most `interval` seconds after
+    the first unsaved change. Writes run on a single background thread.
+    """
+
+    def __init__(self, root, store, interval=30, idle_delay=2.0,
+                 window_config_path='window_config.json'):
+        self.root = root
+        self.store = store
+        self.interval = max(1.0, float(interval))
+        self.idle_delay = min(idle_delay, self.interval)
+        self.window_config_path = window_config_path
+        self.lock = threading.Lock()
+        self.pending_records = []
+        self.window_state = None
+        self.first_dirty = None
+        self.after_id = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='focus-persist')
+        self.last_future = None
+
+    def record(self, record):
+        """Queue one task store record (see TaskStore) for the next write"""
+        with self.lock:
+            self.pending_records.append(record)
+        self.mark_dirty()
+
+    def record_many(self, records):
+        with self.lock:
+            self.pending_records.extend(records)
+        self.mark_dirty()
+
+    def mark_window_dirty(self, state):
+        with self.lock:
+            self.window_state = dict(state)
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        now = time.monotonic()
+        if self.first_dirty is None:
+            self.first_dirty = now
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        # Quiet period, but never later than interval after the first change
+        delay = min(self.idle_delay, max(0.0, self.first_dirty + self.interval - now))
+        self.after_id = self.root.after(int(delay * 1000), self.flush)
+
+    def flush(self, wait=False):
+        """Hand everything dirty to the writer thread"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.first_dirty = None
+        with self.lock:
+            records, self.pending_records = self.pending_records, []
+            window_state, self.window_state = self.window_state, None
+        if records or window_state is not None:
+            self.last_future = self.executor.submit(self.write, records, window_state)
+        if wait and self.last_future is not None:
+            self.last_future.result()
+
+    def submit(self, fn, *args):
+        """Run fn on the writer thread after everything already dirty"""
+        self.flush()
+        self.last_future = self.executor.submit(fn, *args)
+        return self.last_future
+
+    def write(self, records, window_state):
+        start = time.perf_counter()
+        try:
+            if records:
+                self.store.apply_batch(records)
+            if window_state is not None:
+                write_json_atomic(self.window_config_path, window_state, indent=2)
+            logger.debug("Persisted %s task records%s in %.1f ms", len(records),
+                         " and window state" if window_state is not None else "",
+                         (time.perf_counter() - start) * 1000)
+        except Exception as e:
+            logger.error("Error persisting state: %s", e)
+
+    def close(self):
+        """Flush synchronously and stop the writer thread"""
+        self.flush(wait=True)
+        self.executor.shutdown(wait=True)
+
+class TaskStore:
+    """Interface for task persistence backends.
+
+    Tasks are Task objects; records carry them as Task.to_dict() payloads.
+    Backends address tasks by their stable integer id, never by list position.
+    Batched writes use the journal record format: {'op': 'add', 'task': ...},
+    {'op': 'set', 'id': ..., 'fields': ...}, {'op': 'del', 'id': ...} and
+    {'op': 'clear'}.
+    """
+
+    next_id = 1
+
+    def load(self):
+        """Return all tasks ordered by id"""
+        raise NotImplementedError
+
+    def allocate_id(self):
+        """Reserve the next task id without touching storage"""
+        task_id = self.next_id
+        self.next_id += 1
+        return task_id
+
+    def add(self, task):
+        """Persist a new task, assigning task.id if unset, and return the id"""
+        raise NotImplementedError
+
+    def update(self, task_id, fields):
+        raise NotImplementedError
+
+    def delete(self, task_id):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def query(self, completed=None, created_after=None, created_before=None):
+        """Yield tasks matching the given filters (epoch bounds), ordered by id"""
+        for task in self.load():
+            if completed is not None and task.completed != completed:
+                continue
+            if created_after is not None and task.created < created_after:
+                continue
+            if created_before is not None and task.created >= created_before:
+                continue
+            yield task
+
+    def count(self, completed=None):
+        return sum(1 for _ in self.query(completed=completed))
+
+    def apply_batch(self, records):
+        """Apply a list of mutation records; backends make this one write"""
+        for record in records:
+            op = record['op']
+            if op == 'add':
+                self.add(Task.from_dict(record['task']))
+            elif op == 'set':
+                self.update(record['id'], record['fields'])
+            elif op == 'del':
+                self.delete(record['id'])
+            elif op == 'clear':
+                self.clear()
+
+    def close(self):
+        pass
+
+class JournalTaskStore(TaskStore):
+    """Append-only write-ahead journal layered over the tasks.json snapshot.
+
+    Every mutation appends one compact JSON record to the journal, so its cost
+    does not depend on how many tasks exist. Once enough records pile up the
+    journal is rotated and folded into a fresh snapshot on a background thread.
+    Ids are never reused: the snapshot stores the next free id, and a batch
+    that allocated ids appends a {'op': 'next_id', 'id': ...} record.
+    """
+
+    def __init__(self, snapshot_path='tasks.json', journal_path='tasks.journal',
+                 compact_threshold=500):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.rotated_path = journal_path + '.1'
+        self.compact_threshold = compact_threshold
+        self.lock = threading.Lock()
+        self.journal_file = None
+        self.compaction_thread = None
+        self.records_since_compaction = 0
+        self.next_id = None  # Known once the files have been read
+        self.written_next_id = None  # Last next_id recorded in the journal
+
+    @staticmethod
+    def apply_record(tasks_by_id, record):
+        """Apply a single journal record to an id -> task mapping"""
+        op = record.get('op')
+        if op == 'add':
+            task = Task.from_dict(record['task'])
+            tasks_by_id[task.id] = task
+        elif op == 'set':
+            task = tasks_by_id.get(record['id'])
+            if task is not None:
+                task.update(record['fields'])
+        elif op == 'del':
+            tasks_by_id.pop(record['id'], None)
+        elif op == 'clear':
+            tasks_by_id.clear()
+
+    def read_snapshot(self):
+        """Read the snapshot, columnar or a legacy list of task dicts.
+
+        Returns (tasks_by_id, next_id).
+        """
+        if not os.path.exists(self.snapshot_path):
+            return {}, 1
+        with open(self.snapshot_path, 'r') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get('format') == 'columns':
+            tasks_by_id = {task.id: task for task in load_task_columns(data)}
+            return tasks_by_id, max(data.get('next_id', 1), max(tasks_by_id, default=0) + 1)
+        # Ids are assigned in snapshot order, so replaying the journal against
+        # an id-less legacy snapshot always resolves to the same tasks
+        next_id = max((t['id'] for t in data if 'id' in t), default=0) + 1
+        tasks_by_id = {}
+        for record in data:
+            task = Task.from_dict(record)
+            if task.id is None:
+                task.id = next_id
+                next_id += 1
+            tasks_by_id[task.id] = task
+        return tasks_by_id, next_id
+
+    def replay(self, tasks_by_id, path, next_id=1):
+        """Replay a journal file on top of tasks_by_id.
+
+        Returns (records replayed, next_id raised past every id the journal
+        added or reserved, deleted ones included).
+        """
+        if not os.path.exists(path):
+            return 0, next_id
+        count = 0
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final write from a crash; everything before it is intact
+                    logger.warning("Skipping corrupt journal record in %s", path)
+                    continue
+                self.apply_record(tasks_by_id, record)
+                op = record.get('op')
+                if op == 'add':
+                    next_id = max(next_id, record['task']['id'] + 1)
+                elif op == 'next_id':
+                    next_id = max(next_id, record['id'])
+                count += 1
+        return count, next_id
+
+    def read_tasks(self):
+        """Snapshot + rotated journal + live journal as (tasks_by_id, replayed, next_id).
+
+        Only reads; nothing is opened for writing or compacted.
+        """
+        tasks_by_id, next_id = self.read_snapshot()
+        replayed, next_id = self.replay(tasks_by_id, self.rotated_path, next_id)
+        count, next_id = self.replay(tasks_by_id, self.journal_path, next_id)
+        return tasks_by_id, replayed + count, next_id
+
+    def load(self):
+        """Rebuild the task list from snapshot + rotated journal + live journal"""
+        with self.lock:
+            tasks_by_id, replayed, next_id = self.read_tasks()
+            self.written_next_id = next_id
+            # Ids handed out before load() stay reserved
+            self.next_id = max(next_id, self.next_id or 1)
+            self.records_since_compaction = replayed
+            self.journal_file = open(self.journal_path, 'a')
+        logger.info("Journal replayed %s records over %s tasks", replayed, len(tasks_by_id))
+        if replayed >= self.compact_threshold:
+            self.compact()
+        return list(tasks_by_id.values())
+
+    def allocate_id(self):
+        with self.lock:
+            if self.next_id is None:
+                # Called before load(): continue after the ids already on disk
+                self.next_id = self.written_next_id = self.read_tasks()[2]
+        return super().allocate_id()
+
+    def add(self, task):
+        if task.id is None:
+            task.id = self.allocate_id()
+        self.append({'op': 'add', 'task': task.to_dict()})
+        return task.id
+
+    def update(self, task_id, fields):
+        self.append({'op': 'set', 'id': task_id, 'fields': fields})
+
+    def delete(self, task_id):
+        self.append({'op': 'del', 'id': task_id})
+
+    def clear(self):
+        self.append({'op': 'clear'})
+
+    def append(self, record):
+        """Append one mutation record; cost is independent of the task count"""
+        self.apply_batch([record])
+
+    def apply_batch(self, records):
+        """Append a batch of records with a single write"""
+        if not records:
+            return
+        with self.lock:
+            if self.next_id is not None:
+                # Replay counts added ids as taken; record any other allocation
+                # too, so the ids stay taken even if those tasks go away
+                added = max((record['task']['id'] + 1 for record in records
+                             if record['op'] == 'add'), default=1)
+                if self.next_id > max(added, self.written_next_id or 1):
+                    records = list(records) + [{'op': 'next_id', 'id': self.next_id}]
+                self.written_next_id = max(self.next_id, added)
+            data = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records)
+            if self.journal_file is None:
+                self.journal_file = open(self.journal_path, 'a')
+            self.journal_file.write(data)
+            self.journal_file.flush()
+            self.records_since_compaction += len(records)
+            should_compact = self.records_since_compaction >= self.compact_threshold
+        if should_compact:
+            self.compact()
+
+    def compact(self, wait=False):
+        """Rotate the journal and fold it into the snapshot in the background"""
+        with self.lock:
+            if self.compaction_thread is not None and self.compaction_thread.is_alive():
+                thread = self.compaction_thread
+            else:
+                # A rotated journal left behind by an interrupted compaction is
+                # folded in first; the live journal keeps collecting meanwhile
+                if not os.path.exists(self.rotated_path) and os.path.exists(self.journal_path):
+                    if self.journal_file is not None:
+                        self.journal_file.close()
+                    os.replace(self.journal_path, self.rotated_path)
+                    self.journal_file = open(self.journal_path, 'a')
+                self.records_since_compaction = 0
+                thread = threading.Thread(target=self.write_snapshot, daemon=True)
+                self.compaction_thread = thread
+                thread.start()
+        if wait:
+            thread.join()
+
+    def write_snapshot(self):
+        """Background compaction: snapshot + rotated journal -> new snapshot"""
+        try:
+            start = time.perf_counter()
+            tasks_by_id, next_id = self.read_snapshot()
+            _, next_id = self.replay(tasks_by_id, self.rotated_path, next_id)
+            temp_path = self.snapshot_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(dump_task_columns(tasks_by_id.values(), next_id), f,
+                          separators=(',', ':'))
+            os.replace(temp_path, self.snapshot_path)
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+            logger.debug("Compacted journal into snapshot of %s tasks "
+                         "in %.1f ms", len(tasks_by_id), (time.perf_counter() - start) * 1000)
+        except Exception as e:
+            logger.error("Error compacting task journal: %s", e)
+
+    def close(self):
+        """Fold the journal into the snapshot and close it"""
+        self.compact(wait=True)
+        thread = self.compaction_thread
+        if thread is not None:
+            thread.join()
+        with self.lock:
+            if self.journal_file is not None:
+                self.journal_file.close()
+                self.journal_file = None
+
+class SQLiteTaskStore(TaskStore):
+    """Default task store: stdlib sqlite3 in WAL mode with indexed queries.
+
+    Each mutation is a single-row statement, and history queries go through
+    the completed/created indexes instead of scanning an in-memory list.
+    Every thread gets its own connection, so the background writer and UI
+    reads never share one (WAL lets them run concurrently).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            text TEXT NOT NULL,
+            created REAL NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            completed_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks(completed);
+        CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, db_path='tasks.db'):
+        self.db_path = db_path
+        self.local = threading.local()
+        self.connections = []
+        self.connections_lock = threading.Lock()
+        conn = self.connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(self.SCHEMA)
+        conn.commit()
+        self.upgrade_schema()
+        self.refresh_next_id()
+
+    def connection(self):
+        """Connection owned by the calling thread"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+            with self.connections_lock:
+                self.connections.append(conn)
+        return conn
+
+    def upgrade_schema(self):
+        """Add completed_at and convert a created column still holding ISO strings"""
+        conn = self.connection()
+        columns = {row[1]: row[2] for row in conn.execute('PRAGMA table_info(tasks)')}
+        if 'completed_at' not in columns:
+            with conn:
+                conn.execute('ALTER TABLE tasks ADD COLUMN completed_at REAL')
+        if columns.get('created', '').upper() != 'TEXT':
+            return
+        rows = conn.execute('SELECT id, text, created, completed FROM tasks ORDER BY id').fetchall()
+        with conn:
+            # A TEXT column would coerce epoch floats back into strings, so
+            # the table is rebuilt with the REAL column from SCHEMA
+            conn.execute('ALTER TABLE tasks RENAME TO tasks_iso')
+            conn.execute('DROP INDEX IF EXISTS idx_tasks_completed')
+            conn.execute('DROP INDEX IF EXISTS idx_tasks_created')
+        conn.executescript(self.SCHEMA)
+        with conn:
+            conn.executemany(
+                'INSERT INTO tasks (id, text, created, completed) VALUES (?, ?, ?, ?)',
+                [(task_id, text, Task.to_epoch(created), completed)
+                 for task_id, text, created, completed in rows])
+            conn.execute('DROP TABLE tasks_iso')
+        logger.info("Converted %s task timestamps to epoch seconds", len(rows))
+
+    def refresh_next_id(self):
+        conn = self.connection()
+        max_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM tasks').fetchone()[0]
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'").fetchone()
+        # AUTOINCREMENT never reuses ids, so neither do we
+        self.next_id = max(max_id, row[0] if row else 0) + 1
+
+    @staticmethod
+    def row_to_task(row):
+        return Task(row[1], bool(row[3]), row[2], row[0], row[4])
+
+    def load(self):
+        return list(self.query())
+
+    def add(self, task):
+        if task.id is None:
+            task.id = self.allocate_id()
+        with self.connection() as conn:
+            self.execute_record(conn, {'op': 'add', 'task': task.to_dict()})
+        return task.id
+
+    def update(self, task_id, fields):
+        with self.connection() as conn:
+            self.execute_record(conn, {'op': 'set', 'id': task_id, 'fields': fields})
+
+    def delete(self, task_id):
+        with self.connection() as conn:
+            self.execute_record(conn, {'op': 'del', 'id': task_id})
+
+    def clear(self):
+        with self.connection() as conn:
+            self.execute_record(conn, {'op': 'clear'})
+
+    def apply_batch(self, records):
+        """Apply every record inside one transaction"""
+        if not records:
+            return
+        with self.connection() as conn:
+            for record in records:
+                self.execute_record(conn, record)
+
+    @staticmethod
+    def execute_record(conn, record):
+        op = record['op']
+        if op == 'add':
+            task = record['task']
+            conn.execute(
+                'INSERT OR REPLACE INTO tasks (id, text, created, completed, completed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (task['id'], task['text'], Task.to_epoch(task['created']), int(task['completed']),
+                 task.get('completed_at')))
+        elif op == 'set':
+            fields = record['fields']
+            columns = [name for name in ('text', 'created', 'completed', 'completed_at')
+                       if name in fields]
+            if not columns:
+                return
+            assignments = ', '.join(f"{name} = ?" for name in columns)
+            convert = {'completed': int, 'created': Task.to_epoch}
+            values = [convert.get(name, lambda value: value)(fields[name]) for name in columns]
+            conn.execute(f"UPDATE tasks SET {assignments} WHERE id = ?", values + [record['id']])
+        elif op == 'del':
+            conn.execute('DELETE FROM tasks WHERE id = ?', (record['id'],))
+        elif op == 'clear':
+            conn.execute('DELETE FROM tasks')
+
+    def query(self, completed=None, created_after=None, created_before=None):
+        clauses, params = [], []
+        if completed is not None:
+            clauses.append('completed = ?')
+            params.append(int(completed))
+        if created_after is not None:
+            clauses.append('created >= ?')
+            params.append(Task.to_epoch(created_after))
+        if created_before is not None:
+            clauses.append('created < ?')
+            params.append(Task.to_epoch(created_before))
+        sql = 'SELECT id, text, created, completed, completed_at FROM tasks'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY id'
+        for row in self.connection().execute(sql, params):
+            yield self.row_to_task(row)
+
+    def count(self, completed=None):
+        if completed is None:
+            return self.connection().execute('SELECT COUNT(*) FROM tasks').fetchone()[0]
+        return self.connection().execute('SELECT COUNT(*) FROM tasks WHERE completed = ?',
+                                 (int(completed),)).fetchone()[0]
+
+    def get_meta(self, key):
+        row = self.connection().execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self.connection() as conn:
+            conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def close(self):
+        with self.connections_lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections = []
+        self.local = threading.local()
+
+def migrate_json_to_sqlite(store, snapshot_path='tasks.json', journal_path='tasks.journal'):
+    """One-shot import of tasks.json (plus any pending journal) into SQLite.
+
+    Task ids are preserved and the source files are renamed with a
+    '.migrated' suffix afterwards, so the migration never runs twice.
+    """
+    if store.get_meta('migrated_from_json'):
+        return 0
+    source = JournalTaskStore(snapshot_path, journal_path)
+    source_paths = (snapshot_path, source.rotated_path, journal_path)
+    if not any(os.path.exists(path) for path in source_paths):
+        return 0
+    try:
+        # Read-only: load()/close() would create a journal and compact into tasks.json
+        tasks_by_id, _, next_id = source.read_tasks()
+        tasks = list(tasks_by_id.values())
+        with store.connection() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO tasks (id, text, created, completed, completed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(t.id, t.text, t.created, int(t.completed), t.completed_at) for t in tasks])
+            # Ids of deleted journal tasks stay retired under AUTOINCREMENT too
+            if not conn.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'tasks'",
+                                (next_id - 1,)).rowcount:
+                conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('tasks', ?)",
+                             (next_id - 1,))
+        store.set_meta('migrated_from_json', datetime.now().isoformat())
+        store.refresh_next_id()
+        for path in source_paths:
+            if os.path.exists(path):
+                os.replace(path, path + '.migrated')
+        logger.info("Migrated %s tasks from %s to %s", len(tasks), snapshot_path, store.db_path)
+        return len(tasks)
+    except Exception as e:
+        logger.error("Error migrating tasks to SQLite: %s", e)
+        return 0
+
+def create_task_store():
+    """Build the task store selected by FOCUS_TASK_STORE (sqlite or journal)"""
+    backend = os.getenv('FOCUS_TASK_STORE', 'sqlite').strip().lower()
+    if backend == 'journal':
+        logger.info("Using journal task store")
+        return JournalTaskStore()
+    store = SQLiteTaskStore()
+    migrate_json_to_sqlite(store)
+    logger.info("Using SQLite task store")
+    return store
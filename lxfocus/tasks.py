@@ -0,0 +1,213 @@
+"""Task model plus Markdown/CSV/NDJSON import and export"""
+
+import csv
+import itertools
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+class Task:
+    """A single task: stable integer id, text, epoch timestamps, done flag.
+
+    Slots instead of a per-task dict, and `created` as float seconds since the
+    epoch instead of an ISO string, keep large histories small and make date
+    comparisons plain float comparisons. `completed_at` is when the task was
+    last marked done; it is None for open tasks and for legacy records.
+    """
+
+    __slots__ = ('id', 'text', 'created', 'completed', 'completed_at')
+
+    def __init__(self, text, completed=False, created=None, id=None, completed_at=None):
+        self.id = id
+        self.text = text
+        self.created = time.time() if created is None else created
+        self.completed = completed
+        self.completed_at = completed_at
+
+    def __repr__(self):
+        return f"Task(id={self.id!r}, text={self.text!r}, completed={self.completed!r})"
+
+    @staticmethod
+    def to_epoch(value):
+        """Epoch seconds from a number, datetime or ISO string (legacy files)"""
+        if value is None or value == '':
+            return time.time()
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, datetime):
+            return value.timestamp()
+        try:
+            return float(value)
+        except ValueError:
+            return datetime.fromisoformat(value).timestamp()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a task from a stored record, accepting legacy ISO timestamps"""
+        completed_at = data.get('completed_at')
+        return cls(str(data.get('text', '')), bool(data.get('completed', False)),
+                   cls.to_epoch(data.get('created')), data.get('id'),
+                   None if completed_at is None else cls.to_epoch(completed_at))
+
+    def to_dict(self):
+        return {'id': self.id, 'text': self.text, 'created': self.created,
+                'completed': self.completed, 'completed_at': self.completed_at}
+
+    def created_iso(self):
+        return datetime.fromtimestamp(self.created).isoformat()
+
+    def update(self, fields):
+        """Apply a 'set' record's fields"""
+        if 'text' in fields:
+            self.text = fields['text']
+        if 'completed' in fields:
+            self.completed = bool(fields['completed'])
+        if 'completed_at' in fields:
+            value = fields['completed_at']
+            self.completed_at = None if value is None else self.to_epoch(value)
+        if 'created' in fields:
+            self.created = self.to_epoch(fields['created'])
+
+def load_task_columns(data):
+    """Bulk-build tasks from the columnar snapshot layout.
+
+    {'format': 'columns', 'id': [...], 'text': [...], 'created': [...],
+    'completed': [...], 'completed_at': [...]} stores each field once per
+    column instead of repeating the keys for every task, and loads with a
+    single zip over the columns. Older snapshots have no completed_at column.
+    'next_id' records the next free id, so ids of deleted tasks are not reused.
+    """
+    completed_at = data.get('completed_at') or itertools.repeat(None)
+    return [Task(text, bool(completed), created, task_id, done_at)
+            for task_id, text, created, completed, done_at
+            in zip(data['id'], data['text'], data['created'], data['completed'], completed_at)]
+
+def dump_task_columns(tasks, next_id=None):
+    """Columnar snapshot of tasks; next_id is the store's id high-water mark"""
+    tasks = list(tasks)
+    if next_id is None:
+        next_id = max((task.id for task in tasks), default=0) + 1
+    return {'format': 'columns', 'next_id': next_id,
+            'id': [task.id for task in tasks],
+            'text': [task.text for task in tasks],
+            'created': [task.created for task in tasks],
+            'completed': [int(task.completed) for task in tasks],
+            'completed_at': [task.completed_at for task in tasks]}
+
+MARKDOWN_TASK = re.compile(r'^\s*[-*+]\s+\[([ xX])\]\s+(.*\S)\s*$')
+
+def make_task(text, completed=False, created=None):
+    """Task for an imported row; an unreadable created time falls back to now"""
+    try:
+        created = Task.to_epoch(created)
+    except (TypeError, ValueError):
+        logger.warning("Unreadable created time %r in import; using now", created)
+        created = None
+    return Task(text, bool(completed), created)
+
+def parse_bool(value):
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'y', 'x', 'done')
+
+def parse_markdown_tasks(lines):
+    """Yield tasks from '- [ ] text' / '- [x] text' checklist lines"""
+    for line in lines:
+        match = MARKDOWN_TASK.match(line)
+        if match:
+            yield make_task(match.group(2), match.group(1) != ' ')
+
+def parse_csv_tasks(lines):
+    """Yield tasks from CSV with a text,completed,created header (or bare text rows)"""
+    rows = csv.reader(lines)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = [name.strip().lower() for name in header]
+    if 'text' not in columns:
+        # Headerless file: first column is the task text
+        columns = ['text', 'completed', 'created']
+        rows = itertools.chain([header], rows)
+    for row in rows:
+        record = dict(zip(columns, row))
+        text = record.get('text', '').strip()
+        if text:
+            yield make_task(text, parse_bool(record.get('completed', '')),
+                            record.get('created') or None)
+
+def parse_ndjson_tasks(lines):
+    """Yield tasks from newline-delimited JSON objects"""
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            logger.warning("Skipping invalid NDJSON line %s", number)
+            continue
+        if not isinstance(record, dict):
+            logger.warning("Skipping NDJSON line %s: not an object", number)
+            continue
+        text = str(record.get('text', '')).strip()
+        completed = record.get('completed', False)
+        if isinstance(completed, str):
+            completed = parse_bool(completed)
+        if text:
+            yield make_task(text, completed, record.get('created'))
+
+TASK_FORMATS = {
+    '.md': 'markdown', '.markdown': 'markdown', '.txt': 'markdown',
+    '.csv': 'csv',
+    '.ndjson': 'ndjson', '.jsonl': 'ndjson',
+}
+
+TASK_PARSERS = {
+    'markdown': parse_markdown_tasks,
+    'csv': parse_csv_tasks,
+    'ndjson': parse_ndjson_tasks,
+}
+
+def task_format_for(path):
+    fmt = TASK_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"Unsupported task file type: {path}")
+    return fmt
+
+def iter_task_file(path):
+    """Stream tasks out of a Markdown, CSV or NDJSON file"""
+    parser = TASK_PARSERS[task_format_for(path)]
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        yield from parser(f)
+
+def chunked(iterable, size):
+    """Yield lists of up to size items without materializing the input"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def export_tasks(path, tasks):
+    """Stream tasks to a Markdown, CSV or NDJSON file; returns the count"""
+    fmt = task_format_for(path)
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(['text', 'completed', 'created'])
+        for task in tasks:
+            if fmt == 'markdown':
+                f.write(f"- [{'x' if task.completed else ' '}] {task.text}\n")
+            elif fmt == 'csv':
+                writer.writerow([task.text, 'true' if task.completed else 'false',
+                                 task.created_iso()])
+            else:
+                f.write(json.dumps({'text': task.text, 'completed': task.completed,
+                                    'created': task.created_iso()}, ensure_ascii=False) + '\n')
+            count += 1
+    return count
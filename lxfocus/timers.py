@@ -0,0 +1,235 @@
+"""Countdowns on a single deadline heap, and a Tk-free after() scheduler"""
+
+import heapq
+import itertools
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+class Countdown:
+    """One named countdown; all of its wakeups go through a TimerEngine heap.
+
+    The countdown keeps an absolute monotonic deadline. With an on_tick
+    callback it asks to be woken at each whole-second boundary of the
+    remaining time, otherwise only at the deadline. Wakeup lateness is
+    measured as drift but never accumulates, since every wakeup re-reads the clock.
+    """
+
+    def __init__(self, engine, name, duration, on_tick=None, on_complete=None):
+        self.engine = engine
+        self.name = name
+        self.on_tick = on_tick
+        self.on_complete = on_complete
+        self.duration = float(duration)
+        self.remaining = float(duration)  # Authoritative only while paused
+        self.deadline = None
+        self.expected_wakeup = None
+        self.generation = 0  # Bumped on pause so queued wakeups go stale
+        self.reset_drift()
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    def reset_drift(self):
+        self.drift_count = 0
+        self.drift_total = 0.0
+        self.drift_max = 0.0
+        self.drift_last = 0.0
+
+    def drift_stats(self):
+        """Measured wakeup lateness in milliseconds"""
+        mean = self.drift_total / self.drift_count if self.drift_count else 0.0
+        return {
+            'ticks': self.drift_count,
+            'last_ms': self.drift_last * 1000,
+            'mean_ms': mean * 1000,
+            'max_ms': self.drift_max * 1000,
+        }
+
+    def remaining_seconds(self):
+        """Exact remaining time as a float"""
+        if self.deadline is None:
+            return self.remaining
+        return max(0.0, self.deadline - self.engine.clock())
+
+    def display_seconds(self):
+        """Remaining whole seconds as shown on the clock face (rounded up)"""
+        return int(math.ceil(self.remaining_seconds() - 1e-6))
+
+    def set_duration(self, seconds):
+        self.pause()
+        self.duration = float(seconds)
+        self.remaining = float(seconds)
+        self.reset_drift()
+
+    def start(self):
+        if self.running or self.remaining <= 0:
+            return False
+        self.deadline = self.engine.clock() + self.remaining
+        self.engine.schedule(self)
+        return True
+
+    def pause(self):
+        """Stop counting, keeping the sub-second remainder for resume"""
+        if not self.running:
+            return
+        self.remaining = self.remaining_seconds()
+        self.deadline = None
+        self.generation += 1
+        self.engine.arm()
+        stats = self.drift_stats()
+        logger.debug("Timer %s paused with %.3fs left; drift mean "
+                     "%.2f ms, max %.2f ms", self.name, self.remaining, stats['mean_ms'], stats['max_ms'])
+
+    def next_wakeup(self, now):
+        """Next whole-second boundary of the remaining time, or the deadline"""
+        if self.on_tick is None:
+            return self.deadline
+        remaining = self.deadline - now
+        next_boundary = max(0.0, math.ceil(remaining - 1e-6) - 1)
+        return now + max(0.0, remaining - next_boundary)
+
+    def fire(self, now):
+        drift = max(0.0, now - self.expected_wakeup)
+        self.drift_last = drift
+        self.drift_total += drift
+        self.drift_max = max(self.drift_max, drift)
+        self.drift_count += 1
+        if self.deadline - now <= 0.0005:
+            self.remaining = 0.0
+            self.deadline = None
+            stats = self.drift_stats()
+            logger.info("Timer %s finished; drift mean %.2f ms, max %.2f ms over %s ticks",
+                        self.name, stats['mean_ms'], stats['max_ms'], stats['ticks'])
+            if self.on_complete is not None:
+                self.on_complete()
+            return
+        self.on_tick()
+        self.engine.schedule(self)
+
+class TimerEngine:
+    """Runs any number of named countdowns from one heap of deadlines.
+
+    Each running countdown has one pending entry (due time, sequence,
+    countdown, generation) in the heap. Only the earliest entry holds a
+    root.after wakeup, so there is one pending callback however many timers
+    run. Pausing bumps the countdown's generation instead of searching the
+    heap; stale entries are dropped when they reach the top.
+    """
+
+    def __init__(self, root, clock=time.monotonic):
+        self.root = root
+        self.clock = clock
+        self.timers = {}
+        self.heap = []
+        self.counter = itertools.count()
+        self.after_id = None
+        self.armed_for = None
+        self.waking = False
+
+    def create(self, name, duration, on_tick=None, on_complete=None):
+        """Add (or replace) a named countdown; it starts paused"""
+        self.remove(name)
+        countdown = Countdown(self, name, duration, on_tick, on_complete)
+        self.timers[name] = countdown
+        return countdown
+
+    def get(self, name):
+        return self.timers.get(name)
+
+    def remove(self, name):
+        countdown = self.timers.pop(name, None)
+        if countdown is not None:
+            countdown.pause()
+        return countdown
+
+    def schedule(self, countdown):
+        now = self.clock()
+        due = countdown.next_wakeup(now)
+        countdown.expected_wakeup = due
+        heapq.heappush(self.heap, (due, next(self.counter), countdown, countdown.generation))
+        self.arm()
+
+    @staticmethod
+    def is_live(entry):
+        _, _, countdown, generation = entry
+        return countdown.running and countdown.generation == generation
+
+    def arm(self):
+        """Point the single after() wakeup at the earliest live deadline"""
+        if self.waking:
+            return
+        while self.heap and not self.is_live(self.heap[0]):
+            heapq.heappop(self.heap)
+        if len(self.heap) > 4 * len(self.timers) + 16:
+            # Rapid start/stop leaves stale entries behind; drop them in one pass
+            self.heap = [entry for entry in self.heap if self.is_live(entry)]
+            heapq.heapify(self.heap)
+        due = self.heap[0][0] if self.heap else None
+        if due == self.armed_for:
+            return
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.armed_for = due
+        if due is not None:
+            delay = max(0.0, due - self.clock())
+            self.after_id = self.root.after(int(math.ceil(delay * 1000)), self.wake)
+
+    def wake(self):
+        self.after_id = None
+        self.armed_for = None
+        self.waking = True
+        try:
+            now = self.clock()
+            # Everything due within a millisecond fires on this one wakeup
+            while self.heap and self.heap[0][0] <= now + 0.001:
+                entry = heapq.heappop(self.heap)
+                if self.is_live(entry):
+                    entry[2].fire(now)
+        finally:
+            self.waking = False
+        self.arm()
+
+class HeadlessScheduler:
+    """Minimal stand-in for Tk's after/after_cancel when running without a UI"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.queue = []
+        self.cancelled = set()
+        self.counter = itertools.count(1)
+
+    def after(self, ms, callback):
+        after_id = next(self.counter)
+        heapq.heappush(self.queue, (self.clock() + ms / 1000.0, after_id, callback))
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.cancelled.add(after_id)
+
+    def run_pending(self):
+        """Run every callback that is due; returns how many ran"""
+        ran = 0
+        while self.queue and self.queue[0][0] <= self.clock():
+            _, after_id, callback = heapq.heappop(self.queue)
+            if after_id in self.cancelled:
+                self.cancelled.discard(after_id)
+                continue
+            callback()
+            ran += 1
+        return ran
+
+    def run(self, timeout=None):
+        """Sleep between deadlines until the queue drains (or timeout passes)"""
+        end = None if timeout is None else self.clock() + timeout
+        while self.queue and (end is None or self.clock() < end):
+            delay = self.queue[0][0] - self.clock()
+            if end is not None:
+                delay = min(delay, end - self.clock())
+            if delay > 0:
+                time.sleep(delay)
+            self.run_pending()
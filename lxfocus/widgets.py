@@ -0,0 +1,540 @@
+"""Tk building blocks: background, feature boxes, virtual task list, frame pacing"""
+
+import logging
+import math
+import time
+import tkinter as tk
+import tkinter.font as tkfont
+from array import array
+from collections import OrderedDict
+
+from .config import load_app_config
+
+logger = logging.getLogger(__name__)
+
+# Unit hexagon vertex table (x0, y0, x1, y1, ...), computed once at import
+UNIT_HEXAGON = tuple(coord for i in range(6)
+                     for coord in (math.cos(i * math.pi / 3), math.sin(i * math.pi / 3)))
+
+class HexagonBackgroundEngine:
+    """Single hexagon grid renderer shared by every background canvas.
+
+    Cells are kept as a flat array('i') of centre coordinates rather than
+    per-cell objects. The grid repeats every `spacing` pixels horizontally and
+    every 2 * `spacing` vertically, so one tile is rasterized (and cached) and
+    Tk's photo copy tiles it into a single canvas image item. Tiles are cached
+    per Tk interpreter, since images cannot be shared between them. On resize only
+    the newly exposed strips are tiled; nothing is deleted and redrawn.
+    """
+
+    tiles = OrderedDict()
+    max_tiles = 4
+
+    def __init__(self, canvas, spacing=40, size=8, color='#404040', tag='background_hexagon'):
+        self.canvas = canvas
+        self.spacing = spacing
+        self.size = size
+        self.color = color
+        self.tag = tag
+        self.image = None
+        self.item = None
+        self.width = 0
+        self.height = 0
+
+    @staticmethod
+    def cell_centers(x0, y0, x1, y1, spacing):
+        """Flat array of (x, y) centres of every cell in [x0, x1] x [y0, y1]"""
+        cells = array('i')
+        y = (y0 // spacing) * spacing
+        while y <= y1:
+            # Offset every other row for proper hexagon grid
+            offset = spacing // 2 if (y // spacing) % 2 == 1 else 0
+            x = ((x0 - offset) // spacing) * spacing + offset
+            while x <= x1:
+                cells.append(x)
+                cells.append(y)
+                x += spacing
+            y += spacing
+        return cells
+
+    def outline_points(self, cx, cy):
+        """Polygon points of the hexagon centred on (cx, cy)"""
+        size = self.size
+        return [cy + size * v if i % 2 else cx + size * v for i, v in enumerate(UNIT_HEXAGON)]
+
+    def tile(self):
+        """Rasterize (or fetch) one repeating tile of the grid"""
+        # A PhotoImage only exists in the Tk interpreter that created it
+        key = (self.canvas.tk, self.spacing, self.size, self.color)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+            return tile
+        width, height = self.spacing, 2 * self.spacing
+        tile = tk.PhotoImage(master=self.canvas, width=width, height=height)
+        pixels = set()
+        # Include neighbouring cells so hexagons straddling the tile edge join up
+        margin = self.spacing
+        cells = self.cell_centers(-margin, -margin, width + margin, height + margin, self.spacing)
+        for c in range(0, len(cells), 2):
+            points = self.outline_points(cells[c], cells[c + 1])
+            for v in range(0, 12, 2):
+                x0, y0 = points[v], points[v + 1]
+                x1, y1 = points[(v + 2) % 12], points[(v + 3) % 12]
+                steps = int(max(abs(x1 - x0), abs(y1 - y0))) + 1
+                for step in range(steps + 1):
+                    t = step / steps
+                    px = int(round(x0 + (x1 - x0) * t))
+                    py = int(round(y0 + (y1 - y0) * t))
+                    if 0 <= px < width and 0 <= py < height:
+                        pixels.add((px, py))
+        for px, py in pixels:
+            tile.put(self.color, to=(px, py, px + 1, py + 1))
+        self.tiles[key] = tile
+        while len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+        return tile
+
+    def fill(self, x0, y0, x1, y1):
+        """Tile the grid into a region, aligned to the tile period"""
+        x0 -= x0 % self.spacing
+        y0 -= y0 % (2 * self.spacing)
+        if x1 > x0 and y1 > y0:
+            self.image.tk.call(self.image, 'copy', self.tile(), '-to', x0, y0, x1, y1)
+
+    def resize(self, width, height):
+        """Grow or crop the background to width x height, drawing only new strips"""
+        if width <= 1 or height <= 1 or (width, height) == (self.width, self.height):
+            return
+        if self.image is None:
+            self.image = tk.PhotoImage(master=self.canvas, width=width, height=height)
+            self.item = self.canvas.create_image(0, 0, image=self.image, anchor='nw', tags=self.tag)
+            self.canvas.tag_lower(self.item)
+            self.fill(0, 0, width, height)
+        else:
+            old_width, old_height = self.width, self.height
+            # Shrinking crops the photo; only area beyond the old extent is new
+            self.image.configure(width=width, height=height)
+            if width > old_width:
+                self.fill(old_width, 0, width, height)
+            if height > old_height:
+                self.fill(0, old_height, min(width, old_width), height)
+        self.width, self.height = width, height
+        logger.debug("Hexagon background extended to %sx%s", width, height)
+
+class StaticHexagonBackground(tk.Canvas):
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.grid_spacing = 40  # Spacing between hexagons
+        self.hexagon_size = 8   # Size of each hexagon
+        self.engine = HexagonBackgroundEngine(self, self.grid_spacing, self.hexagon_size,
+                                              tag="hexagon")
+        logger.info("Initializing StaticHexagonBackground with hexagon grid")
+        self.setup_background()
+    
+    def setup_background(self):
+        self.configure(bg='#1e1e1e', highlightthickness=0)
+        self.bind('<Configure>', self.on_resize)
+        self.create_hexagon_grid()
+        logger.info("Static hexagon grid background setup complete")
+    
+    @property
+    def hexagons(self):
+        """Flat array of (x, y) hexagon centres currently covered"""
+        return HexagonBackgroundEngine.cell_centers(0, 0, self.engine.width, self.engine.height,
+                                                    self.grid_spacing)
+    
+    def create_hexagon_grid(self):
+        # Get actual canvas dimensions, with fallback to default
+        canvas_width = self.winfo_width()
+        canvas_height = self.winfo_height()
+        
+        # Ensure we have valid dimensions
+        if canvas_width < 10 or canvas_height < 10:
+            canvas_width = 410
+            canvas_height = 660
+        
+        self.engine.resize(canvas_width, canvas_height)
+    
+    def on_resize(self, event):
+        if event.width > 1 and event.height > 1:
+            self.engine.resize(event.width, event.height)
+
+class FeatureBox(tk.Frame):
+    def __init__(self, parent, title, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.title = title
+        logger.info("Creating FeatureBox: %s", title)
+        self.setup_box()
+    
+    def setup_box(self):
+        config = load_app_config()
+        # Box styling with glass effect
+        self.configure(bg=config.color('frame_background'), relief='flat', borderwidth=0)
+        
+        # Title bar with glass accent
+        title_frame = tk.Frame(self, bg=config.color('accent'), height=28)
+        title_frame.pack(fill='x', pady=(0, 1))
+        title_frame.pack_propagate(False)
+        
+        title_label = tk.Label(title_frame, text=self.title, 
+                              font=(config.font('title'), 9, "bold"),
+                              bg=config.color('accent'), fg=config.color('text'))
+        title_label.pack(side='left', padx=12, pady=4)
+        
+        # Content area with glass background
+        self.content_frame = tk.Frame(self, bg=config.color('frame_background'))
+        self.content_frame.pack(fill='both', expand=True, padx=1, pady=(0, 1))
+        
+        logger.info("FeatureBox %s setup complete", self.title)
+
+class VirtualTaskList:
+    """Listbox front-end that only materializes the rows currently in view.
+
+    The listbox holds at most `capacity` rows starting at model index `first`.
+    Mutations are applied as diffs (inserted/updated/removed), so a one-task
+    change costs a constant number of Tk calls regardless of list length.
+    A model can be a partial result; `on_end` is called when scrolling or
+    selection needs rows past its end, and may extend it with extend_rows().
+    """
+
+    DEFAULT_CAPACITY = 30
+
+    def __init__(self, listbox, rows, completed_color='#28a745'):
+        self.listbox = listbox
+        self.rows = rows
+        self.completed_color = completed_color
+        self.first = 0
+        self.capacity = self.DEFAULT_CAPACITY
+        self.selected = None
+        self.line_height = None
+        self.on_end = None
+        self.listbox.bind('<Configure>', self.on_resize, add='+')
+        self.listbox.bind('<<ListboxSelect>>', self.on_select, add='+')
+        self.listbox.bind('<Up>', lambda e: self.move_selection(-1))
+        self.listbox.bind('<Down>', lambda e: self.move_selection(1))
+
+    @staticmethod
+    def format_row(task):
+        status = "✓ " if task.completed else "□ "
+        return f"{status}{task.text}"
+
+    def window_size(self):
+        return min(self.capacity, max(0, len(self.rows) - self.first))
+
+    def put_row(self, position, task):
+        """Insert one model row at a listbox position (2 Tk calls at most)"""
+        self.listbox.insert(position, self.format_row(task))
+        if task.completed:
+            self.listbox.itemconfig(position, fg=self.completed_color)
+
+    def restore_selection(self):
+        if self.selected is not None and self.first <= self.selected < self.first + self.window_size():
+            self.listbox.selection_set(self.selected - self.first)
+
+    def set_rows(self, rows):
+        """Swap in a new model and re-render the visible window"""
+        self.rows = rows
+        self.selected = None
+        self.render()
+
+    def extend_rows(self, rows):
+        """Swap in a longer model that starts with the current rows"""
+        self.rows = rows
+        self.render()
+
+    def need_rows(self, end):
+        if self.on_end is not None and end > len(self.rows):
+            self.on_end()
+
+    def render(self):
+        """Full re-render of the visible window only (O(capacity) Tk calls)"""
+        self.first = max(0, min(self.first, len(self.rows) - self.capacity))
+        self.listbox.delete(0, tk.END)
+        for offset in range(self.window_size()):
+            self.put_row(tk.END, self.rows[self.first + offset])
+        self.restore_selection()
+
+    def inserted(self, index):
+        """A row was inserted into the model at index"""
+        if self.selected is not None and self.selected >= index:
+            self.selected += 1
+        if index < self.first:
+            # Keep the same tasks on screen; only the window offset moves
+            self.first += 1
+            return
+        position = index - self.first
+        if position >= self.capacity:
+            return
+        self.put_row(position, self.rows[index])
+        if self.listbox.size() > self.capacity:
+            self.listbox.delete(tk.END)
+
+    def updated(self, index):
+        """The model row at index changed in place"""
+        if not self.first <= index < self.first + self.window_size():
+            return
+        position = index - self.first
+        self.listbox.delete(position)
+        self.put_row(position, self.rows[index])
+        if self.selected == index:
+            self.listbox.selection_set(position)
+
+    def removed(self, index):
+        """The model row at index was removed"""
+        if self.selected is not None:
+            if self.selected == index:
+                self.selected = None
+            elif self.selected > index:
+                self.selected -= 1
+        if index < self.first:
+            self.first -= 1
+            return
+        position = index - self.first
+        if position >= self.capacity:
+            return
+        self.listbox.delete(position)
+        # Pull the next model row up into the freed slot, if any
+        refill = self.first + self.listbox.size()
+        if refill < len(self.rows) and self.listbox.size() < self.capacity:
+            self.put_row(tk.END, self.rows[refill])
+        elif self.listbox.size() == 0 and self.first > 0:
+            self.render()
+
+    def selected_index(self):
+        """Model index of the selected row, or None"""
+        selection = self.listbox.curselection()
+        if selection:
+            return self.first + selection[0]
+        return None
+
+    def on_select(self, event=None):
+        self.selected = self.selected_index()
+
+    def move_selection(self, delta):
+        """Keyboard navigation across the whole model, scrolling as needed"""
+        if not self.rows:
+            return "break"
+        current = self.selected if self.selected is not None else self.first - delta
+        self.need_rows(current + delta + 1)
+        target = max(0, min(len(self.rows) - 1, current + delta))
+        if target < self.first:
+            self.scroll(target - self.first)
+        elif target >= self.first + self.capacity:
+            self.scroll(target - self.first - self.capacity + 1)
+        self.listbox.selection_clear(0, tk.END)
+        self.selected = target
+        self.restore_selection()
+        self.listbox.activate(target - self.first)
+        return "break"
+
+    def scroll(self, units):
+        """Slide the window by units rows, re-using the rows still on screen"""
+        self.need_rows(self.first + units + self.capacity)
+        new_first = max(0, min(self.first + units, len(self.rows) - self.capacity))
+        delta = new_first - self.first
+        if delta == 0:
+            return
+        if abs(delta) >= self.capacity:
+            self.first = new_first
+            self.render()
+            return
+        self.listbox.selection_clear(0, tk.END)
+        if delta > 0:
+            self.listbox.delete(0, delta - 1)
+            start = self.first + self.listbox.size() + delta
+            self.first = new_first
+            for index in range(start, min(len(self.rows), self.first + self.capacity)):
+                self.put_row(tk.END, self.rows[index])
+        else:
+            self.first = new_first
+            for index in range(self.first - delta - 1, self.first - 1, -1):
+                self.put_row(0, self.rows[index])
+            if self.listbox.size() > self.capacity:
+                self.listbox.delete(self.capacity, tk.END)
+        self.restore_selection()
+
+    def on_resize(self, event):
+        """Recompute how many rows fit and materialize exactly that many"""
+        if self.line_height is None:
+            self.line_height = max(1, tkfont.Font(font=self.listbox.cget('font')).metrics('linespace') + 1)
+        capacity = max(1, event.height // self.line_height + 1)
+        if capacity != self.capacity:
+            self.capacity = capacity
+            self.need_rows(self.first + capacity)
+            self.render()
+
+class ScrollLayoutTracker:
+    """Scroll region and scrollbar state for a canvas hosting one window item.
+
+    Extents come from <Configure> events of the embedded frame and of the
+    canvas, never from bbox("all"), so the background items are ignored and
+    each check is O(1). Tk is only touched when a cached value changes.
+    With a FrameScheduler, refreshes are deferred to the next frame.
+    """
+
+    OVERFLOW_BUFFER = 10
+
+    def __init__(self, canvas, window_item, frame, scrollbar, frames=None):
+        self.canvas = canvas
+        self.window_item = window_item
+        self.scrollbar = scrollbar
+        self.content_width = 0
+        self.content_height = 0
+        self.canvas_width = 0
+        self.canvas_height = 0
+        self.window_width = None
+        self.scrollregion = None
+        self.scrollbar_shown = False
+        self.frames = frames
+        if frames is not None:
+            frames.register('scrollbar', self.refresh)
+        frame.bind('<Configure>', self.on_content_configure, add='+')
+        canvas.bind('<Configure>', self.on_canvas_configure, add='+')
+
+    def on_content_configure(self, event):
+        if (event.width, event.height) != (self.content_width, self.content_height):
+            self.content_width, self.content_height = event.width, event.height
+            self.request_refresh()
+
+    def on_canvas_configure(self, event):
+        if (event.width, event.height) != (self.canvas_width, self.canvas_height):
+            self.canvas_width, self.canvas_height = event.width, event.height
+            self.request_refresh()
+
+    def request_refresh(self):
+        if self.frames is not None:
+            self.frames.mark('scrollbar')
+        else:
+            self.refresh()
+
+    def needs_scrollbar(self):
+        return (self.canvas_height > 1 and
+                self.content_height > self.canvas_height + self.OVERFLOW_BUFFER)
+
+    def refresh(self):
+        # The embedded frame always spans the canvas width
+        if self.canvas_width > 1 and self.canvas_width != self.window_width:
+            self.window_width = self.canvas_width
+            self.canvas.itemconfig(self.window_item, width=self.canvas_width)
+        region = (0, 0, self.content_width, self.content_height)
+        if region != self.scrollregion:
+            self.scrollregion = region
+            self.canvas.configure(scrollregion=region)
+        shown = self.needs_scrollbar()
+        if shown != self.scrollbar_shown:
+            self.scrollbar_shown = shown
+            if shown:
+                self.scrollbar.pack(side='right', fill='y')
+            else:
+                self.scrollbar.pack_forget()
+
+class FrameScheduler:
+    """Coalesces UI work into frames paced at a target rate.
+
+    Callers mark named jobs dirty; the next frame runs each dirty job once,
+    in registration order, however many times it was marked. Frames that
+    start a full period late count as dropped, and frames whose jobs take
+    longer than the period count as over budget.
+    """
+
+    def __init__(self, root, fps=60, clock=time.monotonic):
+        self.root = root
+        self.clock = clock
+        self.period = 1.0 / fps
+        self.jobs = OrderedDict()
+        self.dirty = set()
+        self.frame_job = None
+        self.due = None
+        self.last_frame = None
+        self.frames = 0
+        self.dropped = 0
+        self.over_budget = 0
+        self.worst_ms = 0.0
+
+    def register(self, name, callback):
+        self.jobs[name] = callback
+
+    def mark(self, name):
+        self.dirty.add(name)
+        if self.frame_job is None:
+            # Keep to the frame cadence: run a full period after the last
+            # frame, or straight away if the loop has been quiet for longer
+            now = self.clock()
+            delay = 0.0
+            if self.last_frame is not None:
+                delay = max(0.0, self.last_frame + self.period - now)
+            self.due = now + delay
+            self.frame_job = self.root.after(int(delay * 1000), self.run_frame)
+
+    def run_frame(self):
+        self.frame_job = None
+        start = self.clock()
+        late = start - self.due
+        if late >= self.period:
+            self.dropped += int(late / self.period)
+        dirty, self.dirty = self.dirty, set()
+        for name, callback in self.jobs.items():
+            if name in dirty:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error("Frame job %s failed: %s", name, e)
+        self.last_frame = start
+        self.frames += 1
+        elapsed = self.clock() - start
+        self.worst_ms = max(self.worst_ms, elapsed * 1000)
+        if elapsed > self.period:
+            self.over_budget += 1
+            logger.debug("Frame over budget: %.1f ms (%s)", elapsed * 1000, ", ".join(sorted(dirty)))
+
+    def flush(self):
+        """Run pending work now, e.g. before the window goes away"""
+        if self.frame_job is not None:
+            self.root.after_cancel(self.frame_job)
+            self.run_frame()
+
+    def stats(self):
+        return {'frames': self.frames, 'dropped': self.dropped,
+                'over_budget': self.over_budget, 'worst_ms': round(self.worst_ms, 2)}
+
+class PerformanceHUD:
+    """Debug overlay in the canvas corner showing loop lag and slowest handlers"""
+
+    def __init__(self, canvas, monitor, frames=None, refresh_ms=500, rows=4):
+        self.canvas = canvas
+        self.monitor = monitor
+        self.frames = frames
+        self.refresh_ms = refresh_ms
+        self.rows = rows
+        self.item = canvas.create_text(8, 8, anchor='nw', fill='#7CFC00',
+                                       font=(load_app_config().font('monospace'), 8),
+                                       tags=('perf_hud',))
+        self.update()
+
+    def lines(self):
+        snapshot = self.monitor.snapshot()
+        lines = []
+        lag = snapshot.pop('loop_lag', None)
+        if lag:
+            lines.append(f"loop lag p50 {lag['p50_ms']:.1f} p95 {lag['p95_ms']:.1f} "
+                         f"max {lag['max_ms']:.1f} ms")
+        if self.frames is not None:
+            stats = self.frames.stats()
+            lines.append(f"frames {stats['frames']} dropped {stats['dropped']} "
+                         f"over budget {stats['over_budget']}")
+        slowest = sorted(snapshot.items(), key=lambda item: item[1]['p95_ms'], reverse=True)
+        for name, stats in slowest[:self.rows]:
+            lines.append(f"{name} n={stats['count']} p95 {stats['p95_ms']:.1f} "
+                         f"max {stats['max_ms']:.1f} ms")
+        return lines
+
+    def update(self):
+        try:
+            # Pinned to the visible corner and kept above everything else
+            self.canvas.coords(self.item, self.canvas.canvasx(8), self.canvas.canvasy(8))
+            self.canvas.itemconfig(self.item, text="\n".join(self.lines()))
+            self.canvas.tag_raise(self.item)
+        except tk.TclError:
+            return
+        self.canvas.after(self.refresh_ms, self.update)
@@ -2,7 +2,7 @@
 echo Starting Focus Tool...
 echo.
 
-python focus_tool.py
+python focus_tool.py %*
 
 echo.
 echo Focus Tool has exited.
@@ -7,6 +7,18 @@ import subprocess
 import sys
 import os
 
+def forward_to_running_instance(script_dir, argv):
+    """Hand argv to an already running Focus Tool without starting a new interpreter"""
+    if any(arg.startswith('-') for arg in argv):
+        return False  # Options only make sense for a fresh start
+    sys.path.insert(0, script_dir)
+    try:
+        from lxfocus.instance import forward_commands, parse_command
+        reply = forward_commands(parse_command(argv))
+    except (ImportError, ValueError, OSError):
+        return False  # Let focus_tool.py report it
+    return bool(reply and reply.get('ok'))
+
 def main():
     try:
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,6 +28,9 @@ def main():
             print(f"Error: focus_tool.py not found at {focus_tool_path}")
             sys.exit(1)
         
+        if forward_to_running_instance(script_dir, sys.argv[1:]):
+            return
+        
         print("Starting Focus Tool...")
         # On Windows, prefer pythonw.exe to hide the console window
         python_exec = sys.executable
@@ -30,7 +45,7 @@ def main():
         env.setdefault('FOCUS_LOG_LEVEL', 'INFO')
         env.setdefault('FOCUS_DEBUG', '0')
         # Launch without inheriting a console window (pythonw on Windows)
-        subprocess.Popen([python_exec, focus_tool_path], env=env, shell=False)
+        subprocess.Popen([python_exec, focus_tool_path] + sys.argv[1:], env=env, shell=False)
         
     except Exception as e:
         print(f"Error launching Focus Tool: {e}")
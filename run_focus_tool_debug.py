@@ -23,7 +23,7 @@ def main():
         env = os.environ.copy()
         env['FOCUS_DEBUG'] = '1'
         env['FOCUS_LOG_LEVEL'] = 'DEBUG'
-        subprocess.run([sys.executable, focus_tool_path], env=env)
+        subprocess.run([sys.executable, focus_tool_path] + sys.argv[1:], env=env)
 
     except Exception as e:
         print(f"Error launching Focus Tool (DEBUG): {e}")
@@ -0,0 +1,59 @@
+"""Control API dispatch: parameter validation and error codes, without sockets"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from lxfocus.control import INTERNAL_ERROR, INVALID_PARAMS, ControlConnection, ControlServer
+from lxfocus.core import FocusCore
+from lxfocus.storage import SQLiteTaskStore
+from lxfocus.timers import HeadlessScheduler
+
+
+class ControlDispatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_dir = os.getcwd()
+        self.workdir = tempfile.TemporaryDirectory()
+        os.chdir(self.workdir.name)
+        scheduler = HeadlessScheduler()
+        self.core = FocusCore(scheduler=scheduler, store=SQLiteTaskStore('tasks.db'), config={})
+        self.core.load_tasks()
+        self.server = ControlServer(self.core, scheduler)
+        self.connection = ControlConnection(self.server)
+
+    def tearDown(self):
+        self.core.store.close()
+        os.chdir(self.previous_dir)
+        self.workdir.cleanup()
+
+    def call(self, method, **params):
+        request = {'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params}
+        return self.connection.handle_line(json.dumps(request).encode('utf-8'))
+
+    def test_completed_must_be_a_boolean(self):
+        task = self.core.add_task('Write report')
+        reply = self.call('tasks.update', id=task.id, completed='false', text='Renamed')
+        self.assertEqual(reply['error']['code'], INVALID_PARAMS)
+        self.assertFalse(task.completed)
+        self.assertEqual(task.text, 'Write report')
+        reply = self.call('tasks.update', id=task.id, completed=True)
+        self.assertTrue(reply['result']['completed'])
+
+    def test_bad_arguments_are_invalid_params(self):
+        reply = self.call('tasks.get', idx=1)
+        self.assertEqual(reply['error']['code'], INVALID_PARAMS)
+
+    def test_handler_bug_is_internal_error(self):
+        def broken(connection):
+            return len(None)
+        self.server.methods['broken'] = broken
+        with self.assertLogs('lxfocus.control', level='ERROR') as logs:
+            reply = self.call('broken')
+        self.assertEqual(reply['error']['code'], INTERNAL_ERROR)
+        self.assertIn('Traceback', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""TaskSearchIndex: limited searches agree with a brute-force filter"""
+
+import random
+import unittest
+
+from lxfocus.search import TaskSearchIndex
+from lxfocus.tasks import Task
+
+
+class TaskSearchIndexTest(unittest.TestCase):
+
+    WORDS = ['ab', 'abc', 'b', 'ba', 'bcd', 'c', 'ca', 'cab', 'xy', 'x']
+
+    def brute_force(self, tasks, query, status, limit):
+        terms = TaskSearchIndex.tokenize(query)
+        ids = sorted(task.id for task in tasks.values()
+                     if all(any(token.startswith(term) for token in TaskSearchIndex.tokenize(task.text))
+                            for term in terms)
+                     and (status == 'all' or task.completed == (status == 'completed')))
+        return ids[:limit] if limit is not None else ids
+
+    def test_matches_brute_force_under_edits(self):
+        rng = random.Random(7)
+        index = TaskSearchIndex()
+        # Small thresholds so the prefix cache and the scan are both exercised
+        index.WIDE_PREFIX = 2
+        index.PREFIX_CACHE_SIZE = 4
+        tasks = {}
+        next_id = 1
+        for _ in range(5000):
+            op = rng.random()
+            if op < 0.4 or not tasks:
+                task = Task(' '.join(rng.choice(self.WORDS) for _ in range(rng.randint(1, 3))),
+                            rng.random() < 0.4, id=next_id)
+                next_id += 1
+                tasks[task.id] = task
+                index.add(task)
+            elif op < 0.55:
+                task_id = rng.choice(list(tasks))
+                index.remove(task_id)
+                del tasks[task_id]
+            elif op < 0.7:
+                task = tasks[rng.choice(list(tasks))]
+                task.text = ' '.join(rng.choice(self.WORDS) for _ in range(2))
+                index.update(task)
+            elif op < 0.8:
+                task = tasks[rng.choice(list(tasks))]
+                task.completed = not task.completed
+                index.update(task)
+            else:
+                query = ' '.join(rng.choice(['a', 'b', 'c', 'x', 'ab', 'ca', 'z', ''])
+                                 for _ in range(rng.randint(0, 2)))
+                status = rng.choice(['all', 'open', 'completed'])
+                limit = rng.choice([None, 1, 3, 10])
+                self.assertEqual(index.search(query, status, limit),
+                                 self.brute_force(tasks, query, status, limit),
+                                 (query, status, limit))
+
+    def test_limit_returns_oldest_matches(self):
+        index = TaskSearchIndex()
+        index.add_many(Task(f'alpha {i}' if i % 2 else f'beta {i}', id=i) for i in range(1, 2001))
+        self.assertEqual(index.search('a', limit=3), [1, 3, 5])
+        self.assertEqual(index.search('b', 'open', limit=2), [2, 4])
+        self.assertEqual(index.search('', 'completed', limit=5), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Headless check that commands forwarded during startup reach the task list.
+
+Tk cannot run without a display here, so FocusTool is built without
+__init__ and given a stand-in listbox; the core, the view and the event
+wiring are the real ones.
+"""
+
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from lxfocus.app import FocusTool
+from lxfocus.core import FocusCore
+from lxfocus.storage import JournalTaskStore, SQLiteTaskStore
+from lxfocus.tasks import Task
+from lxfocus.widgets import VirtualTaskList
+
+
+class FakeListbox:
+    """Just enough of tk.Listbox for VirtualTaskList"""
+
+    def __init__(self):
+        self.items = []
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def insert(self, position, text):
+        self.items.insert(len(self.items) if position == 'end' else position, text)
+
+    def delete(self, first, last=None):
+        if first == 0 and last == 'end':
+            self.items.clear()
+        elif first == 'end':
+            self.items.pop()
+        else:
+            del self.items[first:(first if last is None else last) + 1]
+
+    def size(self):
+        return len(self.items)
+
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+    def curselection(self):
+        return ()
+
+    def selection_set(self, *args):
+        pass
+
+    def selection_clear(self, *args):
+        pass
+
+    def activate(self, *args):
+        pass
+
+
+class StartupCommandTest(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_dir = os.getcwd()
+        self.workdir = tempfile.TemporaryDirectory()
+        os.chdir(self.workdir.name)
+
+    def tearDown(self):
+        os.chdir(self.previous_dir)
+        self.workdir.cleanup()
+
+    def build_app(self, store):
+        """A lazily built window: the task box is wired but tasks are not loaded"""
+        app = FocusTool.__new__(FocusTool)
+        app.core = FocusCore(store=store, config={'archive_after_days': 0})
+        app.root = SimpleNamespace(deiconify=lambda: None, lift=lambda: None,
+                                   focus_force=lambda: None)
+        app.search_entry = SimpleNamespace(get=lambda: '')
+        app.search_filter = SimpleNamespace(get=lambda: 'all')
+        app.search_active = False
+        app.search_job = None
+        app.task_view = VirtualTaskList(FakeListbox(), app.core.tasks)
+        app.subscribe_task_view()
+        return app
+
+    def check_forwarded_add(self, store):
+        store.add(Task('Stored one'))
+        store.add(Task('Stored two'))
+        app = self.build_app(store)
+        app.run_commands([{'action': 'add', 'text': 'Forwarded'}])
+        self.assertEqual(app.core.tasks, [])  # Held until the tasks are loaded
+        with self.assertNoLogs('lxfocus.core', level='ERROR'):
+            app.core.load_tasks()
+        self.assertIs(app.task_view.rows, app.core.tasks)
+        self.assertEqual([task.text for task in app.core.tasks],
+                         ['Stored one', 'Stored two', 'Forwarded'])
+        self.assertEqual(app.task_view.listbox.items,
+                         ['□ Stored one', '□ Stored two', '□ Forwarded'])
+        self.assertEqual(len({task.id for task in app.core.tasks}), 3)
+        app.core.persistence.flush(wait=True)
+        self.assertEqual([task.text for task in store.load()],
+                         ['Stored one', 'Stored two', 'Forwarded'])
+        store.close()
+
+    def test_forwarded_add_with_sqlite_store(self):
+        self.check_forwarded_add(SQLiteTaskStore('tasks.db'))
+
+    def test_forwarded_add_with_journal_store(self):
+        self.check_forwarded_add(JournalTaskStore())
+
+    def test_add_after_clear_uses_new_rows(self):
+        app = self.build_app(SQLiteTaskStore('tasks.db'))
+        app.core.load_tasks()
+        app.core.add_task('Before clear')
+        app.core.clear_tasks()
+        with self.assertNoLogs('lxfocus.core', level='ERROR'):
+            app.core.add_task('After clear')
+        self.assertIs(app.task_view.rows, app.core.tasks)
+        self.assertEqual(app.task_view.listbox.items, ['□ After clear'])
+        app.core.store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Task stores never hand out the id of a deleted task again"""
+
+import os
+import tempfile
+import unittest
+
+from lxfocus.storage import JournalTaskStore, SQLiteTaskStore, migrate_json_to_sqlite
+from lxfocus.tasks import Task
+
+
+class TaskIdTest(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_dir = os.getcwd()
+        self.workdir = tempfile.TemporaryDirectory()
+        os.chdir(self.workdir.name)
+
+    def tearDown(self):
+        os.chdir(self.previous_dir)
+        self.workdir.cleanup()
+
+    def add_and_delete_newest(self, store):
+        for i in range(3):
+            store.add(Task(f'Task {i}'))
+        store.delete(3)
+
+    def test_journal_store_keeps_deleted_ids_retired(self):
+        store = JournalTaskStore()
+        store.load()
+        self.add_and_delete_newest(store)
+        self.assertEqual(store.allocate_id(), 4)
+        store.add(Task('Task 4', id=4))
+        store.delete(4)
+        # Once through the journal, then through the compacted snapshot
+        self.assertEqual(JournalTaskStore().allocate_id(), 5)
+        store.close()
+        self.assertEqual(JournalTaskStore().allocate_id(), 5)
+        store = JournalTaskStore()
+        store.load()
+        self.assertEqual(store.next_id, 5)
+        store.close()
+
+    def test_sqlite_store_keeps_deleted_ids_retired(self):
+        store = SQLiteTaskStore('tasks.db')
+        self.add_and_delete_newest(store)
+        self.assertEqual(store.allocate_id(), 4)
+        store.close()
+
+    def test_migration_keeps_deleted_ids_retired(self):
+        journal = JournalTaskStore()
+        journal.load()
+        self.add_and_delete_newest(journal)
+        journal.close()
+        store = SQLiteTaskStore('tasks.db')
+        migrate_json_to_sqlite(store)
+        self.assertEqual([task.id for task in store.load()], [1, 2])
+        self.assertEqual(store.allocate_id(), 4)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()